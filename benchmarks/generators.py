@@ -0,0 +1,184 @@
+"""
+deterministic synthetic pages and ocr responses for the benchmarks. the same count and seed always
+give the same boxes
+
+    page = word_grid(10000)
+    data = google_response(page)
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from boundbox import BoxArray
+
+
+def _words(rng, count, min_length=2, max_length=10):
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    lengths = rng.integers(min_length, max_length + 1, count)
+    characters = letters[rng.integers(0, len(letters), lengths.sum())]
+    ends = np.cumsum(lengths)
+
+    return [''.join(characters[end - length:end]) for end, length in zip(ends, lengths)]
+
+
+def _rectangles(x, y, width, height):
+    return np.stack((x, y, x + width, y, x + width, y + height, x, y + height), axis=1).reshape(-1, 4, 2)
+
+
+def _lay_out(rng, count, column_width, columns=1, char_width=12, line_height=40, gap=12, column_gap=80):
+    """
+    words of random length written line by line, a column is filled until it has count / columns words
+    """
+
+    texts = _words(rng, count)
+    width = np.array([len(text) for text in texts]) * char_width
+
+    per_column = -(-count // columns)
+    column = np.arange(count) // per_column
+
+    x = np.zeros(count, dtype="int64")
+    line = np.zeros(count, dtype="int64")
+
+    # a new line starts when the next word does not fit, the loop runs over lines not words and only
+    # looks at as many words as can fit on a line
+    window = column_width // (2 * char_width + gap) + 2
+    start = 0
+    current_line = 0
+    while start < count:
+        end = min((column[start] + 1) * per_column, count, start + window)
+        offsets = np.cumsum(width[start:end] + gap) - (width[start:end] + gap)
+        fit = max(int(np.searchsorted(offsets + width[start:end], column_width, side='right')), 1)
+
+        x[start:start + fit] = offsets[:fit]
+        line[start:start + fit] = current_line
+        current_line += 1
+        start += fit
+
+        if start < count and column[start] != column[start - 1]:
+            current_line = 0
+
+    x += column * (column_width + column_gap) + 50
+    y = line * line_height + 50
+
+    return BoxArray(_rectangles(x, y, width, np.full(count, line_height * 3 // 4)), texts, sort=False)
+
+
+def word_grid(count, seed=0):
+    """
+    single column page of words
+    """
+
+    return _lay_out(np.random.default_rng(seed), count, column_width=2300)
+
+
+def multi_column(count, columns=3, seed=0):
+    """
+    page with several columns of words
+    """
+
+    return _lay_out(np.random.default_rng(seed), count, column_width=700, columns=columns)
+
+
+def dense_receipt(count, seed=0):
+    """
+    narrow page with small, tightly packed words
+    """
+
+    return _lay_out(np.random.default_rng(seed), count, column_width=500, char_width=7, line_height=16, gap=5)
+
+
+def rotated_text(count, degrees=8.0, seed=0):
+    """
+    single column page rotated around its center
+    """
+
+    page = word_grid(count, seed)
+    coordinates = page.np_array.astype("float64")
+
+    angle = np.radians(degrees)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    center = coordinates.reshape(-1, 2).mean(axis=0)
+    coordinates = (coordinates - center).dot(rotation.T) + center
+
+    # rotation can move corners below zero, the page is moved back into positive coordinates
+    coordinates -= np.minimum(coordinates.reshape(-1, 2).min(axis=0), 0)
+
+    return BoxArray(np.around(coordinates), page.texts)
+
+
+def google_response(page):
+    """
+    google vision response with one text annotation per box, the first annotation is the full text
+    """
+
+    def poly(corners):
+        return {'vertices': [{'x': int(x), 'y': int(y)} for x, y in corners]}
+
+    coordinates = page.np_array
+    annotations = [{'description': ' '.join(page.texts),
+                    'boundingPoly': poly(np.concatenate((coordinates.min(axis=(0, 1))[None],
+                                                         coordinates.max(axis=(0, 1))[None])))}]
+    annotations += [{'description': text, 'boundingPoly': poly(corners)}
+                    for text, corners in zip(page.texts, coordinates)]
+
+    return {'responses': [{'textAnnotations': annotations}]}
+
+
+def azure_response(page, words_per_line=8):
+    """
+    azure read response, every words_per_line consecutive boxes form a line
+    """
+
+    coordinates = page.np_array.reshape(-1, 8)
+    texts = list(page.texts)
+
+    lines = []
+    for start in range(0, len(texts), words_per_line):
+        words = [{'boundingBox': coordinates[i].tolist(), 'text': texts[i]}
+                 for i in range(start, min(start + words_per_line, len(texts)))]
+        first, last = coordinates[start], coordinates[min(start + words_per_line, len(texts)) - 1]
+        lines.append({'boundingBox': first[:2].tolist() + last[2:6].tolist() + first[6:].tolist(),
+                      'text': ' '.join(word['text'] for word in words), 'words': words})
+
+    return {'recognitionResults': [{'page': 1, 'lines': lines}]}
+
+
+def tesseract_data(page, seed=0):
+    """
+    pytesseract image_to_data dict of word level boxes
+    """
+
+    bounds = page.bounds
+    count = len(page)
+
+    return {
+        'level': [5] * count,
+        'left': bounds[:, 0].tolist(),
+        'top': bounds[:, 1].tolist(),
+        'width': (bounds[:, 2] - bounds[:, 0]).tolist(),
+        'height': (bounds[:, 3] - bounds[:, 1]).tolist(),
+        'conf': np.random.default_rng(seed).integers(50, 100, count).tolist(),
+        'text': list(page.texts),
+    }
+
+
+def synthetic_image(page, channels=3):
+    """
+    white image large enough for all the boxes of the page
+    """
+
+    height, width = page.np_array.reshape(-1, 2).max(axis=0)[::-1] + 50
+
+    return np.full((height, width, channels), 255, dtype="uint8")
+
+
+PAGES = {
+    'word_grid': word_grid,
+    'rotated_text': rotated_text,
+    'multi_column': multi_column,
+    'dense_receipt': dense_receipt,
+}
@@ -0,0 +1,94 @@
+"""
+compares the json encoding of boundbox with a naive json.dumps of box dicts
+
+    python benchmarks/json_benchmark.py --pages 200 --boxes 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from boundbox import BoundBox, BoxArray
+from boundbox.Json_utils import page_to_json, page_from_json
+
+
+def synthetic_page(n_boxes, rng):
+    x = rng.integers(0, 2000, n_boxes)
+    y = rng.integers(0, 3000, n_boxes)
+    w = rng.integers(10, 200, n_boxes)
+    h = rng.integers(10, 40, n_boxes)
+
+    coordinates = np.stack([x, y, x + w, y, x + w, y + h, x, y + h], axis=1)
+    texts = ['word{}'.format(i) for i in range(n_boxes)]
+
+    return BoxArray(coordinates, texts, sort=False)
+
+
+def naive_page_to_json(box_list):
+    records = []
+    for box in box_list:
+        record = box.to_dict()
+        for key in ('p1', 'p2', 'p3', 'p4'):
+            record[key] = {'x': record[key].x, 'y': record[key].y}
+        records.append(record)
+
+    return json.dumps(records)
+
+
+def naive_page_from_json(value):
+    return [BoundBox.create_box(r['p1']['x'], r['p1']['y'], r['p2']['x'], r['p2']['y'],
+                                r['p3']['x'], r['p3']['y'], r['p4']['x'], r['p4']['y'], r['text'])
+            for r in json.loads(value)]
+
+
+def timed(function, items):
+    start = time.perf_counter()
+    results = [function(item) for item in items]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pages', type=int, default=100)
+    parser.add_argument('--boxes', type=int, default=500)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    box_arrays = [synthetic_page(args.boxes, rng) for _ in range(args.pages)]
+    box_lists = [page.to_boxes() for page in box_arrays]
+    total = args.pages * args.boxes
+
+    rows = []
+
+    naive_time, naive_lines = timed(naive_page_to_json, box_lists)
+    rows.append(('encode naive json.dumps of dicts', naive_time))
+
+    list_time, _ = timed(page_to_json, box_lists)
+    rows.append(('encode page_to_json(list of BoundBox)', list_time))
+
+    array_time, lines = timed(page_to_json, box_arrays)
+    rows.append(('encode page_to_json(BoxArray)', array_time))
+
+    naive_decode_time, _ = timed(naive_page_from_json, naive_lines)
+    rows.append(('decode naive json.loads to BoundBox', naive_decode_time))
+
+    decode_time, _ = timed(page_from_json, lines)
+    rows.append(('decode page_from_json', decode_time))
+
+    print('{} pages x {} boxes'.format(args.pages, args.boxes))
+    for name, seconds in rows:
+        print('{:<45} {:>8.3f} s {:>12.0f} boxes/s'.format(name, seconds, total / seconds))
+
+    naive_bytes = sum(len(line) for line in naive_lines)
+    compact_bytes = sum(len(line) for line in lines)
+    print('output size naive {} bytes, page_to_json {} bytes'.format(naive_bytes, compact_bytes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+"""
+benchmark suite of the main operations on synthetic pages
+
+    python benchmarks/suite.py --sizes 1000,10000,100000 --output results.json
+    python benchmarks/suite.py --filter merge --sizes 1000
+    python benchmarks/suite.py --compare baseline.json results.json --threshold 1.2
+
+every case is timed on pages of each size, the best of --repeat runs is kept. results are written
+as json with one record per case and size, --compare prints the ratio of the second run to the first
+and exits with 1 if any case got slower than the threshold
+"""
+
+import argparse
+import json
+import os
+import pickle
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+import generators
+from boundbox import BoundBox, BoxArray, BoxStore, BoxTracker, CropCache
+from boundbox.Json_utils import page_to_json, page_from_json
+from boundbox.Layout_utils import layout
+from boundbox.Raster_utils import label_mask, binary_mask, density_map
+
+Case = namedtuple('Case', ['name', 'setup', 'run', 'max_size'])
+
+
+def _boxes(page):
+    return page.to_boxes()
+
+
+def _crop_setup(size):
+    page = generators.word_grid(min(size, 1000))
+    image = generators.synthetic_image(page)
+    boxes = page.to_boxes()
+    return image, [boxes[i % len(boxes)] for i in range(size)]
+
+
+def _cached_passes(state, passes=3):
+    image, boxes = state
+    cache = CropCache()
+    for _ in range(passes):
+        cache.warp_boxes(boxes, image)
+    return cache.stats
+
+
+def _tracker_setup(size):
+    page = generators.word_grid(size)
+    return page, BoxArray(page.np_array + 2, page.texts, sort=False)
+
+
+def _tracker_run(frames):
+    tracker = BoxTracker()
+    tracker.update(frames[0])
+    return tracker.update(frames[1])
+
+
+def _raster_setup(page):
+    # only the shape of the image is needed, the page is not drawn on a real image
+    height, width = page.np_array.reshape(-1, 2).max(axis=0)[::-1] + 50
+    return page, (height, width)
+
+
+def _fill_poly_loop(state):
+    page, shape = state
+    mask = np.full(shape, -1, dtype="int32")
+    for i, corners in enumerate(page.np_array):
+        cv2.fillPoly(mask, [corners], i)
+    return mask
+
+
+def _store_run(page):
+    directory = tempfile.mkdtemp()
+    try:
+        store = BoxStore(os.path.join(directory, 'store'))
+        store.append(page)
+        return list(store.page(0).texts)
+    finally:
+        shutil.rmtree(directory)
+
+
+CASES = [
+    # constructors
+    Case('construct.create_box', lambda size: generators.word_grid(size).np_array.reshape(-1, 8).tolist(),
+         lambda rows: [BoundBox.create_box(*row) for row in rows], 100000),
+    Case('construct.box_array', lambda size: generators.rotated_text(size).np_array[:, ::-1].copy(),
+         lambda coordinates: BoxArray(coordinates), None),
+    Case('construct.from_boxes', lambda size: _boxes(generators.word_grid(size)),
+         BoxArray.from_boxes, 100000),
+    Case('construct.boxes_from_array', lambda size: generators.rotated_text(size).np_array,
+         BoundBox.boxes_from_array, 100000),
+    Case('construct.to_boxes', lambda size: generators.rotated_text(size), _boxes, 100000),
+    Case('construct.validate_quads', lambda size: generators.rotated_text(size).np_array,
+         BoxArray.validate_quads, None),
+
+    # corner sorting
+    Case('sort_corners.box_array', lambda size: generators.rotated_text(size).np_array[:, ::-1].copy(),
+         BoxArray.sort_corners, None),
+    Case('sort_corners.bound_box', lambda size: [(box.p3, box.p1, box.p4, box.p2)
+                                                 for box in _boxes(generators.rotated_text(size))],
+         lambda corners: [BoundBox.sort_corners(*points) for points in corners], 100000),
+
+    # geometry
+    Case('geometry.box_array', lambda size: generators.rotated_text(size),
+         lambda page: (page.area, page.centroids, page.bounds, page.is_axis_aligned), None),
+    Case('geometry.bound_box', lambda size: _boxes(generators.rotated_text(size)),
+         lambda boxes: [(box.centroid, box.angle, box.length, box.breadth) for box in boxes], 100000),
+
+    # merging and layout
+    Case('merge.merge_box', lambda size: _boxes(generators.multi_column(size)),
+         lambda boxes: BoundBox.merge_box(list(boxes)), 2000),
+    Case('merge.layout', lambda size: generators.multi_column(size), layout, None),
+    Case('merge.layout_receipt', lambda size: generators.dense_receipt(size), layout, None),
+
+    Case('merge.track_frame', _tracker_setup, _tracker_run, None),
+
+    # cropping
+    Case('crop.crop_image', _crop_setup, lambda state: [box.crop_image(state[0]) for box in state[1]], 100000),
+    Case('crop.perspective_wrap', _crop_setup,
+         lambda state: [box.perspective_wrap(state[0]) for box in state[1]], 10000),
+    Case('crop.cached_wrap_3_passes', _crop_setup, _cached_passes, 10000),
+
+    # rasterization
+    Case('raster.label_mask', lambda size: _raster_setup(generators.rotated_text(size)),
+         lambda state: label_mask(*state), 20000),
+    Case('raster.binary_mask_quarter', lambda size: _raster_setup(generators.word_grid(size)),
+         lambda state: binary_mask(*state, scale=0.25), None),
+    Case('raster.density_map', lambda size: _raster_setup(generators.word_grid(size)),
+         lambda state: density_map(*state, scale=1 / 32), None),
+    Case('raster.fill_poly_loop', lambda size: _raster_setup(generators.rotated_text(size)), _fill_poly_loop, 20000),
+
+    # parsers
+    Case('parse.google', lambda size: json.dumps(generators.google_response(generators.word_grid(size))),
+         lambda raw: BoundBox.google_ocr_boxes(json.loads(raw)), 1000000),
+    Case('parse.azure', lambda size: json.dumps(generators.azure_response(generators.word_grid(size))),
+         lambda raw: BoundBox.azure_ocr_boxes(json.loads(raw)), 1000000),
+    Case('parse.tesseract', lambda size: generators.tesseract_data(generators.word_grid(size)),
+         BoundBox.pytesseract_boxes, 1000000),
+
+    # serialization
+    Case('serialize.page_to_json', lambda size: generators.word_grid(size), page_to_json, None),
+    Case('serialize.page_from_json', lambda size: page_to_json(generators.word_grid(size)), page_from_json, None),
+    Case('serialize.pickle', lambda size: generators.word_grid(size),
+         lambda page: pickle.loads(pickle.dumps(page, protocol=5)), None),
+    Case('serialize.box_store', lambda size: generators.word_grid(size), _store_run, None),
+]
+
+
+def time_case(case, size, repeat):
+    state = case.setup(size)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.run(state)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ''
+
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+            'commit': commit, 'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+def run(sizes, repeat, name_filter=None, stream=sys.stdout):
+    """
+    :return: list of result records {'name', 'size', 'seconds', 'boxes_per_second'}
+    """
+
+    results = []
+    for case in CASES:
+        if name_filter and name_filter not in case.name:
+            continue
+
+        for size in sizes:
+            if case.max_size is not None and size > case.max_size:
+                continue
+
+            seconds = time_case(case, size, repeat)
+            results.append({'name': case.name, 'size': size, 'seconds': seconds,
+                            'boxes_per_second': size / seconds if seconds else None})
+
+            stream.write('{:<28} {:>8} {:>10.4f} s {:>12.0f} boxes/s\n'.format(case.name, size, seconds,
+                                                                           size / max(seconds, 1e-12)))
+            stream.flush()
+
+    return results
+
+
+def compare(baseline, current, threshold, stream=sys.stdout):
+    """
+    :param baseline: results dict of the first run
+    :param current: results dict of the second run
+    :param threshold: ratio of the times above which a case is reported as a regression
+    :return: list of (name, size, ratio) of the regressions
+    """
+
+    before = {(record['name'], record['size']): record['seconds'] for record in baseline['results']}
+
+    regressions = []
+    for record in current['results']:
+        key = (record['name'], record['size'])
+        if key not in before:
+            continue
+
+        ratio = record['seconds'] / max(before[key], 1e-12)
+        flag = 'slower' if ratio > threshold else ('faster' if ratio < 1 / threshold else '')
+        if ratio > threshold:
+            regressions.append(key + (ratio, ))
+
+        stream.write('{:<28} {:>8} {:>10.4f} s {:>10.4f} s {:>7.2f}x {}\n'.format(
+            key[0], key[1], before[key], record['seconds'], ratio, flag))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='boundbox benchmark suite')
+    parser.add_argument('--sizes', default='1000,10000', help='comma separated numbers of boxes')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per case, the fastest is kept')
+    parser.add_argument('--filter', default=None, help='only run cases whose name contains this text')
+    parser.add_argument('--output', default=None, help='json file for the results')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help='compare two result files')
+    parser.add_argument('--threshold', type=float, default=1.1, help='slowdown ratio reported as regression')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        results = []
+        for path in args.compare:
+            with open(path, 'r') as f:
+                results.append(json.load(f))
+
+        regressions = compare(results[0], results[1], args.threshold)
+        print('{} regressions'.format(len(regressions)))
+        return 1 if regressions else 0
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    results = {'environment': environment(), 'repeat': args.repeat, 'results': run(sizes, args.repeat, args.filter)}
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from .BoxArray_class import BoxArray
+from .ParseCache_class import ParseCache
+from .Document_utils import STEPS, process_page
+
+
+def _parse(raw, parser, steps, options):
+    pages = ParseCache.parsers[parser](raw, **options)
+    return [BoxArray.from_boxes(process_page(boxes, steps)) for boxes in pages]
+
+
+def _parse_file(path, parser, steps, options):
+    # the file is read by the worker, so only the path and the parsed boxes cross the executor
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    return _parse(raw, parser, steps, options)
+
+
+class AsyncParser:
+    """
+    asyncio interface for parsing and post processing ocr responses. the cpu bound work runs on a
+    bounded executor and at most max_pending jobs are submitted at a time, callers above the limit wait
+    without holding the event loop
+
+        async with AsyncParser(max_workers=4, max_pending=32) as parser:
+            pages = await parser.parse(raw, 'google', steps=('merge', ))
+
+            async for path, pages in parser.parse_files(paths, 'azure'):
+                ...
+
+    cancelling a call which is still waiting for a slot never submits its job. a call cancelled after
+    its job was submitted cancels the job if the executor still can, otherwise the job runs to the end,
+    keeps its slot until then and its result is dropped. a process pool moves jobs to its call queue
+    ahead of the workers, those jobs can not be cancelled any more
+    """
+
+    def __init__(self, executor='process', max_workers=None, max_pending=None):
+        """
+        :param executor: 'process', 'thread' or a concurrent.futures.Executor, an executor passed in is
+            not shut down by close
+        :param max_workers: number of workers of a new executor
+        :param max_pending: maximum number of jobs submitted to the executor at a time, twice the
+            number of workers if None
+        """
+
+        if executor == 'process':
+            self._executor = ProcessPoolExecutor(max_workers)
+        elif executor == 'thread':
+            self._executor = ThreadPoolExecutor(max_workers)
+        elif hasattr(executor, 'submit'):
+            self._executor = executor
+        else:
+            raise ValueError("executor should be 'process', 'thread' or an Executor not {}".format(executor))
+
+        self._owns_executor = isinstance(executor, str)
+
+        if max_pending is None:
+            max_pending = 2 * (max_workers or os.cpu_count() or 1)
+        self._max_pending = max_pending
+        self._slots = None
+
+        self._pending = 0
+
+    @property
+    def pending(self):
+        """
+        number of jobs submitted to the executor and not finished yet
+        """
+
+        return self._pending
+
+    async def _run(self, function, *arguments):
+        # the semaphore is created lazily so that it belongs to the running event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_pending)
+
+        loop = asyncio.get_running_loop()
+        await self._slots.acquire()
+
+        try:
+            job = self._executor.submit(function, *arguments)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._pending += 1
+        # the slot is freed when the job itself is done, not when the caller stops waiting for it, so a
+        # cancelled call whose job keeps running on a worker still counts against max_pending
+        job.add_done_callback(lambda _: self._release(loop))
+
+        return await asyncio.wrap_future(job)
+
+    def _release(self, loop):
+        # called from the thread that finished the job
+        try:
+            loop.call_soon_threadsafe(self._release_slot)
+        except RuntimeError:
+            # the event loop is already closed, nothing waits for the slot any more
+            self._pending -= 1
+
+    def _release_slot(self):
+        self._pending -= 1
+        self._slots.release()
+
+    @staticmethod
+    def _check(parser, steps):
+        if parser not in ParseCache.parsers:
+            raise ValueError('unknown parser {}, use one of {}'.format(parser, sorted(ParseCache.parsers)))
+        for step in steps:
+            if step not in STEPS:
+                raise ValueError('step should be one of {} not {}'.format(STEPS, step))
+
+    async def parse(self, raw, parser, steps=(), **options):
+        """
+        parses a raw ocr response on the executor
+        :param raw: raw response as bytes or str, see ParseCache.parse
+        :param parser: one of 'google', 'azure', 'tesseract', 'tesseract-tsv'
+        :param steps: post processing steps, see Document_utils.process_page
+        :param options: keyword arguments of the parser
+        :return: list of BoxArray, one for each page
+        """
+
+        self._check(parser, steps)
+        return await self._run(_parse, raw, parser, tuple(steps), options)
+
+    async def parse_file(self, path, parser, steps=(), **options):
+        """
+        same as parse for a response stored in a file, the file is read on the executor
+        """
+
+        self._check(parser, steps)
+        return await self._run(_parse_file, path, parser, tuple(steps), options)
+
+    async def parse_files(self, paths, parser, steps=(), **options):
+        """
+        parses many files concurrently. paths are taken from the iterable only when a slot is free, so
+        a slow consumer slows down the producer instead of filling the memory with results
+
+        :param paths: iterable of file paths
+        :param parser: see parse
+        :param steps: see parse
+        :param options: see parse
+        :return: async generator of (path, list of BoxArray or the exception raised), in the order the
+            files finish
+        """
+
+        self._check(parser, steps)
+
+        async def run(path):
+            try:
+                return path, await self.parse_file(path, parser, steps, **options)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                return path, err
+
+        paths = iter(paths)
+        tasks = set()
+
+        try:
+            while True:
+                for path in paths:
+                    tasks.add(asyncio.ensure_future(run(path)))
+                    if len(tasks) >= self._max_pending:
+                        break
+
+                if not tasks:
+                    return
+
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+
+        finally:
+            # consumer stopped early or was cancelled
+            for task in tasks:
+                task.cancel()
+
+    def close(self):
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
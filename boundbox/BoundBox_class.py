@@ -205,6 +205,45 @@ class BoundBox:
 
         return cls(p1, p2, p3, p4, text_value)
 
+    @classmethod
+    def trusted_box(cls, p1, p2, p3, p4, text_value=''):
+        """
+        creates a box from corners which are already in p1, p2, p3, p4 order, without sorting them.
+        only for data from a trusted source, e.g. a BoxArray or a BoxStore, untrusted coordinates can be
+        checked in bulk with BoxArray.validate_quads first
+        :param p1: top left point
+        :param p2: top right point
+        :param p3: bottom right point
+        :param p4: bottom left point
+        :param text_value: text value inside the box
+        :return: box object
+        """
+
+        box = cls.__new__(cls)
+        box._p1, box._p2, box._p3, box._p4 = p1, p2, p3, p4
+        box._text_value = text_value
+
+        return box
+
+    @classmethod
+    def boxes_from_array(cls, coordinates, texts=None, trusted=False):
+        """
+        creates a list of boxes from an array of corners in one pass
+        :param coordinates: array like of shape (N, 4, 2) or (N, 8)
+        :param texts: list of text values, empty texts if None
+        :param trusted: keep False to sort the corners of every box, True only if the corners are
+            already in p1, p2, p3, p4 order
+        :return: list of box objects
+        """
+
+        rows = np.asarray(coordinates, dtype="int32").reshape(-1, 8).tolist()
+        if texts is None:
+            texts = [''] * len(rows)
+
+        create = cls.trusted_box if trusted else cls
+        return [create(Point(x1, y1), Point(x2, y2), Point(x3, y3), Point(x4, y4), text)
+                for (x1, y1, x2, y2, x3, y3, x4, y4), text in zip(rows, texts)]
+
     @classmethod
     def void_box(cls):
         return cls.create_box(None, None, None, None, None, None, None, None, '')
@@ -441,7 +480,32 @@ class BoundBox:
 
         self.sort_points()
 
-    def perspective_wrap(self, img):
+    def contains_point(self, point):
+        """
+        checks whether the point lies inside the box, points on the edges are inside
+        :param point: Point object
+        :return: True or False
+        """
+
+        corners = [self._p1, self._p2, self._p3, self._p4]
+        signs = []
+
+        for corner, next_corner in zip(corners, corners[1:] + corners[:1]):
+            cross = (next_corner.x - corner.x) * (point.y - corner.y) - \
+                    (next_corner.y - corner.y) * (point.x - corner.x)
+            signs.append(cross)
+
+        return all(sign >= 0 for sign in signs) or all(sign <= 0 for sign in signs)
+
+    def perspective_wrap(self, img, cache=None):
+        """
+        :param img: image the box is taken from
+        :param cache: optional CropCache, the warp is computed once for the same image and corners
+        :return: the region inside the box warped to a rectangle
+        """
+
+        if cache is not None:
+            return cache.warp(self, img)
 
         width_1 = self._p3 - self._p4
         width_2 = self._p2 - self._p1
@@ -499,7 +563,15 @@ class BoundBox:
         self._p3.y = round(self._p3.y * ratio_h)
         self._p4.y = round(self._p4.y * ratio_h)
 
-    def crop_image(self, img):
+    def crop_image(self, img, cache=None):
+        """
+        :param img: image the box is taken from
+        :param cache: optional CropCache, the crop is copied once for the same image and corners
+        :return: the axis aligned region of the image inside the box
+        """
+
+        if cache is not None:
+            return cache.crop(self, img)
 
         ymin_value = min_value(self._p1.y, self._p2.y)
         ymax_value = max_value(self._p3.y, self._p4.y)
@@ -1,3 +1,4 @@
+import numpy as np
 
 
 def min_value(x, y):
@@ -8,3 +9,60 @@ def max_value(x, y):
     return max(i for i in [x, y] if i is not None)
 
 
+def tesseract_tsv_to_dict(tsv):
+    """
+    converts the tsv output of pytesseract image_to_data into the same dict returned by
+    image_to_data(img, output_type=Output.DICT)
+    :param tsv: tsv text
+    :return: dict of column name to list of values
+    """
+
+    lines = tsv.splitlines()
+    header = lines[0].split('\t')
+    data = {column: [] for column in header}
+
+    for line in lines[1:]:
+        if not line:
+            continue
+        values = line.split('\t')
+        values += [''] * (len(header) - len(values))
+
+        for column, value in zip(header, values):
+            if column == 'text':
+                data[column].append(value)
+            elif column == 'conf':
+                data[column].append(float(value))
+            else:
+                data[column].append(int(value))
+
+    return data
+
+
+def connected_components(count, first, second):
+    """
+    labels the connected components of a graph given as an edge list
+    :param count: number of nodes
+    :param first: array of the first node of every edge
+    :param second: array of the second node of every edge
+    :return: array of component labels, components are numbered in the order of their smallest node
+    """
+
+    labels = np.arange(count)
+    first = np.asarray(first, dtype="int64")
+    second = np.asarray(second, dtype="int64")
+
+    while True:
+        # every node takes the smallest label of its neighbours, then labels follow their own labels
+        # (pointer jumping) so long chains converge in a few iterations
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, first, labels[second])
+        np.minimum.at(new_labels, second, labels[first])
+        new_labels = new_labels[new_labels]
+
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    _, labels = np.unique(labels, return_inverse=True)
+
+    return labels
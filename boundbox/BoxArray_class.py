@@ -0,0 +1,646 @@
+import pickle
+
+import cv2
+import numpy as np
+
+from .Point_class import Point
+from .BoundBox_class import BoundBox
+
+
+class BoxArray:
+    """
+    array backed collection of boxes. the corners of all the boxes are kept in a single
+    (N, 4, 2) int32 array in the same p1, p2, p3, p4 order used by BoundBox
+
+                    p1 -------------- p2
+                    -                  -
+                    p4 -------------- p3
+
+    coordinates[i] is [[p1.x, p1.y], [p2.x, p2.y], [p3.x, p3.y], [p4.x, p4.y]] of the i th box
+    """
+
+    def __init__(self, coordinates, texts=None, columns=None, sort=True):
+        """
+        :param coordinates: array like of shape (N, 4, 2) or (N, 8)
+        :param texts: list of text values or EncodedTexts object, one for each box
+        :param columns: dict of extra per box values, name to array of length N
+        :param sort: keep True to sort the corners of every box, set False only if the corners are
+            already in p1, p2, p3, p4 order
+        """
+
+        coordinates = np.asarray(coordinates, dtype="int32").reshape(-1, 4, 2)
+
+        if texts is None:
+            texts = [''] * len(coordinates)
+        elif len(texts) != len(coordinates):
+            raise ValueError('number of texts ({}) does not match number of boxes '
+                             '({})'.format(len(texts), len(coordinates)))
+
+        columns = {name: np.asarray(values) for name, values in (columns or {}).items()}
+        for name, values in columns.items():
+            if len(values) != len(coordinates):
+                raise ValueError('column {} has {} values for {} boxes'.format(name, len(values),
+                                                                                len(coordinates)))
+
+        self._coordinates = self.sort_corners(coordinates) if sort else coordinates
+        self._texts = texts if isinstance(texts, EncodedTexts) else list(texts)
+        self._columns = columns
+
+    @classmethod
+    def from_boxes(cls, box_list):
+        """
+        creates a box array from a list of BoundBox objects
+        :param box_list: list of BoundBox objects
+        :return: BoxArray object
+        """
+
+        coordinates = np.zeros((len(box_list), 4, 2), dtype="int32")
+        for i, box in enumerate(box_list):
+            coordinates[i] = box.np_array
+
+        texts = [box.text_value or '' for box in box_list]
+
+        return cls(coordinates, texts, sort=False)
+
+    @classmethod
+    def from_bounds(cls, bounds, texts=None, columns=None):
+        """
+        creates a box array of axis aligned boxes, the inverse of BoxArray.bounds
+        :param bounds: array like of shape (N, 4) of xmin, ymin, xmax, ymax
+        :param texts: list of text values, one for each box
+        :param columns: dict of extra per box values, name to array of length N
+        :return: BoxArray object
+        """
+
+        x0, y0, x1, y1 = np.asarray(bounds, dtype="int32").reshape(-1, 4).T
+        coordinates = np.stack((np.stack((x0, y0), axis=1), np.stack((x1, y0), axis=1),
+                                np.stack((x1, y1), axis=1), np.stack((x0, y1), axis=1)), axis=1)
+
+        return cls(coordinates, texts, columns, sort=False)
+
+    @classmethod
+    def from_contours(cls, contours, epsilon=0.02, min_area=0, max_area=None, min_aspect_ratio=1,
+                      max_aspect_ratio=None):
+        """
+        fits every contour to a four sided polygon and creates a box array of the fitted contours.
+        contours are approximated with cv2.approxPolyDP, if the approximation does not give exactly
+        four corners the minimum area rectangle of the contour is taken instead
+
+        :param contours: list of contours, result of cv2.findContours
+        :param epsilon: approximation accuracy as a ratio of the contour perimeter
+        :param min_area: boxes with smaller area are rejected, boxes without area, e.g. of single pixel or
+            straight line contours, are always rejected
+        :param max_area: boxes with larger area are rejected, None for no upper limit
+        :param min_aspect_ratio: boxes with a smaller ratio of long side to short side are rejected
+        :param max_aspect_ratio: boxes with a larger ratio of long side to short side are rejected,
+            None for no upper limit
+        :return: (BoxArray of accepted contours, boolean array which is True for rejected contours)
+        """
+
+        quads = np.zeros((len(contours), 4, 2), dtype="int32")
+
+        for i, contour in enumerate(contours):
+            contour = np.asarray(contour, dtype="int32").reshape(-1, 1, 2)
+
+            if len(contour) == 4:
+                quads[i] = contour.reshape(4, 2)
+                continue
+
+            perimeter = cv2.arcLength(contour, True)
+            approx = cv2.approxPolyDP(contour, epsilon * perimeter, True)
+
+            if len(approx) == 4:
+                quads[i] = approx.reshape(4, 2)
+            else:
+                quads[i] = np.around(cv2.boxPoints(cv2.minAreaRect(contour)))
+
+        quads = cls.sort_corners(quads)
+
+        area = cls.polygon_area(quads)
+
+        # ratio of the long side to the short side, sides are averaged over the opposite edges
+        length = (np.linalg.norm(quads[:, 1] - quads[:, 0], axis=1) +
+                  np.linalg.norm(quads[:, 2] - quads[:, 3], axis=1)) / 2
+        breadth = (np.linalg.norm(quads[:, 3] - quads[:, 0], axis=1) +
+                   np.linalg.norm(quads[:, 2] - quads[:, 1], axis=1)) / 2
+
+        long_side = np.maximum(length, breadth)
+        short_side = np.minimum(length, breadth)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            aspect_ratio = np.where(short_side > 0, long_side / short_side, np.inf)
+
+        rejected = (area <= 0) | (area < min_area)
+        rejected |= aspect_ratio < min_aspect_ratio
+        if max_area is not None:
+            rejected |= area > max_area
+        if max_aspect_ratio is not None:
+            rejected |= aspect_ratio > max_aspect_ratio
+
+        return cls(quads[~rejected], sort=False), rejected
+
+    @staticmethod
+    def sort_corners(coordinates):
+        """
+        vectorized version of BoundBox.sort_corners. sorts the corners of every box as top-left,
+        top-right, bottom-right and bottom-left
+        :param coordinates: (N, 4, 2) array
+        :return: (N, 4, 2) array with sorted corners
+        """
+
+        coordinates = np.asarray(coordinates).reshape(-1, 4, 2)
+
+        if not len(coordinates):
+            return coordinates.copy()
+
+        p_sum = coordinates.sum(axis=2)
+        p_diff = coordinates[:, :, 1] - coordinates[:, :, 0]
+
+        # order by sum, ties broken by "y-x". least sum is top left and max sum is bottom right
+        order = np.lexsort((p_diff, p_sum), axis=-1)
+
+        top_left = order[:, 0]
+        bottom_right = order[:, 3]
+
+        # of the remaining two "y-x" is lowest for top right and largest for bottom left
+        remaining = order[:, 1:3]
+        remaining_diff = np.take_along_axis(p_diff, remaining, axis=1)
+        swap = remaining_diff[:, 1] < remaining_diff[:, 0]
+
+        top_right = np.where(swap, remaining[:, 1], remaining[:, 0])
+        bottom_left = np.where(swap, remaining[:, 0], remaining[:, 1])
+
+        index = np.stack((top_left, top_right, bottom_right, bottom_left), axis=1)
+
+        return np.take_along_axis(coordinates, index[:, :, None], axis=1)
+
+    @staticmethod
+    def polygon_area(coordinates):
+        """
+        area of four sided polygons using the shoelace formula
+        :param coordinates: (N, 4, 2) array
+        :return: (N, ) array of areas
+        """
+
+        x = coordinates[:, :, 0].astype("float64")
+        y = coordinates[:, :, 1].astype("float64")
+
+        return np.abs((x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1)) / 2
+
+    @staticmethod
+    def validate_quads(coordinates, width=None, height=None, min_area=1):
+        """
+        checks many four sided polygons at once, e.g. untrusted coordinates before they are passed to
+        BoxArray(coordinates, sort=False) or BoundBox.trusted_box. the corners are checked in the order
+        they are given, nothing is sorted
+
+            flags = BoxArray.validate_quads(coordinates, width=image.shape[1], height=image.shape[0])
+            page = BoxArray(coordinates[~flags['invalid']], sort=False)
+
+        :param coordinates: array like of shape (N, 4, 2) or (N, 8)
+        :param width: width of the image, x outside [0, width] is out of bounds, not checked if None
+        :param height: height of the image, y outside [0, height] is out of bounds, not checked if None
+        :param min_area: polygons with a smaller area are flagged as zero area
+        :return: dict of (N, ) boolean arrays 'zero_area', 'self_intersecting', 'non_convex',
+            'out_of_bounds' and 'invalid', which is True if any of the others is True
+        """
+
+        quads = np.asarray(coordinates, dtype="float64").reshape(-1, 4, 2)
+
+        edges = np.roll(quads, -1, axis=1) - quads
+        # turn at every corner, z of the cross product of an edge and the next edge
+        following = np.roll(edges, -1, axis=1)
+        turns = edges[:, :, 0] * following[:, :, 1] - edges[:, :, 1] * following[:, :, 0]
+
+        def orientation(a, b, c):
+            return np.sign((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0]))
+
+        def crossing(a, b, c, d):
+            # segments ab and cd cross at a point inside both of them
+            return ((orientation(a, b, c) * orientation(a, b, d) < 0) &
+                    (orientation(c, d, a) * orientation(c, d, b) < 0))
+
+        p1, p2, p3, p4 = quads[:, 0], quads[:, 1], quads[:, 2], quads[:, 3]
+        self_intersecting = crossing(p1, p2, p3, p4) | crossing(p2, p3, p4, p1)
+
+        zero_area = BoxArray.polygon_area(quads) < min_area
+
+        # a simple polygon is convex if it turns the same way at every corner, straight corners are ignored
+        non_convex = (turns > 0).any(axis=1) & (turns < 0).any(axis=1) & ~self_intersecting
+
+        out_of_bounds = np.zeros(len(quads), dtype=bool)
+        if width is not None:
+            out_of_bounds |= ((quads[:, :, 0] < 0) | (quads[:, :, 0] > width)).any(axis=1)
+        if height is not None:
+            out_of_bounds |= ((quads[:, :, 1] < 0) | (quads[:, :, 1] > height)).any(axis=1)
+
+        return {'zero_area': zero_area, 'self_intersecting': self_intersecting, 'non_convex': non_convex,
+                'out_of_bounds': out_of_bounds,
+                'invalid': zero_area | self_intersecting | non_convex | out_of_bounds}
+
+    def reduce_by_label(self, labels, mode='extent', order=None, separator=' '):
+        """
+        merges all the boxes with the same label into one box in a single pass, e.g. the words of a
+        line with the line ids of Layout_utils.group_lines
+
+        :param labels: (N, ) integer array of the label of every box
+        :param mode: 'extent' for the axis aligned box around the group or 'rotated' for the minimum
+            area rotated rectangle around the group
+        :param order: (N, ) array used to order the texts inside a group, x of p1 if None
+        :param separator: string used to join the texts of a group
+        :return: BoxArray with one box for every unique label in increasing order of labels, the label
+            of every box is kept in the column 'label'
+        """
+
+        if mode not in ('extent', 'rotated'):
+            raise ValueError("mode should be either 'extent' or 'rotated' not {}".format(mode))
+
+        labels = np.asarray(labels)
+        if len(labels) != len(self):
+            raise ValueError('number of labels ({}) does not match number of boxes '
+                             '({})'.format(len(labels), len(self)))
+
+        if not len(self):
+            return BoxArray(np.zeros((0, 4, 2)), columns={'label': labels}, sort=False)
+
+        if order is None:
+            order = self._coordinates[:, 0, 0]
+
+        index = np.lexsort((order, labels))
+        sorted_labels = labels[index]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_labels)) + 1))
+        ends = np.append(starts[1:], len(index))
+
+        points = self._coordinates[index]
+
+        if mode == 'extent':
+            minimum = np.minimum.reduceat(points.min(axis=1), starts)
+            maximum = np.maximum.reduceat(points.max(axis=1), starts)
+
+            coordinates = np.stack((minimum, np.stack((maximum[:, 0], minimum[:, 1]), axis=1),
+                                    maximum, np.stack((minimum[:, 0], maximum[:, 1]), axis=1)), axis=1)
+            sort = False
+
+        else:
+            coordinates = np.zeros((len(starts), 4, 2), dtype="int32")
+            for i, (start, end) in enumerate(zip(starts, ends)):
+                group = points[start:end].reshape(-1, 2).astype("float32")
+                coordinates[i] = np.around(cv2.boxPoints(cv2.minAreaRect(group)))
+            sort = True
+
+        texts = [self._texts[i] for i in index]
+        texts = [separator.join(text for text in texts[start:end] if text) for start, end in zip(starts, ends)]
+
+        return BoxArray(coordinates, texts, {'label': sorted_labels[starts]}, sort=sort)
+
+    def contains(self, points, box_ids):
+        """
+        elementwise test whether points[i] lies inside box box_ids[i], correct for rotated boxes.
+        points on the edges are inside
+        :param points: (M, 2) array of x, y
+        :param box_ids: (M, ) array of box indices
+        :return: (M, ) boolean array
+        """
+
+        points = np.asarray(points, dtype="float64").reshape(-1, 2)
+        corners = self._coordinates[np.asarray(box_ids)].astype("float64")
+
+        edges = np.roll(corners, -1, axis=1) - corners
+        relative = points[:, None, :] - corners
+
+        # the point is inside a convex polygon if it is on the same side of all the edges
+        cross = edges[:, :, 0] * relative[:, :, 1] - edges[:, :, 1] * relative[:, :, 0]
+
+        return (cross >= 0).all(axis=1) | (cross <= 0).all(axis=1)
+
+    def distance(self, points, box_ids):
+        """
+        elementwise distance from points[i] to the edges of box box_ids[i], zero if the point is inside
+        :param points: (M, 2) array of x, y
+        :param box_ids: (M, ) array of box indices
+        :return: (M, ) float array
+        """
+
+        points = np.asarray(points, dtype="float64").reshape(-1, 2)
+        corners = self._coordinates[np.asarray(box_ids)].astype("float64")
+
+        edges = np.roll(corners, -1, axis=1) - corners
+        relative = points[:, None, :] - corners
+
+        # projection of the point on every edge, clipped to the segment
+        length = (edges ** 2).sum(axis=2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.clip(np.where(length > 0, (relative * edges).sum(axis=2) / length, 0), 0, 1)
+
+        distance = np.linalg.norm(relative - t[:, :, None] * edges, axis=2).min(axis=1)
+        distance[self.contains(points, box_ids)] = 0
+
+        return distance
+
+    def assign_points(self, points, max_distance=None, grid=None):
+        """
+        finds the box containing each point. a point inside several boxes is assigned to the box with
+        the smallest area. with max_distance, a point outside every box is assigned to the nearest box
+        within that distance
+
+        :param points: (M, 2) array of x, y
+        :param max_distance: largest distance from a point to the nearest box, None to only assign
+            points inside a box
+        :param grid: GridIndex over the bounds of the boxes, built if None
+        :return: (M, ) array of box index for every point, -1 for points without a box
+        """
+
+        from .GridIndex_class import GridIndex
+
+        points = np.asarray(points, dtype="float64").reshape(-1, 2)
+        result = np.full(len(points), -1, dtype="int64")
+
+        if not len(points) or not len(self):
+            return result
+
+        if grid is None:
+            grid = GridIndex(self.bounds)
+
+        area = self.area
+
+        point_ids, box_ids = grid.query_points(points)
+        inside = self.contains(points[point_ids], box_ids)
+        point_ids, box_ids = point_ids[inside], box_ids[inside]
+
+        point_ids, box_ids = self._first_per_point(point_ids, box_ids, area[box_ids])
+        result[point_ids] = box_ids
+
+        if max_distance:
+            missing = np.flatnonzero(result < 0)
+
+            point_ids, box_ids = grid.query_points(points[missing], margin=max_distance)
+            distance = self.distance(points[missing][point_ids], box_ids)
+
+            near = distance <= max_distance
+            point_ids, box_ids, distance = point_ids[near], box_ids[near], distance[near]
+
+            point_ids, box_ids = self._first_per_point(point_ids, box_ids, distance)
+            result[missing[point_ids]] = box_ids
+
+        return result
+
+    @staticmethod
+    def _first_per_point(point_ids, box_ids, key):
+        """
+        picks one box for every point, the one with the smallest key and then the smallest index
+        :return: (point ids, box ids) with every point once
+        """
+
+        order = np.lexsort((box_ids, key, point_ids))
+        point_ids, first = np.unique(point_ids[order], return_index=True)
+
+        return point_ids, box_ids[order[first]]
+
+    def iou(self, other, min_iou=0.0):
+        """
+        intersection over union of every overlapping pair of boxes of this array and the other array.
+        candidate pairs are found with a GridIndex, axis aligned boxes are compared in a vectorized way
+        and rotated boxes with cv2.intersectConvexConvex
+
+        :param other: BoxArray object
+        :param min_iou: pairs with a smaller iou are left out
+        :return: (index in this array, index in other, iou) arrays of the overlapping pairs
+        """
+
+        from .GridIndex_class import GridIndex
+
+        bounds = self.bounds.astype("float64")
+        other_bounds = other.bounds.astype("float64")
+
+        second, first = GridIndex(other_bounds).query_many(bounds)
+        iou = self.pair_iou(other, first, second)
+
+        keep = (iou > min_iou) if min_iou == 0 else (iou >= min_iou)
+
+        return first[keep], second[keep], iou[keep]
+
+    def pair_iou(self, other, first, second):
+        """
+        intersection over union of the given pairs of boxes, axis aligned pairs are compared in a
+        vectorized way and rotated pairs with cv2.intersectConvexConvex
+        :param other: BoxArray object
+        :param first: (K, ) array of indices in this array
+        :param second: (K, ) array of indices in other
+        :return: (K, ) array of iou
+        """
+
+        first = np.asarray(first, dtype="int64")
+        second = np.asarray(second, dtype="int64")
+
+        bounds = self.bounds.astype("float64")[first]
+        other_bounds = other.bounds.astype("float64")[second]
+
+        intersection_bounds = np.concatenate((np.maximum(bounds[:, :2], other_bounds[:, :2]),
+                                              np.minimum(bounds[:, 2:], other_bounds[:, 2:])), axis=1)
+        intersection = np.prod(np.maximum(intersection_bounds[:, 2:] - intersection_bounds[:, :2], 0), axis=1)
+
+        # boxes that are not axis aligned need the real polygon intersection
+        rotated = ~self.is_axis_aligned[first] | ~other.is_axis_aligned[second]
+        for k in np.flatnonzero(rotated):
+            polygon_1 = self._coordinates[first[k]].astype("float32")
+            polygon_2 = other.np_array[second[k]].astype("float32")
+            intersection[k], _ = cv2.intersectConvexConvex(polygon_1, polygon_2)
+
+        union = self.area[first] + other.area[second] - intersection
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(union > 0, intersection / union, 0)
+
+    @property
+    def is_axis_aligned(self):
+        """
+        :return: (N, ) boolean array which is True for boxes whose edges are parallel to the axes
+        """
+
+        x = self._coordinates[:, :, 0]
+        y = self._coordinates[:, :, 1]
+
+        return (x[:, 0] == x[:, 3]) & (x[:, 1] == x[:, 2]) & (y[:, 0] == y[:, 1]) & (y[:, 2] == y[:, 3])
+
+    def to_boxes(self):
+        """
+        converts the box array into a list of BoundBox objects. the corners of a box array are always in
+        p1, p2, p3, p4 order, so they are not sorted again
+        :return: list of BoundBox objects
+        """
+
+        return BoundBox.boxes_from_array(self._coordinates, list(self._texts), trusted=True)
+
+    def __len__(self):
+        return len(self._coordinates)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, item):
+        """
+        an integer index returns a BoundBox object, a slice, boolean mask or index array returns a
+        new BoxArray
+        """
+
+        if isinstance(item, (int, np.integer)):
+            corners = self._coordinates[item].tolist()
+            points = [Point(x, y) for x, y in corners]
+            return BoundBox.trusted_box(*points, self._texts[item])
+
+        index = np.arange(len(self))[item]
+        columns = {name: values[index] for name, values in self._columns.items()}
+
+        return BoxArray(self._coordinates[index], [self._texts[i] for i in index], columns, sort=False)
+
+    def __reduce_ex__(self, protocol):
+        """
+        with pickle protocol 5 the coordinates, text and columns are passed as out of band buffers,
+        so pickle.dumps(box_array, protocol=5, buffer_callback=...) does not copy them. older protocols,
+        e.g. the default of multiprocessing before python 3.14, pickle the same arrays in band
+        """
+
+        encoded = isinstance(self._texts, EncodedTexts)
+        texts = self._texts if encoded else EncodedTexts.encode(self._texts)
+
+        # a slice, e.g. a page of a BoxStore, only sends its own part of the text buffer
+        start, end = texts.offsets[0], texts.offsets[-1]
+        buffers = [np.ascontiguousarray(self._coordinates), np.ascontiguousarray(texts.buffer[start:end]),
+                   np.ascontiguousarray(texts.offsets - start)]
+        buffers += [np.ascontiguousarray(values) for values in self._columns.values()]
+
+        columns = [(name, values.dtype.str) for name, values in self._columns.items()]
+
+        if protocol >= 5:
+            buffers = [pickle.PickleBuffer(array) for array in buffers]
+
+        return _rebuild_box_array, (columns, encoded) + tuple(buffers)
+
+    def __str__(self):
+        return "{}".format(list(self._texts))
+
+    def __repr__(self):
+        return "BoxArray({} boxes)".format(len(self))
+
+    @property
+    def np_array(self):
+        return self._coordinates
+
+    @property
+    def texts(self):
+        return self._texts
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def area(self):
+        return self.polygon_area(self._coordinates)
+
+    @property
+    def centroids(self):
+        """
+        centroid of every box, same point as BoundBox.centroid but without rounding. computed as the
+        area centroid of the polygon, boxes without area take the mean of the corners
+        :return: (N, 2) float array
+        """
+
+        x = self._coordinates[:, :, 0].astype("float64")
+        y = self._coordinates[:, :, 1].astype("float64")
+        x_next = np.roll(x, -1, axis=1)
+        y_next = np.roll(y, -1, axis=1)
+
+        cross = x * y_next - x_next * y
+        signed_area = cross.sum(axis=1) / 2
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            centroid_x = ((x + x_next) * cross).sum(axis=1) / (6 * signed_area)
+            centroid_y = ((y + y_next) * cross).sum(axis=1) / (6 * signed_area)
+
+        degenerate = signed_area == 0
+        centroid_x[degenerate] = x[degenerate].mean(axis=1)
+        centroid_y[degenerate] = y[degenerate].mean(axis=1)
+
+        return np.stack((centroid_x, centroid_y), axis=1)
+
+    @property
+    def bounds(self):
+        """
+        axis aligned bounds of every box
+        :return: (N, 4) array of xmin, ymin, xmax, ymax
+        """
+
+        return np.concatenate((self._coordinates.min(axis=1), self._coordinates.max(axis=1)), axis=1)
+
+
+def _rebuild_box_array(columns, encoded, coordinates, text, text_offsets, *column_values):
+    """
+    creates a box array from the buffers of BoxArray.__reduce_ex__ without copying them. texts that
+    were a list are decoded back to a list
+    """
+
+    texts = EncodedTexts(np.frombuffer(text, dtype="uint8"), np.frombuffer(text_offsets, dtype="int64"))
+    if not encoded:
+        texts = list(texts)
+    columns = {name: np.frombuffer(values, dtype=dtype) for (name, dtype), values in zip(columns, column_values)}
+
+    return BoxArray(np.frombuffer(coordinates, dtype="int32").reshape(-1, 4, 2), texts, columns, sort=False)
+
+
+class EncodedTexts:
+    """
+    text values of a box array kept as a single utf-8 buffer with offsets. the text of box i is
+    buffer[offsets[i]:offsets[i + 1]], it is only decoded when accessed
+    """
+
+    def __init__(self, buffer, offsets):
+        """
+        :param buffer: uint8 array of utf-8 encoded text
+        :param offsets: int64 array of length N + 1
+        """
+
+        self._buffer = buffer
+        self._offsets = offsets
+
+    @classmethod
+    def encode(cls, texts):
+        """
+        :param texts: list of str
+        :return: EncodedTexts object
+        """
+
+        encoded = [(text or '').encode('utf-8') for text in texts]
+
+        offsets = np.zeros(len(encoded) + 1, dtype="int64")
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+
+        buffer = np.frombuffer(b''.join(encoded), dtype="uint8")
+
+        return cls(buffer, offsets)
+
+    @property
+    def buffer(self):
+        return self._buffer
+
+    @property
+    def offsets(self):
+        return self._offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, item):
+        if not isinstance(item, (int, np.integer)):
+            return [self[i] for i in np.arange(len(self))[item]]
+
+        if item < 0:
+            item += len(self)
+
+        start, end = self._offsets[item], self._offsets[item + 1]
+
+        return bytes(self._buffer[start:end]).decode('utf-8')
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
@@ -0,0 +1,214 @@
+import os
+import json
+
+import numpy as np
+
+from .BoxArray_class import BoxArray, EncodedTexts
+
+
+class BoxStore:
+    """
+    compact binary store of box arrays on disk. a store is a directory with one file per column
+
+        header.json         number of boxes, pages and the dtypes of the extra columns
+        coordinates.bin     int32 array of shape (N, 4, 2)
+        text.bin            utf-8 encoded text of all the boxes
+        text_offsets.bin    int64 array of length N + 1, text of box i is text[offsets[i]:offsets[i + 1]]
+        page_offsets.bin    int64 array of length P + 1, boxes of page i are offsets[i]:offsets[i + 1]
+        column_<name>.bin   one file for every extra column
+
+    every append adds one page to the store. the files are memory mapped when the store is read, so
+    only the parts of the files touched by a query are loaded from disk. the header is written last,
+    data written after the last complete header is ignored and overwritten on the next append
+    """
+
+    version = 1
+
+    def __init__(self, path, columns=None):
+        """
+        opens the store at path, a new store is created if the path does not exist
+        :param path: directory of the store
+        :param columns: dict of extra column name to numpy dtype, only used when creating a new store
+        """
+
+        self._path = path
+        self._cache = {}
+
+        header_path = os.path.join(path, 'header.json')
+
+        if os.path.exists(header_path):
+            with open(header_path, 'r') as f:
+                self._header = json.load(f)
+
+            if self._header['version'] != self.version:
+                raise ValueError('unsupported box store version {}'.format(self._header['version']))
+
+        else:
+            os.makedirs(path, exist_ok=True)
+            self._header = {
+                'version': self.version,
+                'count': 0,
+                'pages': 0,
+                'text_bytes': 0,
+                'columns': {name: np.dtype(dtype).str for name, dtype in (columns or {}).items()}
+            }
+
+            # offset files always start with a zero so that they have length N + 1
+            for name in ('text_offsets', 'page_offsets'):
+                with open(self._file(name), 'wb') as f:
+                    f.write(np.zeros(1, dtype="int64").tobytes())
+
+            self._write_header()
+
+    def _file(self, name):
+        return os.path.join(self._path, name + '.bin')
+
+    def _write_header(self):
+        temp_path = os.path.join(self._path, 'header.json.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(self._header, f)
+        os.replace(temp_path, os.path.join(self._path, 'header.json'))
+
+    def _memmap(self, name, dtype, length, shape=()):
+        """
+        memory maps the first length elements of a column file
+        """
+
+        key = name
+        if key not in self._cache:
+            if length == 0:
+                array = np.zeros((0, ) + shape, dtype=dtype)
+            else:
+                array = np.memmap(self._file(name), dtype=dtype, mode='r', shape=(length, ) + shape)
+            self._cache[key] = array
+
+        return self._cache[key]
+
+    def _append_file(self, name, array, valid_bytes):
+        """
+        appends the array to the file after truncating bytes written after the last header
+        """
+
+        with open(self._file(name), 'ab') as f:
+            f.truncate(valid_bytes)
+            f.write(np.ascontiguousarray(array).tobytes())
+
+    def append(self, box_array):
+        """
+        appends the box array as a new page to the store
+        :param box_array: BoxArray object
+        :return: index of the page
+        """
+
+        columns = self._header['columns']
+
+        if set(box_array.columns) != set(columns):
+            raise ValueError('box array columns {} does not match the store columns '
+                             '{}'.format(sorted(box_array.columns), sorted(columns)))
+
+        texts = box_array.texts
+        if not isinstance(texts, EncodedTexts):
+            texts = EncodedTexts.encode(texts)
+
+        count = self._header['count']
+        pages = self._header['pages']
+        text_bytes = self._header['text_bytes']
+
+        text_offsets = texts.offsets[1:] - texts.offsets[0] + text_bytes
+        text_buffer = texts.buffer[texts.offsets[0]:texts.offsets[-1]]
+
+        self._append_file('coordinates', box_array.np_array.astype("int32"), count * 8 * 4)
+        self._append_file('text', text_buffer, text_bytes)
+        self._append_file('text_offsets', text_offsets.astype("int64"), (count + 1) * 8)
+        self._append_file('page_offsets', np.array([count + len(box_array)], dtype="int64"),
+                          (pages + 1) * 8)
+
+        for name, dtype in columns.items():
+            dtype = np.dtype(dtype)
+            self._append_file('column_' + name, box_array.columns[name].astype(dtype),
+                              count * dtype.itemsize)
+
+        self._header['count'] = count + len(box_array)
+        self._header['pages'] = pages + 1
+        self._header['text_bytes'] = text_bytes + len(text_buffer)
+        self._write_header()
+
+        self._cache = {}
+
+        return pages
+
+    def truncate(self, page_count):
+        """
+        drops every page after the first page_count pages, the files are cut on the next append
+        :param page_count: number of pages to keep
+        """
+
+        if not 0 <= page_count <= self.page_count:
+            raise IndexError('page count out of range')
+
+        count = int(self.page_offsets[page_count])
+        text_bytes = int(self._memmap('text_offsets', "int64", self._header['count'] + 1)[count])
+
+        self._header['count'] = count
+        self._header['pages'] = page_count
+        self._header['text_bytes'] = text_bytes
+        self._write_header()
+
+        self._cache = {}
+
+    def __len__(self):
+        return self._header['count']
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def page_count(self):
+        return self._header['pages']
+
+    @property
+    def page_offsets(self):
+        return self._memmap('page_offsets', "int64", self._header['pages'] + 1)
+
+    @property
+    def boxes(self):
+        """
+        all the boxes of the store as a memory mapped box array
+        :return: BoxArray object
+        """
+
+        count = self._header['count']
+
+        coordinates = self._memmap('coordinates', "int32", count, (4, 2))
+        texts = EncodedTexts(self._memmap('text', "uint8", self._header['text_bytes']),
+                             self._memmap('text_offsets', "int64", count + 1))
+        columns = {name: self._memmap('column_' + name, dtype, count)
+                   for name, dtype in self._header['columns'].items()}
+
+        return BoxArray(coordinates, texts, columns, sort=False)
+
+    def page(self, index):
+        """
+        boxes of a single page
+        :param index: index of the page
+        :return: BoxArray object
+        """
+
+        if index < 0:
+            index += self.page_count
+        if not 0 <= index < self.page_count:
+            raise IndexError('page index out of range')
+
+        offsets = self.page_offsets
+        start, end = int(offsets[index]), int(offsets[index + 1])
+
+        boxes = self.boxes
+        texts = EncodedTexts(boxes.texts.buffer, boxes.texts.offsets[start:end + 1])
+        columns = {name: values[start:end] for name, values in boxes.columns.items()}
+
+        return BoxArray(boxes.np_array[start:end], texts, columns, sort=False)
+
+    def pages(self):
+        for i in range(self.page_count):
+            yield self.page(i)
@@ -0,0 +1,188 @@
+import numpy as np
+
+from .BoxArray_class import BoxArray
+from .GridIndex_class import GridIndex
+
+
+class BoxTracker:
+    """
+    incremental tracker of text boxes over the frames of a video. the boxes of every frame are
+    associated with the tracks of the previous frames, so a word keeps its track id and its text while
+    it stays in view and only new or changed boxes have to be recognized again
+
+        tracker = BoxTracker()
+        for image, boxes in frames:
+            frame = tracker.update(boxes)
+            recognize = np.flatnonzero(frame.columns['new'] | frame.columns['changed'])
+            texts = [model(frame[i].perspective_wrap(image)) for i in recognize]
+            tracker.set_texts(frame.columns['track'][recognize], texts)
+
+    the cost of a pair of a box and a track is one minus their iou plus the distance between their
+    centroids as a ratio of the height of the box. pairs are candidates if their iou is at least
+    iou_threshold or their centroids are closer than max_distance heights, so fast moving text is still
+    followed, and the candidates are matched greedily from the lowest cost
+    """
+
+    def __init__(self, iou_threshold=0.3, max_distance=0.5, changed_iou=0.7, max_age=1):
+        """
+        :param iou_threshold: pairs with a smaller iou are candidates only if they are close enough
+        :param max_distance: pairs whose centroids are closer than this ratio of the box height are
+            candidates whatever their iou
+        :param changed_iou: a tracked box is reported as changed when its iou with the box where its
+            text was last recognized goes below this value
+        :param max_age: number of frames a track is kept without a matching box, e.g. when the text
+            is hidden for a moment
+        """
+
+        self._iou_threshold = iou_threshold
+        self._max_distance = max_distance
+        self._changed_iou = changed_iou
+        self._max_age = max_age
+
+        self._next_id = 0
+        self.reset()
+
+    def reset(self):
+        """
+        removes all the tracks, track ids are not reused
+        """
+
+        self._ids = np.zeros(0, dtype="int64")
+        self._coordinates = np.zeros((0, 4, 2), dtype="int32")
+        # box of every track when its text was last recognized
+        self._reference = np.zeros((0, 4, 2), dtype="int32")
+        self._texts = []
+        self._age = np.zeros(0, dtype="int64")
+        self._hits = np.zeros(0, dtype="int64")
+
+    def _match(self, frame, tracks):
+        """
+        :return: (frame index, track index) arrays of the matched pairs
+        """
+
+        if not len(frame) or not len(tracks):
+            return np.zeros(0, dtype="int64"), np.zeros(0, dtype="int64")
+
+        bounds = frame.bounds.astype("float64")
+        heights = np.maximum(bounds[:, 3] - bounds[:, 1], 1)
+
+        # boxes that do not overlap a track can still be close enough to it
+        margin = self._max_distance * heights.max()
+        first, second = GridIndex(tracks.bounds).query_many(bounds, margin)
+
+        iou = frame.pair_iou(tracks, first, second)
+        distance = np.linalg.norm(frame.centroids[first] - tracks.centroids[second], axis=1) / heights[first]
+
+        candidate = (iou >= self._iou_threshold) | (distance <= self._max_distance)
+        first, second = first[candidate], second[candidate]
+        cost = (1 - iou[candidate]) + distance[candidate]
+
+        frame_used = np.zeros(len(frame), dtype=bool)
+        track_used = np.zeros(len(tracks), dtype=bool)
+        matched = []
+
+        for k in np.argsort(cost, kind='stable'):
+            if not frame_used[first[k]] and not track_used[second[k]]:
+                frame_used[first[k]] = track_used[second[k]] = True
+                matched.append(k)
+
+        matched = np.array(matched, dtype="int64")
+
+        return first[matched], second[matched]
+
+    def update(self, boxes):
+        """
+        associates the boxes of the next frame with the tracks
+        :param boxes: BoxArray or list of BoundBox objects of the frame, texts which are not empty
+            replace the texts of their tracks
+        :return: BoxArray of the boxes of the frame with the texts of their tracks and the columns
+            'track' (track id), 'new' (box started a track) and 'changed' (box moved or grew enough
+            that its text should be recognized again), the columns of a BoxArray passed in are kept
+        """
+
+        frame = boxes if isinstance(boxes, BoxArray) else BoxArray.from_boxes(boxes)
+        tracks = BoxArray(self._coordinates, sort=False)
+
+        matched_frame, matched_track = self._match(frame, tracks)
+
+        track = np.full(len(frame), -1, dtype="int64")
+        track[matched_frame] = matched_track
+
+        changed = np.zeros(len(frame), dtype=bool)
+        if len(matched_frame):
+            reference = BoxArray(self._reference, sort=False)
+            changed[matched_frame] = frame.pair_iou(reference, matched_frame, matched_track) < self._changed_iou
+
+        # tracks which are not seen grow older and are dropped after max_age frames
+        seen = np.zeros(len(tracks), dtype=bool)
+        seen[matched_track] = True
+        self._age[~seen] += 1
+        self._age[seen] = 0
+        self._hits[seen] += 1
+        self._coordinates[matched_track] = frame.np_array[matched_frame]
+
+        # changed boxes are expected to be recognized again, so they become the new reference
+        moved = changed[matched_frame]
+        self._reference[matched_track[moved]] = frame.np_array[matched_frame[moved]]
+
+        new = track < 0
+        count = int(new.sum())
+        new_ids = np.arange(self._next_id, self._next_id + count, dtype="int64")
+        self._next_id += count
+
+        track[new] = np.arange(len(tracks), len(tracks) + count)
+        self._ids = np.concatenate((self._ids, new_ids))
+        self._coordinates = np.concatenate((self._coordinates, frame.np_array[new]))
+        self._reference = np.concatenate((self._reference, frame.np_array[new]))
+        self._texts.extend(frame.texts[i] for i in np.flatnonzero(new))
+        self._age = np.concatenate((self._age, np.zeros(count, dtype="int64")))
+        self._hits = np.concatenate((self._hits, np.ones(count, dtype="int64")))
+
+        for i, text in enumerate(frame.texts):
+            if text:
+                self._texts[track[i]] = text
+
+        texts = [self._texts[i] for i in track]
+        ids = self._ids[track]
+
+        keep = self._age <= self._max_age
+        if not keep.all():
+            self._select(keep)
+
+        columns = dict(frame.columns)
+        columns.update({'track': ids, 'new': new, 'changed': changed})
+
+        return BoxArray(frame.np_array, texts, columns, sort=False)
+
+    def _select(self, keep):
+        self._ids = self._ids[keep]
+        self._coordinates = self._coordinates[keep]
+        self._reference = self._reference[keep]
+        self._texts = [text for text, k in zip(self._texts, keep) if k]
+        self._age = self._age[keep]
+        self._hits = self._hits[keep]
+
+    def set_texts(self, track_ids, texts):
+        """
+        records the recognized texts of tracks, e.g. of the new and changed boxes of a frame
+        :param track_ids: list of track ids
+        :param texts: list of texts, one for each track id
+        """
+
+        position = {track_id: i for i, track_id in enumerate(self._ids.tolist())}
+        for track_id, text in zip(np.asarray(track_ids).tolist(), texts):
+            if track_id in position:
+                self._texts[position[track_id]] = text
+
+    @property
+    def tracks(self):
+        """
+        BoxArray of the last box of every live track with the columns 'track' (track id), 'age'
+        (frames since the track was last seen) and 'hits' (frames the track was seen in)
+        """
+
+        return BoxArray(self._coordinates, list(self._texts),
+                        {'track': self._ids, 'age': self._age, 'hits': self._hits}, sort=False)
+
+    def __len__(self):
+        return len(self._ids)
@@ -0,0 +1,157 @@
+import weakref
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class CropCache:
+    """
+    in memory cache of the crops and perspective warps of boxes, for pipelines that run several
+    recognition models over the same regions of an image
+
+        cache = CropCache(max_bytes=256 * 2**20)
+        for model in models:
+            words = [model(box.perspective_wrap(image, cache=cache)) for box in boxes]
+
+        print(cache.stats['hit_rate'])
+
+    entries are keyed by the identity of the image and the corners of the box. an image is identified
+    by the array object itself, the entries of an image are dropped when it is garbage collected. an
+    image that is modified in place must be passed to invalidate, otherwise the old pixels are returned.
+    the cached arrays are copies of the pixels and are read only, since they are shared by every caller.
+    the least recently used entries are removed when the size of the cache goes above max_bytes
+    """
+
+    def __init__(self, max_bytes=256 * 2**20):
+        """
+        :param max_bytes: maximum size of the pixels of all the entries together
+        """
+
+        self._max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._images = {}
+        # reentrant since the weakref callback can run during a garbage collection inside a locked block
+        self._lock = threading.RLock()
+
+    def _image_id(self, image):
+        image_id = id(image)
+
+        with self._lock:
+            if image_id not in self._images:
+                # the callback runs when the image is collected, before its id can be reused
+                self._images[image_id] = weakref.ref(image, lambda _, image_id=image_id: self._forget(image_id))
+
+        return image_id
+
+    def _forget(self, image_id):
+        with self._lock:
+            self._images.pop(image_id, None)
+            for key in [key for key in self._entries if key[0] == image_id]:
+                self._size -= self._entries.pop(key).nbytes
+
+    def get(self, image, coordinates, mode, compute):
+        """
+        :param image: image the region is taken from
+        :param coordinates: corners of the box, array like of shape (4, 2) or (8, )
+        :param mode: name of the operation, e.g. 'crop' or 'warp'
+        :param compute: function without arguments returning the region, called on a miss
+        :return: read only array of the region
+        """
+
+        key = (self._image_id(image), mode, np.asarray(coordinates, dtype="int32").tobytes())
+
+        with self._lock:
+            region = self._entries.get(key)
+            if region is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return region
+            self.misses += 1
+
+        # computed outside the lock, two threads missing the same key both compute it
+        region = np.array(compute())
+        region.setflags(write=False)
+
+        with self._lock:
+            if region.nbytes <= self._max_bytes and key not in self._entries:
+                self._entries[key] = region
+                self._size += region.nbytes
+                self._evict()
+
+        return region
+
+    def crop(self, box, image):
+        """
+        same as box.crop_image(image) through the cache
+        """
+
+        return self.get(image, box.np_array, 'crop', lambda: box.crop_image(image))
+
+    def warp(self, box, image):
+        """
+        same as box.perspective_wrap(image) through the cache
+        """
+
+        return self.get(image, box.np_array, 'warp', lambda: box.perspective_wrap(image))
+
+    def crop_boxes(self, boxes, image):
+        """
+        :param boxes: list of BoundBox objects or BoxArray
+        :param image: image the boxes are cropped from
+        :return: list of read only crops, one for each box
+        """
+
+        return [self.crop(box, image) for box in boxes]
+
+    def warp_boxes(self, boxes, image):
+        """
+        :param boxes: list of BoundBox objects or BoxArray
+        :param image: image the boxes are warped from
+        :return: list of read only warps, one for each box
+        """
+
+        return [self.warp(box, image) for box in boxes]
+
+    def _evict(self):
+        while self._size > self._max_bytes and self._entries:
+            _, region = self._entries.popitem(last=False)
+            self._size -= region.nbytes
+            self.evictions += 1
+
+    def invalidate(self, image):
+        """
+        removes all the entries of an image, e.g. after it was modified in place
+        """
+
+        self._forget(id(image))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': len(self._entries),
+            'bytes': self._size,
+        }
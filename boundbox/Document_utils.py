@@ -0,0 +1,163 @@
+"""
+parsing and post processing of multi page ocr responses, page by page on an executor
+
+    results = process_document(google_response, 'google', steps=('merge', 'sort'), executor='process')
+    for result in results:
+        if result.error is None:
+            print(result.page, len(result.boxes))
+
+every page is parsed and post processed independently, results come back in page order and a page
+which fails only sets the error of its own result
+"""
+
+import json
+from collections import namedtuple
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+
+from .BoundBox_class import BoundBox
+from .BoxArray_class import BoxArray
+from .Layout_utils import reading_order, deskew
+
+PageResult = namedtuple('PageResult', ['page', 'boxes', 'error'])
+
+STEPS = ('merge', 'sort', 'dedupe', 'deskew')
+
+
+def split_pages(data, parser):
+    """
+    splits an ocr response into single page responses
+    :param data: response as dict, or as json bytes or str
+    :param parser: one of 'google', 'azure', 'tesseract'
+    :return: list of single page responses
+    """
+
+    if isinstance(data, (bytes, str)):
+        data = json.loads(data)
+
+    if parser == 'google':
+        return [{'responses': [page]} for page in data['responses']]
+    if parser == 'azure':
+        return [{'recognitionResults': [page]} for page in data['recognitionResults']]
+    if parser == 'tesseract':
+        return [data]
+
+    raise ValueError("parser should be one of 'google', 'azure', 'tesseract' not {}".format(parser))
+
+
+def parse_page(page, parser, **options):
+    """
+    :param page: single page response, see split_pages
+    :param parser: one of 'google', 'azure', 'tesseract'
+    :param options: keyword arguments of the parser, e.g. merge_line for azure
+    :return: list of BoundBox objects
+    """
+
+    if parser == 'google':
+        return BoundBox.google_ocr_boxes(page, **options)[0]
+    if parser == 'azure':
+        return BoundBox.azure_ocr_boxes(page, **options)[0]
+    if parser == 'tesseract':
+        return BoundBox.pytesseract_boxes(page, **options)
+
+    raise ValueError("parser should be one of 'google', 'azure', 'tesseract' not {}".format(parser))
+
+
+def remove_duplicates(box_array, min_iou=0.9):
+    """
+    removes boxes overlapping an earlier box with the same text by at least min_iou
+    :param box_array: BoxArray object
+    :param min_iou: minimum iou of duplicates
+    :return: BoxArray without the duplicates
+    """
+
+    first, second, _ = box_array.iou(box_array, min_iou)
+    texts = box_array.texts
+
+    later = first > second
+    duplicate = [i for i, j in zip(first[later], second[later]) if texts[i] == texts[j]]
+
+    keep = np.ones(len(box_array), dtype=bool)
+    keep[duplicate] = False
+
+    return box_array[np.flatnonzero(keep)]
+
+
+def process_page(boxes, steps=('merge',), dx=1, min_iou=0.9):
+    """
+    post processing steps of a page, run in the given order
+    :param boxes: list of BoundBox objects
+    :param steps: any of 'merge' (BoundBox.merge_box), 'sort' (Layout_utils.reading_order),
+        'dedupe' (remove_duplicates) and 'deskew' (Layout_utils.deskew)
+    :param dx: dx of merge_box
+    :param min_iou: min_iou of remove_duplicates
+    :return: list of BoundBox objects
+    """
+
+    for step in steps:
+        if step == 'merge':
+            boxes = BoundBox.merge_box(list(boxes), dx)
+        elif step == 'sort':
+            box_array = BoxArray.from_boxes(boxes)
+            boxes = box_array[reading_order(box_array)].to_boxes()
+        elif step == 'dedupe':
+            boxes = remove_duplicates(BoxArray.from_boxes(boxes), min_iou).to_boxes()
+        elif step == 'deskew':
+            boxes = deskew(BoxArray.from_boxes(boxes)).to_boxes()
+        else:
+            raise ValueError('step should be one of {} not {}'.format(STEPS, step))
+
+    return boxes
+
+
+def _run_page(arguments):
+    index, page, parser, parser_options, steps, step_options = arguments
+
+    try:
+        boxes = parse_page(page, parser, **parser_options)
+        boxes = process_page(boxes, steps, **step_options)
+    except Exception as err:
+        return PageResult(index, None, '{}: {}'.format(type(err).__name__, err))
+
+    return PageResult(index, boxes, None)
+
+
+def process_document(data, parser, steps=('merge',), executor='thread', workers=None, chunksize=1,
+                     parser_options=None, dx=1, min_iou=0.9):
+    """
+    parses and post processes every page of an ocr response in parallel
+
+    :param data: response as dict, or as json bytes or str
+    :param parser: one of 'google', 'azure', 'tesseract'
+    :param steps: post processing steps, see process_page
+    :param executor: 'thread', 'process', 'inline' to run in the calling thread, or a
+        concurrent.futures.Executor which is used as it is and not shut down
+    :param workers: number of workers of a new thread or process executor
+    :param chunksize: number of pages sent to a process at once
+    :param parser_options: keyword arguments of the parser, e.g. {'merge_line': True} for azure
+    :param dx: see process_page
+    :param min_iou: see process_page
+    :return: list of PageResult(page, boxes, error) in page order, boxes is None and error is the
+        message if the page failed
+    """
+
+    for step in steps:
+        if step not in STEPS:
+            raise ValueError('step should be one of {} not {}'.format(STEPS, step))
+
+    if not isinstance(executor, Executor) and executor not in ('thread', 'process', 'inline'):
+        raise ValueError("executor should be 'thread', 'process', 'inline' or an Executor not {}".format(executor))
+
+    pages = split_pages(data, parser)
+    arguments = [(index, page, parser, parser_options or {}, tuple(steps), {'dx': dx, 'min_iou': min_iou})
+                 for index, page in enumerate(pages)]
+
+    if executor == 'inline' or len(arguments) <= 1:
+        return [_run_page(argument) for argument in arguments]
+
+    if isinstance(executor, Executor):
+        return list(executor.map(_run_page, arguments, chunksize=chunksize))
+
+    with (ThreadPoolExecutor(workers) if executor == 'thread' else ProcessPoolExecutor(workers)) as pool:
+        return list(pool.map(_run_page, arguments, chunksize=chunksize))
@@ -0,0 +1,335 @@
+"""
+evaluation of ocr results against ground truth boxes, e.g. labelImg annotations
+
+    for result in evaluate_dataset([(name, prediction_json, labelimg_xml), ...], processes=8):
+        print(result['name'], result['f1'])
+
+predictions are matched to ground truth by iou, either greedily (highest iou first) or with the
+optimal assignment which maximizes the total iou of the matches
+"""
+
+import os
+import json
+from multiprocessing import Pool
+
+import numpy as np
+
+from .BoundBox_class import BoundBox
+from .BoxArray_class import BoxArray
+from .BoundBox_utils import connected_components
+
+
+def _as_box_array(boxes):
+    if isinstance(boxes, str):
+        boxes = load_boxes(boxes)
+    if not isinstance(boxes, BoxArray):
+        boxes = BoxArray.from_boxes(boxes)
+    return boxes
+
+
+def load_boxes(path):
+    """
+    loads the boxes of the first page of a file. labelImg xml, google and azure ocr json and the
+    json lines written by Json_utils.write_document are supported
+    :param path: path of the file
+    :return: BoxArray object
+    """
+
+    if path.endswith('.xml'):
+        return BoxArray.from_boxes(BoundBox.labelimg_xml_boxes(path))
+
+    if path.endswith('.jsonl'):
+        from .Json_utils import read_document
+        with open(path, 'r', encoding='utf-8') as f:
+            return next(read_document(f), BoxArray(np.zeros((0, 4, 2))))
+
+    with open(path, 'rb') as f:
+        data = json.load(f)
+
+    if 'responses' in data:
+        pages = BoundBox.google_ocr_boxes(data)
+    elif 'recognitionResults' in data:
+        pages = BoundBox.azure_ocr_boxes(data)
+    else:
+        raise ValueError('unknown ocr response format in {}'.format(path))
+
+    return BoxArray.from_boxes(pages[0] if pages else [])
+
+
+def _hungarian(cost):
+    """
+    minimum cost assignment of rows to columns with the hungarian algorithm, used when scipy is not
+    installed. cost has at least as many columns as rows
+    :return: (row indices, column indices)
+    """
+
+    rows, columns = cost.shape
+    u = np.zeros(rows + 1)
+    v = np.zeros(columns + 1)
+    match = np.zeros(columns + 1, dtype="int64")
+    way = np.zeros(columns + 1, dtype="int64")
+
+    for row in range(1, rows + 1):
+        match[0] = row
+        column = 0
+        min_value = np.full(columns + 1, np.inf)
+        used = np.zeros(columns + 1, dtype=bool)
+
+        while True:
+            used[column] = True
+            current_row = match[column]
+
+            reduced = cost[current_row - 1] - u[current_row] - v[1:]
+            update = ~used[1:] & (reduced < min_value[1:])
+            min_value[1:][update] = reduced[update]
+            way[1:][update] = column
+
+            candidates = np.where(used[1:], np.inf, min_value[1:])
+            next_column = int(np.argmin(candidates)) + 1
+            delta = candidates[next_column - 1]
+
+            u[match[used]] += delta
+            v[used] -= delta
+            min_value[~used] -= delta
+
+            column = next_column
+            if match[column] == 0:
+                break
+
+        while column:
+            previous = way[column]
+            match[column] = match[previous]
+            column = previous
+
+    assigned = np.flatnonzero(match[1:]) + 1
+    row_index = match[assigned] - 1
+    order = np.argsort(row_index)
+
+    return row_index[order], assigned[order] - 1
+
+
+def _linear_sum_assignment(cost):
+    try:
+        from scipy.optimize import linear_sum_assignment
+    except ImportError:
+        return _hungarian(cost)
+
+    return linear_sum_assignment(cost)
+
+
+def match_boxes(predictions, ground_truth, iou_threshold=0.5, method='greedy'):
+    """
+    one to one matching of predicted boxes to ground truth boxes
+    :param predictions: BoxArray or list of BoundBox objects
+    :param ground_truth: BoxArray or list of BoundBox objects
+    :param iou_threshold: pairs with a smaller iou are never matched
+    :param method: 'greedy' to match the pairs with the highest iou first or 'optimal' to maximize the
+        total iou of the matches
+    :return: (prediction index, ground truth index, iou) arrays of the matched pairs
+    """
+
+    if method not in ('greedy', 'optimal'):
+        raise ValueError("method should be either 'greedy' or 'optimal' not {}".format(method))
+
+    predictions = _as_box_array(predictions)
+    ground_truth = _as_box_array(ground_truth)
+
+    first, second, iou = predictions.iou(ground_truth, min_iou=iou_threshold)
+
+    matched_prediction = []
+    matched_truth = []
+
+    if method == 'greedy':
+        prediction_used = np.zeros(len(predictions), dtype=bool)
+        truth_used = np.zeros(len(ground_truth), dtype=bool)
+
+        for k in np.argsort(-iou, kind='stable'):
+            if not prediction_used[first[k]] and not truth_used[second[k]]:
+                prediction_used[first[k]] = truth_used[second[k]] = True
+                matched_prediction.append(first[k])
+                matched_truth.append(second[k])
+
+    else:
+        # the assignment is solved separately for every connected group of candidate pairs
+        count = len(predictions)
+        components = connected_components(count + len(ground_truth), first, second + count)
+        pair_component = components[first]
+
+        for component in np.unique(pair_component):
+            pairs = np.flatnonzero(pair_component == component)
+            rows, row_ids = np.unique(first[pairs], return_inverse=True)
+            columns, column_ids = np.unique(second[pairs], return_inverse=True)
+
+            # pairs below the threshold get a cost of zero, same as leaving them unmatched
+            cost = np.zeros((len(rows), len(columns)))
+            cost[row_ids, column_ids] = -iou[pairs]
+
+            transposed = len(rows) > len(columns)
+            row_index, column_index = _linear_sum_assignment(cost.T if transposed else cost)
+            if transposed:
+                row_index, column_index = column_index, row_index
+
+            valid = cost[row_index, column_index] < 0
+            matched_prediction.extend(rows[row_index[valid]])
+            matched_truth.extend(columns[column_index[valid]])
+
+    matched_prediction = np.array(matched_prediction, dtype="int64")
+    matched_truth = np.array(matched_truth, dtype="int64")
+
+    # iou of the matched pairs, looked up from the candidate pairs
+    key = first * len(ground_truth) + second
+    order = np.argsort(key)
+    position = order[np.searchsorted(key[order], matched_prediction * len(ground_truth) + matched_truth)] \
+        if len(key) else np.zeros(0, dtype="int64")
+
+    return matched_prediction, matched_truth, iou[position]
+
+
+def edit_distance(text_1, text_2):
+    """
+    levenshtein distance between two strings
+    """
+
+    previous = list(range(len(text_2) + 1))
+    for i, character_1 in enumerate(text_1, 1):
+        current = [i]
+        for j, character_2 in enumerate(text_2, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (character_1 != character_2)))
+        previous = current
+
+    return previous[-1]
+
+
+def evaluate_image(predictions, ground_truth, iou_threshold=0.5, method='greedy', case_sensitive=True):
+    """
+    detection and text metrics of a single image
+    :param predictions: BoxArray, list of BoundBox objects or path of a file, see load_boxes
+    :param ground_truth: BoxArray, list of BoundBox objects or path of a file, see load_boxes
+    :param iou_threshold: see match_boxes
+    :param method: see match_boxes
+    :param case_sensitive: keep False to ignore case when comparing texts
+    :return: dict of counts and metrics
+    """
+
+    predictions = _as_box_array(predictions)
+    ground_truth = _as_box_array(ground_truth)
+
+    prediction_ids, truth_ids, iou = match_boxes(predictions, ground_truth, iou_threshold, method)
+
+    exact = 0
+    character_errors = 0
+    characters = 0
+    for prediction_id, truth_id in zip(prediction_ids, truth_ids):
+        predicted_text = predictions.texts[prediction_id] or ''
+        true_text = ground_truth.texts[truth_id] or ''
+        if not case_sensitive:
+            predicted_text, true_text = predicted_text.casefold(), true_text.casefold()
+
+        exact += predicted_text == true_text
+        character_errors += edit_distance(predicted_text, true_text)
+        characters += len(true_text)
+
+    result = {
+        'true_positives': len(prediction_ids),
+        'false_positives': len(predictions) - len(prediction_ids),
+        'false_negatives': len(ground_truth) - len(truth_ids),
+        'iou_sum': float(iou.sum()),
+        'text_exact': int(exact),
+        'character_errors': int(character_errors),
+        'characters': int(characters),
+    }
+    result.update(_metrics(result))
+
+    return result
+
+
+def _metrics(counts):
+    """
+    precision, recall, f1 and text metrics from the counts of evaluate_image
+    """
+
+    true_positives = counts['true_positives']
+    predicted = true_positives + counts['false_positives']
+    actual = true_positives + counts['false_negatives']
+
+    precision = true_positives / predicted if predicted else 0.0
+    recall = true_positives / actual if actual else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+    return {
+        'precision': precision,
+        'recall': recall,
+        'f1': f1,
+        'mean_iou': counts['iou_sum'] / true_positives if true_positives else 0.0,
+        'text_accuracy': counts['text_exact'] / true_positives if true_positives else 0.0,
+        'character_accuracy': 1 - counts['character_errors'] / counts['characters'] if counts['characters']
+        else 0.0,
+    }
+
+
+def _evaluate_item(arguments):
+    item, options = arguments
+    name, predictions, ground_truth = item
+
+    try:
+        result = evaluate_image(predictions, ground_truth, **options)
+    except Exception as err:
+        # one broken file should not stop the evaluation of the dataset
+        return {'name': name, 'error': '{}: {}'.format(type(err).__name__, err)}
+
+    result['name'] = name
+    return result
+
+
+def evaluate_dataset(items, processes=None, chunksize=16, **options):
+    """
+    evaluates every image of a dataset on a process pool, results are streamed in the order of the
+    items as soon as they are ready
+
+    :param items: iterable of (name, predictions, ground truth), predictions and ground truth are
+        paths (see load_boxes), BoxArray objects or lists of BoundBox objects
+    :param processes: number of worker processes, number of cpus if None and 1 to run in this process
+    :param chunksize: number of items sent to a worker at once
+    :param options: keyword arguments of evaluate_image
+    :return: generator of per image result dicts, images that failed have an 'error' entry instead
+    """
+
+    arguments = ((item, options) for item in items)
+
+    if processes == 1:
+        for argument in arguments:
+            yield _evaluate_item(argument)
+        return
+
+    with Pool(processes or os.cpu_count()) as pool:
+        for result in pool.imap(_evaluate_item, arguments, chunksize):
+            yield result
+
+
+def summarize(results):
+    """
+    micro averaged metrics over the per image results of evaluate_dataset
+    :param results: iterable of result dicts
+    :return: dict of summed counts, metrics, number of images and number of failed images
+    """
+
+    keys = ('true_positives', 'false_positives', 'false_negatives', 'iou_sum', 'text_exact',
+            'character_errors', 'characters')
+    totals = dict.fromkeys(keys, 0)
+    images = 0
+    errors = 0
+
+    for result in results:
+        images += 1
+        if 'error' in result:
+            errors += 1
+            continue
+        for key in keys:
+            totals[key] += result[key]
+
+    totals.update(_metrics(totals))
+    totals['images'] = images
+    totals['errors'] = errors
+
+    return totals
@@ -0,0 +1,141 @@
+"""
+fusion of the boxes of the same page detected by several ocr engines
+
+    fused = fuse([BoundBox.google_ocr_boxes(google)[0], BoundBox.azure_ocr_boxes(azure)[0],
+                  BoundBox.pytesseract_boxes(tesseract)], weights=[1.0, 1.0, 0.5])
+
+boxes of different engines overlapping by at least iou_threshold are linked and every connected
+group of linked boxes becomes one fused box. boxes of one engine inside a group, e.g. two words where
+another engine found a single box, are first merged into the minimum area rotated rectangle around them,
+so rotated text stays rotated
+"""
+
+import numpy as np
+
+from .BoxArray_class import BoxArray
+from .BoundBox_utils import connected_components
+
+
+def fuse(engines, weights=None, iou_threshold=0.3, text_mode='vote', min_engines=1,
+         confidence_column='confidence'):
+    """
+    fuses the boxes of several engines into one box array
+
+    :param engines: list of BoxArray objects or lists of BoundBox objects, one for every engine
+    :param weights: weight of every engine, all engines are weighted equally if None
+    :param iou_threshold: minimum iou of two boxes of different engines to be fused
+    :param text_mode: 'vote' to take the text with the largest total weight in a group or 'confidence'
+        to take the text of the box with the largest weight
+    :param min_engines: groups found by fewer engines are dropped
+    :param confidence_column: name of the column with per box confidence, used when the box array of
+        an engine has it. the weight of a box is the engine weight times its confidence
+    :return: BoxArray of fused boxes with the columns 'engines' (number of engines in the group),
+        'score' (weight of the group relative to the total engine weight) and 'agreement' (share of the
+        group weight that agrees with the chosen text)
+    """
+
+    if text_mode not in ('vote', 'confidence'):
+        raise ValueError("text_mode should be either 'vote' or 'confidence' not {}".format(text_mode))
+
+    engines = [boxes if isinstance(boxes, BoxArray) else BoxArray.from_boxes(boxes) for boxes in engines]
+    engine_count = len(engines)
+
+    weights = np.ones(engine_count) if weights is None else np.asarray(weights, dtype="float64")
+    if len(weights) != engine_count:
+        raise ValueError('number of weights ({}) does not match number of engines '
+                         '({})'.format(len(weights), engine_count))
+
+    columns = {'engines': np.zeros(0, dtype="int64"), 'score': np.zeros(0), 'agreement': np.zeros(0)}
+    if not sum(len(boxes) for boxes in engines):
+        return BoxArray(np.zeros((0, 4, 2)), columns=columns, sort=False)
+
+    coordinates = np.concatenate([boxes.np_array for boxes in engines])
+    texts = [text for boxes in engines for text in boxes.texts]
+    engine = np.repeat(np.arange(engine_count), [len(boxes) for boxes in engines])
+    confidence = np.concatenate([boxes.columns[confidence_column].astype("float64")
+                                 if confidence_column in boxes.columns else np.ones(len(boxes))
+                                 for boxes in engines])
+
+    boxes = BoxArray(coordinates, texts, sort=False)
+
+    # only boxes of different engines are linked
+    first, second, _ = boxes.iou(boxes, iou_threshold)
+    linked = engine[first] != engine[second]
+    clusters = connected_components(len(boxes), first[linked], second[linked])
+
+    # one box per engine and group
+    labels = clusters * engine_count + engine
+    group_labels, first_index, inverse, sizes = np.unique(labels, return_index=True, return_inverse=True,
+                                                          return_counts=True)
+    group_corners = coordinates[first_index]
+    group_texts = [texts[i] for i in first_index]
+
+    # most engines have a single box in a group, it is kept as it is
+    split = sizes > 1
+    if split.any():
+        member = split[inverse]
+        merged = boxes[member].reduce_by_label(labels[member], mode='rotated')
+        group_corners[split] = merged.np_array
+        for i, text in zip(np.flatnonzero(split), merged.texts):
+            group_texts[i] = text
+
+    group_cluster = group_labels // engine_count
+    group_engine = group_labels % engine_count
+
+    group_confidence = np.bincount(inverse, np.maximum(confidence, 0)) / np.bincount(inverse)
+    group_weight = np.maximum(weights[group_engine] * group_confidence, 1e-12)
+
+    cluster_count = int(group_cluster.max()) + 1
+    total_weight = np.bincount(group_cluster, group_weight, cluster_count)
+
+    # weighted average of the corners
+    corners = np.zeros((cluster_count, 4, 2))
+    np.add.at(corners, group_cluster, group_corners * group_weight[:, None, None])
+    corners = np.around(corners / total_weight[:, None, None])
+
+    if text_mode == 'vote':
+        # total weight of every distinct text in a group, empty texts only win if nothing else is read
+        unique_texts, text_ids = np.unique(np.array(group_texts, dtype=object).astype(str), return_inverse=True)
+        empty = unique_texts[text_ids] == ''
+        keys, key_inverse = np.unique(group_cluster * len(unique_texts) + text_ids, return_inverse=True)
+        votes = np.bincount(key_inverse, np.where(empty, group_weight * 1e-9, group_weight))
+
+        key_cluster = keys // len(unique_texts)
+        best = np.lexsort((-votes, key_cluster))
+        best = best[np.concatenate(([True], np.diff(key_cluster[best]) != 0))]
+
+        fused_texts = unique_texts[keys[best] % len(unique_texts)].tolist()
+        support = votes[best]
+
+    else:
+        best = np.lexsort((-group_weight, group_cluster))
+        best = best[np.concatenate(([True], np.diff(group_cluster[best]) != 0))]
+
+        fused_texts = [group_texts[i] for i in best]
+        chosen = np.array(fused_texts, dtype=object)[group_cluster].astype(str)
+        agree = chosen == np.array(group_texts, dtype=object).astype(str)
+        support = np.bincount(group_cluster, group_weight * agree, cluster_count)
+
+    engine_counts = np.bincount(group_cluster, minlength=cluster_count)
+    columns = {
+        'engines': engine_counts,
+        'score': total_weight / weights.sum(),
+        'agreement': np.minimum(support / total_weight, 1.0),
+    }
+
+    keep = engine_counts >= min_engines
+    columns = {name: values[keep] for name, values in columns.items()}
+    fused_texts = [text for text, kept in zip(fused_texts, keep) if kept]
+
+    return BoxArray(corners[keep], fused_texts, columns)
+
+
+def fuse_pages(documents, **options):
+    """
+    fuses documents page by page, e.g. the page lists of google_ocr_boxes and azure_ocr_boxes
+    :param documents: list of documents, one for every engine, each a list of pages
+    :param options: keyword arguments of fuse
+    :return: list of fused BoxArray objects, one for every page
+    """
+
+    return [fuse(pages, **options) for pages in zip(*documents)]
@@ -0,0 +1,157 @@
+import numpy as np
+
+
+def _expand(starts, lengths):
+    """
+    for every i, the values starts[i], starts[i] + 1, ... starts[i] + lengths[i] - 1 and their owner i
+    """
+
+    owner = np.repeat(np.arange(len(starts)), lengths)
+    position = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    return owner, np.repeat(starts, lengths) + position
+
+
+class GridIndex:
+    """
+    uniform grid spatial index over the axis aligned bounds of boxes. every box is registered in
+    every cell it covers, the cells are kept as a sorted array so that any number of rectangles or
+    points can be looked up with a few vectorized searches
+
+        index = GridIndex(box_array.bounds)
+        query, box = index.query_many(other.bounds)     # overlapping pairs
+    """
+
+    def __init__(self, bounds, cell_size=None):
+        """
+        :param bounds: (N, 4) array of xmin, ymin, xmax, ymax
+        :param cell_size: size of a square cell, twice the median box size if None
+        """
+
+        bounds = np.asarray(bounds, dtype="float64").reshape(-1, 4)
+        self._bounds = bounds
+
+        if cell_size is None:
+            sizes = np.concatenate((bounds[:, 2] - bounds[:, 0], bounds[:, 3] - bounds[:, 1]))
+            cell_size = 2 * np.median(sizes) if len(sizes) else 1
+        self._cell_size = max(float(cell_size), 1.0)
+
+        self._origin = bounds[:, :2].min(axis=0) if len(bounds) else np.zeros(2)
+
+        x0, y0, x1, y1 = self._cells(bounds)
+        self._columns = int(x1.max()) + 1 if len(bounds) else 0
+        self._rows = int(y1.max()) + 1 if len(bounds) else 0
+
+        owner, keys = self._cell_keys(x0, y0, x1, y1)
+
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order]
+        self._box_ids = owner[order]
+
+    def _cells(self, bounds):
+        """
+        first and last cell along x and y covered by every rectangle
+        """
+
+        cells = np.floor((bounds - np.tile(self._origin, 2)) / self._cell_size).astype("int64")
+
+        return cells[:, 0], cells[:, 1], cells[:, 2], cells[:, 3]
+
+    def _cell_keys(self, x0, y0, x1, y1):
+        """
+        keys of all the cells covered by every rectangle and the index of the rectangle
+        """
+
+        width = np.maximum(x1 - x0 + 1, 0)
+        height = np.maximum(y1 - y0 + 1, 0)
+
+        owner, position = _expand(np.zeros(len(x0), dtype="int64"), width * height)
+        width = width[owner]
+
+        x = x0[owner] + position % np.maximum(width, 1)
+        y = y0[owner] + position // np.maximum(width, 1)
+
+        return owner, y * self._columns + x
+
+    def _candidates(self, bounds):
+        """
+        (query index, box index) pairs sharing at least one cell, without duplicates
+        """
+
+        bounds = np.asarray(bounds, dtype="float64").reshape(-1, 4)
+        if not len(bounds) or not len(self._keys):
+            return np.zeros(0, dtype="int64"), np.zeros(0, dtype="int64")
+
+        # ranges are clipped to the grid, rectangles fully outside the grid get an empty range
+        x0, y0, x1, y1 = self._cells(bounds)
+        x0, y0 = np.maximum(x0, 0), np.maximum(y0, 0)
+        x1, y1 = np.minimum(x1, self._columns - 1), np.minimum(y1, self._rows - 1)
+
+        query, keys = self._cell_keys(x0, y0, x1, y1)
+
+        start = np.searchsorted(self._keys, keys, side='left')
+        end = np.searchsorted(self._keys, keys, side='right')
+
+        owner, position = _expand(start, end - start)
+        box = self._box_ids[position]
+        cell = keys[owner]
+        query = query[owner]
+
+        # a pair shares several cells when both rectangles span them, it is kept only in the cell of
+        # the top left corner of the intersection instead of removing duplicates afterwards
+        corner = np.maximum(bounds[query, :2], self._bounds[box, :2])
+        corner_x, corner_y = self._cells(np.concatenate((corner, corner), axis=1))[:2]
+        first = cell == corner_y * self._columns + corner_x
+
+        pair = np.sort(query[first] * len(self._bounds) + box[first])
+
+        return pair // len(self._bounds), pair % len(self._bounds)
+
+    def query_many(self, bounds, margin=0):
+        """
+        finds the boxes overlapping each of the rectangles
+        :param bounds: (M, 4) array of xmin, ymin, xmax, ymax
+        :param margin: rectangles are grown by this margin on every side before the test
+        :return: (query index, box index) arrays of all the overlapping pairs, sorted by query
+        """
+
+        bounds = np.asarray(bounds, dtype="float64").reshape(-1, 4)
+        bounds = bounds + np.array([-margin, -margin, margin, margin])
+
+        query, box = self._candidates(bounds)
+
+        overlap = (self._bounds[box, 0] <= bounds[query, 2]) & (self._bounds[box, 2] >= bounds[query, 0]) & \
+                  (self._bounds[box, 1] <= bounds[query, 3]) & (self._bounds[box, 3] >= bounds[query, 1])
+
+        return query[overlap], box[overlap]
+
+    def query(self, xmin, ymin, xmax, ymax):
+        """
+        :return: sorted array of the boxes overlapping the rectangle
+        """
+
+        _, box = self.query_many([[xmin, ymin, xmax, ymax]])
+        return box
+
+    def query_points(self, points, margin=0):
+        """
+        finds the boxes whose bounds contain each of the points
+        :param points: (M, 2) array of x, y
+        :param margin: bounds are grown by this margin on every side before the test
+        :return: (point index, box index) arrays of all the pairs, sorted by point
+        """
+
+        points = np.asarray(points, dtype="float64").reshape(-1, 2)
+
+        return self.query_many(np.concatenate((points, points), axis=1), margin)
+
+    @property
+    def bounds(self):
+        return self._bounds
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    def __len__(self):
+        return len(self._bounds)
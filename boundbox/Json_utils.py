@@ -0,0 +1,114 @@
+"""
+json encoding of boxes. coordinates are written as flat lists in p1, p2, p3, p4 order
+
+    box     {"box": [x1, y1, x2, y2, x3, y3, x4, y4], "text": "..."}
+    page    {"page": 0, "boxes": [[x1, y1, ..., y4], ...], "texts": ["...", ...], "columns": {...}}
+
+a document (list of pages, as returned by google_ocr_boxes and azure_ocr_boxes) is written as
+json lines with one page per line
+"""
+
+import json
+
+import numpy as np
+
+from .BoundBox_class import BoundBox
+from .BoxArray_class import BoxArray
+
+
+_separators = (',', ':')
+
+
+def _flat_corners(box):
+    return [box.p1.x, box.p1.y, box.p2.x, box.p2.y, box.p3.x, box.p3.y, box.p4.x, box.p4.y]
+
+
+def box_to_json(box):
+    """
+    :param box: BoundBox object
+    :return: json string of the box
+    """
+
+    return json.dumps({'box': _flat_corners(box), 'text': box.text_value or ''},
+                      ensure_ascii=False, separators=_separators)
+
+
+def box_from_json(value):
+    """
+    :param value: json string created by box_to_json
+    :return: BoundBox object
+    """
+
+    record = json.loads(value)
+
+    return BoundBox.create_box(*record['box'], record.get('text', ''))
+
+
+def page_to_json(page, page_number=None, source=None):
+    """
+    encodes all the boxes of a page in a single json object
+    :param page: BoxArray object or list of BoundBox objects
+    :param page_number: optional page number written with the page
+    :param source: optional name of the file the page was read from
+    :return: json string of the page
+    """
+
+    record = {}
+    if source is not None:
+        record['source'] = source
+    if page_number is not None:
+        record['page'] = page_number
+
+    if isinstance(page, BoxArray):
+        record['boxes'] = page.np_array.reshape(-1, 8).tolist()
+        record['texts'] = list(page.texts)
+        if page.columns:
+            record['columns'] = {name: values.tolist() for name, values in page.columns.items()}
+
+    else:
+        record['boxes'] = [_flat_corners(box) for box in page]
+        record['texts'] = [box.text_value or '' for box in page]
+
+    return json.dumps(record, ensure_ascii=False, separators=_separators)
+
+
+def page_from_json(value):
+    """
+    :param value: json string created by page_to_json
+    :return: BoxArray object
+    """
+
+    record = json.loads(value)
+
+    coordinates = np.array(record['boxes'], dtype="int32").reshape(-1, 4, 2)
+
+    return BoxArray(coordinates, record['texts'], record.get('columns'), sort=False)
+
+
+def write_document(pages, f):
+    """
+    writes the pages as json lines, one line for every page
+    :param pages: iterable of pages, each page is a BoxArray or a list of BoundBox objects
+    :param f: file object opened in text mode
+    :return: number of pages written
+    """
+
+    count = 0
+    for page_number, page in enumerate(pages):
+        f.write(page_to_json(page, page_number))
+        f.write('\n')
+        count += 1
+
+    return count
+
+
+def read_document(f):
+    """
+    reads json lines written by write_document one page at a time
+    :param f: file object opened in text mode
+    :return: generator of BoxArray objects
+    """
+
+    for line in f:
+        if line.strip():
+            yield page_from_json(line)
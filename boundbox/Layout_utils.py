@@ -0,0 +1,302 @@
+"""
+hierarchical layout of word boxes. words are grouped into lines and lines into blocks, every level
+is returned as an array of parent indices
+
+    line_ids, block_ids = layout(box_array)
+
+    line_ids[i] is the line of word i and block_ids[j] is the block of line j
+
+grouping is done in a frame rotated by the dominant text angle of the page, so that sloped text is
+grouped along its baseline instead of the image x axis
+"""
+
+import numpy as np
+
+from .BoxArray_class import BoxArray
+from .BoundBox_utils import connected_components
+from .LineArray_class import LineArray
+
+
+def box_angles(coordinates):
+    """
+    angle of the line p4, p3 of every box with respect to the x axis, same as BoundBox.angle
+    :param coordinates: (N, 4, 2) array
+    :return: (N, ) array of angles in radian
+    """
+
+    return LineArray(coordinates[:, 3], coordinates[:, 2]).angle
+
+
+def dominant_angle(box_array):
+    """
+    :param box_array: BoxArray object
+    :return: median text angle of the boxes in radian
+    """
+
+    if not len(box_array):
+        return 0.0
+
+    return float(np.median(box_angles(box_array.np_array)))
+
+
+def normalize_rotation(coordinates, angle):
+    """
+    rotates the coordinates by -angle around the origin so that text at the given angle becomes
+    horizontal
+    :param coordinates: (N, 4, 2) array
+    :param angle: angle in radian
+    :return: (N, 4, 2) float array
+    """
+
+    cos, sin = np.cos(angle), np.sin(angle)
+
+    x = coordinates[..., 0].astype("float64")
+    y = coordinates[..., 1].astype("float64")
+
+    return np.stack((x * cos + y * sin, -x * sin + y * cos), axis=-1)
+
+
+def deskew(box_array, angle=None):
+    """
+    rotates all the boxes around the center of the page so that the text becomes horizontal
+    :param box_array: BoxArray object
+    :param angle: text angle in radian, dominant angle of the boxes if None
+    :return: BoxArray with the rotated boxes, texts and columns are kept
+    """
+
+    if angle is None:
+        angle = dominant_angle(box_array)
+
+    if not len(box_array) or angle == 0:
+        return box_array
+
+    coordinates = box_array.np_array
+    center = (coordinates.reshape(-1, 2).min(axis=0) + coordinates.reshape(-1, 2).max(axis=0)) / 2
+    rotated = normalize_rotation(coordinates - center, angle) + center
+
+    return BoxArray(np.around(rotated), box_array.texts, box_array.columns)
+
+
+def _word_geometry(box_array, angle):
+    """
+    left, right, top, baseline and height of every box in the rotation normalized frame
+    """
+
+    if angle is None:
+        angle = dominant_angle(box_array)
+
+    rotated = normalize_rotation(box_array.np_array, angle)
+
+    left = rotated[:, :, 0].min(axis=1)
+    right = rotated[:, :, 0].max(axis=1)
+    top = (rotated[:, 0, 1] + rotated[:, 1, 1]) / 2
+    baseline = (rotated[:, 2, 1] + rotated[:, 3, 1]) / 2
+    height = np.maximum(baseline - top, 1)
+
+    return left, right, top, baseline, height
+
+
+def group_lines(box_array, angle=None, baseline_tolerance=0.5, dx=1):
+    """
+    groups word boxes into lines. words are sorted by baseline and split into bands wherever the gap
+    between consecutive baselines is larger than baseline_tolerance times the word height, then every
+    band is sorted along the line and split wherever the horizontal gap is larger than dx times the
+    word height
+
+    :param box_array: BoxArray of words
+    :param angle: text angle in radian, dominant angle of the boxes if None
+    :param baseline_tolerance: ratio of the baseline difference to the word height for words on the
+        same line
+    :param dx: ratio of distance between words to the word height, same as in BoundBox.merge_box
+    :return: (N, ) array of line index of every word, lines are numbered top to bottom and left to
+        right
+    """
+
+    count = len(box_array)
+    if not count:
+        return np.zeros(0, dtype="int64")
+
+    left, right, _, baseline, height = _word_geometry(box_array, angle)
+
+    # bands of words with almost the same baseline
+    order = np.argsort(baseline, kind='stable')
+    gaps = np.diff(baseline[order])
+    limit = baseline_tolerance * np.minimum(height[order][1:], height[order][:-1])
+
+    band = np.zeros(count, dtype="int64")
+    band[order] = np.concatenate(([0], np.cumsum(gaps > limit)))
+
+    # inside a band sort along the line, a new line starts when a word is too far from every word on
+    # its left. the running maximum of the right edge is taken per band by offsetting every band
+    order = np.lexsort((left, band))
+    span = right.max() - left.min() + 1
+    offset = band[order] * span
+    running_right = np.maximum.accumulate(right[order] - left.min() + offset) - offset + left.min()
+
+    new_band = np.diff(band[order]) != 0
+    far = left[order][1:] - running_right[:-1] > dx * height[order][1:]
+
+    line = np.zeros(count, dtype="int64")
+    line[order] = np.concatenate(([0], np.cumsum(new_band | far)))
+
+    return line
+
+
+def group_blocks(box_array, line_ids, angle=None, dy=1.0, min_overlap=0.0):
+    """
+    groups lines into blocks. two lines belong to the same block if the vertical gap between them is
+    less than dy times the line height and they overlap horizontally
+
+    :param box_array: BoxArray of words
+    :param line_ids: line index of every word, result of group_lines
+    :param angle: text angle in radian, dominant angle of the boxes if None
+    :param dy: ratio of the gap between lines to the line height
+    :param min_overlap: minimum horizontal overlap as a ratio of the shorter line
+    :return: (L, ) array of block index of every line, blocks are numbered top to bottom
+    """
+
+    line_ids = np.asarray(line_ids)
+    line_count = int(line_ids.max()) + 1 if len(line_ids) else 0
+    if not line_count:
+        return np.zeros(0, dtype="int64")
+
+    left, right, top, baseline, height = _word_geometry(box_array, angle)
+
+    # extent of every line
+    line_left = np.full(line_count, np.inf)
+    line_right = np.full(line_count, -np.inf)
+    line_top = np.full(line_count, np.inf)
+    line_bottom = np.full(line_count, -np.inf)
+    np.minimum.at(line_left, line_ids, left)
+    np.maximum.at(line_right, line_ids, right)
+    np.minimum.at(line_top, line_ids, top)
+    np.maximum.at(line_bottom, line_ids, baseline)
+    line_height = np.maximum(line_bottom - line_top, 1)
+
+    # candidate pairs are the lines whose bottom lies within the allowed gap above the top of a line
+    order = np.argsort(line_bottom, kind='stable')
+    sorted_bottom = line_bottom[order]
+
+    start = np.searchsorted(sorted_bottom, line_top - dy * line_height, side='left')
+    end = np.searchsorted(sorted_bottom, line_bottom, side='left')
+    lengths = np.maximum(end - start, 0)
+
+    lower = np.repeat(np.arange(line_count), lengths)
+    position = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    upper = order[np.repeat(start, lengths) + position]
+
+    overlap = np.minimum(line_right[upper], line_right[lower]) - \
+        np.maximum(line_left[upper], line_left[lower])
+    shorter = np.minimum(line_right[upper] - line_left[upper], line_right[lower] - line_left[lower])
+
+    keep = (upper != lower) & (overlap > min_overlap * shorter)
+
+    blocks = connected_components(line_count, upper[keep], lower[keep])
+
+    # renumber the blocks top to bottom
+    block_top = np.full(blocks.max() + 1, np.inf)
+    np.minimum.at(block_top, blocks, line_top)
+    rank = np.empty(len(block_top), dtype="int64")
+    rank[np.argsort(block_top, kind='stable')] = np.arange(len(block_top))
+
+    return rank[blocks]
+
+
+def layout(box_array, angle=None, baseline_tolerance=0.5, dx=1, dy=1.0):
+    """
+    groups words into lines and lines into blocks
+    :param box_array: BoxArray of words
+    :param angle: text angle in radian, dominant angle of the boxes if None
+    :param baseline_tolerance: see group_lines
+    :param dx: see group_lines
+    :param dy: see group_blocks
+    :return: (line index of every word, block index of every line)
+    """
+
+    if angle is None:
+        angle = dominant_angle(box_array)
+
+    line_ids = group_lines(box_array, angle, baseline_tolerance, dx)
+    block_ids = group_blocks(box_array, line_ids, angle, dy)
+
+    return line_ids, block_ids
+
+
+def _projection_gaps(start, end, min_gap):
+    """
+    empty runs of the projection profile of the intervals [start, end)
+    :return: (gap start, gap end) arrays of the gaps which are at least min_gap wide
+    """
+
+    origin = start.min()
+    length = int(end.max() - origin)
+
+    # coverage of every pixel from a difference array of interval starts and ends
+    coverage = np.cumsum(np.bincount(start - origin, minlength=length + 1) -
+                         np.bincount(end - origin, minlength=length + 1))[:length]
+
+    empty = np.concatenate(([False], coverage == 0, [False]))
+    edges = np.flatnonzero(np.diff(empty.astype("int8")))
+    gap_start, gap_end = edges[0::2], edges[1::2]
+
+    wide = gap_end - gap_start >= min_gap
+
+    return gap_start[wide] + origin, gap_end[wide] + origin
+
+
+def reading_order(box_array, min_gap=1, gap_ratio=0.5):
+    """
+    reading order of the boxes with recursive xy-cut. at every step the region is cut along the
+    widest empty gap of its horizontal and vertical projection profiles, at that gap and every other
+    gap of the same direction which is at least gap_ratio times as wide. regions are read top to bottom
+    and left to right, a region without any gap is read by its top and left edges
+
+    :param box_array: BoxArray object
+    :param min_gap: minimum width of a gap in pixels
+    :param gap_ratio: gaps narrower than this ratio of the widest gap are not cut at the same step
+    :return: permutation array, box_array[order] is in reading order
+    """
+
+    bounds = box_array.bounds.astype("int64")
+    # boxes cover [min, max) pixels along each axis
+    bounds[:, 2:] = np.maximum(bounds[:, 2:], bounds[:, :2])
+
+    result = []
+    stack = [np.arange(len(box_array))]
+
+    while stack:
+        index = stack.pop()
+
+        if len(index) <= 1:
+            result.append(index)
+            continue
+
+        best = None
+        # y axis is checked first, so rows are preferred over columns for gaps of equal width
+        for start_column, end_column in ((1, 3), (0, 2)):
+            gap_start, gap_end = _projection_gaps(bounds[index, start_column], bounds[index, end_column],
+                                                  min_gap)
+            if len(gap_start):
+                width = (gap_end - gap_start).max()
+                if best is None or width > best[0]:
+                    best = (width, start_column, gap_start, gap_end)
+
+        if best is None:
+            leaf_order = np.lexsort((bounds[index, 0], bounds[index, 1]))
+            result.append(index[leaf_order])
+            continue
+
+        width, start_column, gap_start, gap_end = best
+        gap_end = gap_end[gap_end - gap_start >= gap_ratio * width]
+
+        segment = np.searchsorted(gap_end, bounds[index, start_column], side='right')
+        order = np.argsort(segment, kind='stable')
+        boundaries = np.flatnonzero(np.diff(segment[order])) + 1
+
+        # children are pushed in reverse so that the first region is processed first
+        stack.extend(reversed(np.split(index[order], boundaries)))
+
+    if not result:
+        return np.zeros(0, dtype="int64")
+
+    return np.concatenate(result)
@@ -0,0 +1,126 @@
+import numpy as np
+
+from .Line_class import Line
+from .PointArray_class import PointArray
+
+
+class LineArray:
+    """
+    array backed collection of lines, kept as a (N, 2, 2) array of the end points p1 and p2
+
+            p1 -------------------------- p2
+
+    """
+
+    def __init__(self, p1, p2):
+        """
+        :param p1: PointArray or (N, 2) array of the first end points
+        :param p2: PointArray or (N, 2) array of the second end points
+        """
+
+        p1 = p1.np_array if isinstance(p1, PointArray) else np.asarray(p1).reshape(-1, 2)
+        p2 = p2.np_array if isinstance(p2, PointArray) else np.asarray(p2).reshape(-1, 2)
+
+        if len(p1) != len(p2):
+            raise ValueError('number of start points ({}) does not match number of end points '
+                             '({})'.format(len(p1), len(p2)))
+
+        self._lines = np.stack((p1, p2), axis=1)
+
+    @classmethod
+    def from_lines(cls, line_list):
+        """
+        :param line_list: list of Line objects
+        :return: LineArray object
+        """
+
+        array = np.array([line.np_array for line in line_list]).reshape(-1, 2, 2)
+        return cls(array[:, 0], array[:, 1])
+
+    def to_lines(self):
+        return [Line(p1, p2) for p1, p2 in zip(self.p1, self.p2)]
+
+    @property
+    def np_array(self):
+        return self._lines
+
+    @property
+    def p1(self):
+        return PointArray(self._lines[:, 0])
+
+    @property
+    def p2(self):
+        return PointArray(self._lines[:, 1])
+
+    @property
+    def length(self):
+        """
+        :return: (N, ) array of segment lengths
+        """
+
+        return self.p2 - self.p1
+
+    @property
+    def angle(self):
+        """
+        angle of the line from p1 to p2 with respect to the x axis
+        :return: (N, ) array of angles in radian
+        """
+
+        direction = (self._lines[:, 1] - self._lines[:, 0]).astype("float64")
+        return np.arctan2(direction[:, 1], direction[:, 0])
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __getitem__(self, item):
+        """
+        an integer index returns a Line object, anything else returns a new LineArray
+        """
+
+        if isinstance(item, (int, np.integer)):
+            return Line(self.p1[item], self.p2[item])
+
+        lines = self._lines[item]
+        return LineArray(lines[:, 0], lines[:, 1])
+
+    def __repr__(self):
+        return "LineArray({} lines)".format(len(self))
+
+    def __mul__(self, other):
+        """
+        elementwise intersection of the (infinite) lines, same as Line.__mul__ for every pair of lines
+        but without rounding and without raising for parallel lines
+        :param other: LineArray of the same length
+        :return: (PointArray of intersections, boolean array which is True for parallel lines).
+            intersections of parallel lines are nan
+        """
+
+        return self.intersection(other)
+
+    def intersection(self, other):
+        """
+        see __mul__
+        """
+
+        line_1 = self._lines.astype("float64")
+        line_2 = other.np_array.astype("float64")
+
+        d1 = line_1[:, 0] - line_1[:, 1]
+        d2 = line_2[:, 0] - line_2[:, 1]
+
+        det = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+        parallel = det == 0
+
+        # determinants of the end points of every line
+        c1 = line_1[:, 0, 0] * line_1[:, 1, 1] - line_1[:, 0, 1] * line_1[:, 1, 0]
+        c2 = line_2[:, 0, 0] * line_2[:, 1, 1] - line_2[:, 0, 1] * line_2[:, 1, 0]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = (c1 * d2[:, 0] - c2 * d1[:, 0]) / det
+            y = (c1 * d2[:, 1] - c2 * d1[:, 1]) / det
+
+        x[parallel] = np.nan
+        y[parallel] = np.nan
+
+        return PointArray(np.stack((x, y), axis=1)), parallel
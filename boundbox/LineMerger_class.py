@@ -0,0 +1,106 @@
+from .BoundBox_class import BoundBox
+
+
+class StreamingLineMerger:
+    """
+    incremental version of BoundBox.merge_box for boxes arriving roughly from top to bottom, e.g.
+    straight from a streaming ocr parser. only the lines that can still grow are kept in memory and a
+    line is emitted as soon as the incoming boxes are below it
+
+        merger = StreamingLineMerger()
+        for box in boxes:
+            for line in merger.push(box):
+                print(line.text_value)
+
+        for line in merger.flush():
+            print(line.text_value)
+    """
+
+    def __init__(self, dx=1, slack=0.5, max_open_lines=None):
+        """
+        :param dx: ratio of distance between boxes to the height of text box, same as in merge_box
+        :param slack: how far above the bottom of a line a box may still arrive, as a ratio of the line
+            height. a line is finished when a box starts lower than its bottom plus this margin
+        :param max_open_lines: maximum number of open lines, the oldest line is emitted when the limit
+            is crossed. None for no limit
+        """
+
+        self._dx = dx
+        self._slack = slack
+        self._max_open_lines = max_open_lines
+
+        self._open_lines = []
+
+    @staticmethod
+    def _top(box):
+        return min(box.p1.y, box.p2.y)
+
+    @staticmethod
+    def _bottom(box):
+        return max(box.p3.y, box.p4.y)
+
+    def _is_finished(self, line, top):
+        height = self._bottom(line) - self._top(line)
+        return top > self._bottom(line) + self._slack * height
+
+    def push(self, box):
+        """
+        adds a box to the open lines
+        :param box: BoundBox object
+        :return: list of lines which are finished, sorted by p1.y
+        """
+
+        top = self._top(box)
+
+        finished = [line for line in self._open_lines if self._is_finished(line, top)]
+        if finished:
+            self._open_lines = [line for line in self._open_lines if not self._is_finished(line, top)]
+
+        for index, line in enumerate(self._open_lines):
+
+            # the box can be on the right side of the line or, if it arrived late, on its left side
+            if BoundBox.compare_box_horizontally(line, box, self._dx):
+                self._open_lines[index] = BoundBox.horizontal_merge(line, box)
+                break
+
+            if BoundBox.compare_box_horizontally(box, line, self._dx):
+                self._open_lines[index] = BoundBox.horizontal_merge(box, line)
+                break
+
+        else:
+            self._open_lines.append(box)
+
+        if self._max_open_lines is not None and len(self._open_lines) > self._max_open_lines:
+            finished.append(self._open_lines.pop(0))
+
+        finished.sort(key=lambda k: k.p1.y)
+
+        return finished
+
+    def flush(self):
+        """
+        finishes all the open lines
+        :return: list of lines sorted by p1.y
+        """
+
+        finished = sorted(self._open_lines, key=lambda k: k.p1.y)
+        self._open_lines = []
+
+        return finished
+
+    def merge(self, boxes):
+        """
+        merges an iterable of boxes lazily
+        :param boxes: iterable of BoundBox objects
+        :return: generator of merged lines
+        """
+
+        for box in boxes:
+            for line in self.push(box):
+                yield line
+
+        for line in self.flush():
+            yield line
+
+    def __len__(self):
+        return len(self._open_lines)
@@ -0,0 +1,231 @@
+import re
+import string
+import bisect
+
+import numpy as np
+
+from .BoxArray_class import BoxArray
+from .GridIndex_class import GridIndex
+
+# numbers like 1,234.50 -12 or 3.5 with an optional currency symbol
+NUMBER_PATTERN = r'[-+]?[$€£₹]?[-+]?\d[\d,]*(\.\d+)?'
+
+# punctuation removed from both ends of a token, signs and currency are kept for numbers
+_strip_characters = string.punctuation.replace('$', '').replace('-', '').replace('+', '')
+
+
+def normalize_tokens(text):
+    """
+    splits a text value into lower case tokens without the surrounding punctuation,
+    'Total:' becomes 'total' and '-$12.50,' becomes '-$12.50'
+    :param text: text value of a box
+    :return: list of tokens
+    """
+
+    tokens = (token.strip(_strip_characters) for token in (text or '').casefold().split())
+    return [token for token in tokens if token]
+
+
+class PageIndex:
+    """
+    text and spatial index over the boxes of a page for key value lookups
+
+        index = PageIndex(box_array)
+        for key, value in index.find_values('total', direction='right', pattern=NUMBER_PATTERN):
+            print(box_array[value].text_value)
+
+    the text index maps every normalized token to the boxes containing it, the spatial index is a
+    GridIndex over the bounds of the boxes
+    """
+
+    directions = ('right', 'left', 'below', 'above')
+
+    def __init__(self, box_array, cell_size=None):
+        """
+        :param box_array: BoxArray or list of BoundBox objects
+        :param cell_size: cell size of the spatial index, see GridIndex
+        """
+
+        if not isinstance(box_array, BoxArray):
+            box_array = BoxArray.from_boxes(box_array)
+
+        self._boxes = box_array
+        self._bounds = box_array.bounds.astype("float64")
+        self._grid = GridIndex(self._bounds, cell_size)
+
+        postings = {}
+        for box_id, text in enumerate(box_array.texts):
+            for token in normalize_tokens(text):
+                postings.setdefault(token, []).append(box_id)
+
+        self._postings = {token: np.unique(ids) for token, ids in postings.items()}
+        self._vocabulary = sorted(self._postings)
+
+        # results of find_regex, the vocabulary does not change so every pattern is scanned once
+        self._regex_results = {}
+
+    @property
+    def boxes(self):
+        return self._boxes
+
+    @property
+    def grid(self):
+        return self._grid
+
+    def _merge(self, tokens):
+        if not tokens:
+            return np.zeros(0, dtype="int64")
+        return np.unique(np.concatenate([self._postings[token] for token in tokens]))
+
+    def _mask(self, ids):
+        mask = np.zeros(len(self._boxes), dtype=bool)
+        mask[ids] = True
+        return mask
+
+    def find(self, text):
+        """
+        boxes containing all the tokens of the text
+        :param text: text to search, normalized the same way as the box texts
+        :return: sorted array of box indices
+        """
+
+        result = None
+        for token in normalize_tokens(text):
+            ids = self._postings.get(token, np.zeros(0, dtype="int64"))
+            result = ids if result is None else np.intersect1d(result, ids, assume_unique=True)
+
+        return result if result is not None else np.zeros(0, dtype="int64")
+
+    def find_prefix(self, prefix):
+        """
+        boxes containing a token starting with the prefix
+        :param prefix: prefix of a token
+        :return: sorted array of box indices
+        """
+
+        prefix = prefix.casefold()
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + '\U0010ffff')
+
+        return self._merge(self._vocabulary[start:end])
+
+    def find_regex(self, pattern):
+        """
+        boxes containing a token which fully matches the regular expression. the pattern is matched
+        against the normalized tokens, so it should be written in lower case
+        :param pattern: regular expression string or compiled pattern
+        :return: sorted array of box indices
+        """
+
+        if pattern not in self._regex_results:
+            compiled = re.compile(pattern)
+            self._regex_results[pattern] = self._merge([token for token in self._vocabulary
+                                                        if compiled.fullmatch(token)])
+
+        return self._regex_results[pattern]
+
+    def within(self, xmin, ymin, xmax, ymax):
+        """
+        :return: sorted array of the boxes overlapping the rectangle
+        """
+
+        return self._grid.query(xmin, ymin, xmax, ymax)
+
+    def nearest(self, box_id, direction='right', max_distance=None, candidates=None, tolerance=0.5):
+        """
+        nearest box in a direction from a box. for 'right' and 'left' the box has to overlap the
+        vertical span of the anchor box grown by tolerance times its height, for 'below' and 'above'
+        the horizontal span grown by tolerance times its height
+
+        :param box_id: index of the anchor box
+        :param direction: one of 'right', 'left', 'below', 'above'
+        :param max_distance: largest gap between the boxes, no limit if None
+        :param candidates: array of box indices or boolean mask of the boxes allowed as result, e.g.
+            result of find_regex
+        :param tolerance: ratio of the anchor height by which the span is grown
+        :return: index of the nearest box or None
+        """
+
+        if direction not in self.directions:
+            raise ValueError('direction should be one of {} not {}'.format(self.directions, direction))
+
+        xmin, ymin, xmax, ymax = self._bounds[box_id]
+        margin = tolerance * (ymax - ymin)
+        reach = np.inf if max_distance is None else max_distance
+
+        # search rectangle in the direction, clipped to the page by the grid
+        if direction == 'right':
+            rect = (xmax, ymin - margin, xmax + reach, ymax + margin)
+        elif direction == 'left':
+            rect = (xmin - reach, ymin - margin, xmin, ymax + margin)
+        elif direction == 'below':
+            rect = (xmin - margin, ymax, xmax + margin, ymax + reach)
+        else:
+            rect = (xmin - margin, ymin - reach, xmax + margin, ymin)
+
+        rect = np.clip(rect, -1e12, 1e12)
+        ids = self._grid.query(*rect)
+        ids = ids[ids != box_id]
+
+        if candidates is not None:
+            candidates = np.asarray(candidates)
+            if candidates.dtype != bool:
+                candidates = self._mask(candidates)
+            ids = ids[candidates[ids]]
+
+        if not len(ids):
+            return None
+
+        bounds = self._bounds[ids]
+        center = (bounds[:, :2] + bounds[:, 2:]) / 2
+
+        # the box has to lie on that side of the anchor and overlap the grown span, boxes only touching
+        # the span are left out. distance is the gap between the edges
+        if direction in ('right', 'left'):
+            overlap = (bounds[:, 3] > ymin - margin) & (bounds[:, 1] < ymax + margin)
+        else:
+            overlap = (bounds[:, 2] > xmin - margin) & (bounds[:, 0] < xmax + margin)
+
+        if direction == 'right':
+            valid, gap = center[:, 0] > xmax, bounds[:, 0] - xmax
+        elif direction == 'left':
+            valid, gap = center[:, 0] < xmin, xmin - bounds[:, 2]
+        elif direction == 'below':
+            valid, gap = center[:, 1] > ymax, bounds[:, 1] - ymax
+        else:
+            valid, gap = center[:, 1] < ymin, ymin - bounds[:, 3]
+
+        valid &= overlap
+
+        gap = np.maximum(gap, 0)
+        valid &= gap <= reach
+
+        if not valid.any():
+            return None
+
+        return int(ids[valid][np.argmin(gap[valid])])
+
+    def find_values(self, key, direction='right', pattern=None, max_distance=None, tolerance=0.5):
+        """
+        finds the boxes matching the key and the nearest value box for each of them
+
+        :param key: text of the key, e.g. 'total'
+        :param direction: direction of the value from the key, see nearest
+        :param pattern: regular expression the value token has to match, e.g. NUMBER_PATTERN
+        :param max_distance: largest gap between key and value
+        :param tolerance: see nearest
+        :return: list of (key box index, value box index) tuples, keys without a value are left out
+        """
+
+        candidates = self._mask(self.find_regex(pattern)) if pattern is not None else None
+
+        results = []
+        for key_id in self.find(key):
+            value_id = self.nearest(key_id, direction, max_distance, candidates, tolerance)
+            if value_id is not None:
+                results.append((int(key_id), value_id))
+
+        return results
+
+    def __len__(self):
+        return len(self._boxes)
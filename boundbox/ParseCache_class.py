@@ -0,0 +1,207 @@
+import os
+import json
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from .BoundBox_class import BoundBox
+from .BoxArray_class import BoxArray, EncodedTexts
+from .BoundBox_utils import tesseract_tsv_to_dict
+
+
+def _parse_google(raw, **options):
+    return BoundBox.google_ocr_boxes(json.loads(raw), **options)
+
+
+def _parse_azure(raw, **options):
+    return BoundBox.azure_ocr_boxes(json.loads(raw), **options)
+
+
+def _parse_tesseract(raw, **options):
+    # a single image gives a single page
+    return [BoundBox.pytesseract_boxes(json.loads(raw), **options)]
+
+
+def _parse_tesseract_tsv(raw, **options):
+    text = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+    return [BoundBox.pytesseract_boxes(tesseract_tsv_to_dict(text), **options)]
+
+
+class ParseCache:
+    """
+    disk cache of parsed ocr responses. the cache key is the hash of the raw response bytes, the
+    parser and its options, so a response that was already parsed is loaded from disk instead of
+    decoding the json and creating the boxes again
+
+        cache = ParseCache('.boundbox_cache', max_bytes=2**30)
+        pages = cache.parse(raw_bytes, 'google')
+
+    every entry is a single uncompressed npz file with the same columns as BoxStore. the least
+    recently used entries are removed when the size of the cache goes above max_bytes
+    """
+
+    parsers = {
+        'google': _parse_google,
+        'azure': _parse_azure,
+        'tesseract': _parse_tesseract,
+        'tesseract-tsv': _parse_tesseract_tsv,
+    }
+
+    version = 1
+
+    def __init__(self, directory, max_bytes=2**30):
+        """
+        :param directory: directory where the cache entries are kept, created if it does not exist
+        :param max_bytes: maximum size of all the entries together
+        """
+
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+        # entries of previous runs are ordered by their last use
+        entries = []
+        for name in os.listdir(directory):
+            if name.endswith('.npz'):
+                stat = os.stat(os.path.join(directory, name))
+                entries.append((stat.st_mtime, name[:-4], stat.st_size))
+
+        self._entries = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._size = sum(self._entries.values())
+
+    def key(self, raw, parser, **options):
+        """
+        :param raw: raw response as bytes or str
+        :param parser: name of the parser
+        :param options: keyword arguments of the parser
+        :return: hex digest identifying the parsed result
+        """
+
+        if isinstance(raw, str):
+            raw = raw.encode('utf-8')
+
+        digest = hashlib.sha256(raw)
+        digest.update(json.dumps([self.version, parser, sorted(options.items())]).encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self._directory, key + '.npz')
+
+    def parse(self, raw, parser, **options):
+        """
+        parses the raw ocr response, the result is loaded from the cache if the same response was
+        parsed before with the same options
+        :param raw: raw response as bytes or str, json for google, azure and tesseract (pytesseract
+            dict output) and tsv for tesseract-tsv
+        :param parser: one of 'google', 'azure', 'tesseract', 'tesseract-tsv'
+        :param options: keyword arguments passed to the parser, e.g. merge_line=True for azure
+        :return: list of BoxArray, one for each page
+        """
+
+        if parser not in self.parsers:
+            raise ValueError('unknown parser {}, use one of {}'.format(parser, sorted(self.parsers)))
+
+        key = self.key(raw, parser, **options)
+
+        if key in self._entries:
+            try:
+                pages = self._load(key)
+            except (OSError, ValueError, KeyError):
+                # entry was removed or corrupted by another process, parse it again
+                self._remove(key)
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                os.utime(self._path(key))
+                return pages
+
+        self.misses += 1
+
+        pages = [BoxArray.from_boxes(page) for page in self.parsers[parser](raw, **options)]
+        self._store(key, pages)
+
+        return pages
+
+    def _load(self, key):
+        with np.load(self._path(key), allow_pickle=False) as entry:
+            coordinates = entry['coordinates']
+            page_offsets = entry['page_offsets']
+            text = entry['text']
+            text_offsets = entry['text_offsets']
+
+        pages = []
+        for start, end in zip(page_offsets[:-1], page_offsets[1:]):
+            texts = list(EncodedTexts(text, text_offsets[start:end + 1]))
+            pages.append(BoxArray(coordinates[start:end], texts, sort=False))
+
+        return pages
+
+    def _store(self, key, pages):
+        page_offsets = np.zeros(len(pages) + 1, dtype="int64")
+        np.cumsum([len(page) for page in pages], out=page_offsets[1:])
+
+        if pages:
+            coordinates = np.concatenate([page.np_array for page in pages])
+        else:
+            coordinates = np.zeros((0, 4, 2), dtype="int32")
+
+        texts = EncodedTexts.encode([text for page in pages for text in page.texts])
+
+        path = self._path(key)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            np.savez(f, coordinates=coordinates, page_offsets=page_offsets, text=texts.buffer,
+                     text_offsets=texts.offsets)
+        os.replace(temp_path, path)
+
+        size = os.path.getsize(path)
+        self._entries[key] = size
+        self._size += size
+
+        self._evict()
+
+    def _remove(self, key):
+        self._size -= self._entries.pop(key)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        while self._size > self._max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def clear(self):
+        for key in list(self._entries):
+            self._remove(key)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': len(self._entries),
+            'bytes': self._size,
+        }
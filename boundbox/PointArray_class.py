@@ -0,0 +1,99 @@
+import numpy as np
+
+from .Point_class import Point
+
+
+class PointArray:
+    """
+    array backed collection of 2-D points, kept as a single (N, 2) array of x, y
+
+            .(x0, y0)      .(x1, y1)      .(x2, y2)
+
+    """
+
+    def __init__(self, points):
+        """
+        :param points: array like of shape (N, 2)
+        """
+
+        self._points = np.asarray(points).reshape(-1, 2)
+
+    @classmethod
+    def from_points(cls, point_list):
+        """
+        :param point_list: list of Point objects
+        :return: PointArray object
+        """
+
+        return cls([[point.x, point.y] for point in point_list])
+
+    def to_points(self):
+        return [self[i] for i in range(len(self))]
+
+    @property
+    def np_array(self):
+        return self._points
+
+    @property
+    def x(self):
+        return self._points[:, 0]
+
+    @property
+    def y(self):
+        return self._points[:, 1]
+
+    def __len__(self):
+        return len(self._points)
+
+    def __getitem__(self, item):
+        """
+        an integer index returns a Point object, anything else returns a new PointArray
+        """
+
+        if isinstance(item, (int, np.integer)):
+            x, y = self._points[item].tolist()
+            return Point(x, y)
+
+        return PointArray(self._points[item])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return "PointArray({} points)".format(len(self))
+
+    def __sub__(self, other):
+        """
+        elementwise Euclidean distance, same as Point.__sub__ for every pair of points
+        :param other: PointArray of the same length or a single Point
+        :return: (N, ) array of distances
+        """
+
+        return self.distance(other)
+
+    def distance(self, other):
+        """
+        elementwise Euclidean distance
+        :param other: PointArray of the same length or a single Point
+        :return: (N, ) array of distances
+        """
+
+        if isinstance(other, Point):
+            other = np.array([[other.x, other.y]])
+        elif isinstance(other, PointArray):
+            other = other.np_array
+
+        return np.hypot(*(self._points - other).astype("float64").T)
+
+    def pairwise_distance(self, other=None):
+        """
+        Euclidean distance between every point of this array and every point of the other
+        :param other: PointArray, this array if None
+        :return: (N, M) array of distances
+        """
+
+        other = self if other is None else other
+        difference = (self._points[:, None, :] - other.np_array[None, :, :]).astype("float64")
+
+        return np.hypot(difference[..., 0], difference[..., 1])
@@ -0,0 +1,190 @@
+"""
+opt in call counters and timers for the hot paths of the package
+
+    with profile() as stats:
+        pages = BoundBox.google_ocr_boxes(data)
+        lines = BoundBox.merge_box(pages[0])
+
+    print(stats())      # {'BoundBox.compare_box_horizontally': {'calls': 1225, 'seconds': 0.012}, ...}
+
+profiling can also be switched on for the whole process with the environment variable
+BOUNDBOX_PROFILE=1, then snapshot() gives the totals. the timed functions are swapped into the classes
+only while profiling is on, so the disabled state has no cost at all. times are cumulative, a call
+inside another timed call is counted in both
+"""
+
+import os
+import time
+import threading
+import functools
+from contextlib import contextmanager
+
+from .BoundBox_class import BoundBox
+from .BoxArray_class import BoxArray
+
+ENVIRONMENT_VARIABLE = 'BOUNDBOX_PROFILE'
+
+# (class, attribute) of every timed function
+HOT_PATHS = [
+    (BoundBox, '__init__'),
+    (BoundBox, 'create_box'),
+    (BoundBox, 'create_box_from_corners'),
+    (BoundBox, 'sort_corners'),
+    (BoundBox, 'compare_box_horizontally'),
+    (BoundBox, 'horizontal_merge'),
+    (BoundBox, 'merge_box'),
+    (BoundBox, 'perspective_wrap'),
+    (BoundBox, 'crop_image'),
+    (BoundBox, 'google_ocr_boxes'),
+    (BoundBox, 'azure_ocr_boxes'),
+    (BoundBox, 'pytesseract_boxes'),
+    (BoundBox, 'labelimg_xml_boxes'),
+    (BoxArray, '__init__'),
+    (BoxArray, 'from_boxes'),
+    (BoxArray, 'sort_corners'),
+    (BoxArray, 'reduce_by_label'),
+    (BoxArray, 'iou'),
+]
+
+_lock = threading.Lock()
+_counters = {}
+_sinks = []
+_originals = {}
+_depth = 0
+
+
+def _timed(name, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            with _lock:
+                counter = _counters.get(name)
+                if counter is None:
+                    counter = _counters[name] = [0, 0.0]
+                counter[0] += 1
+                counter[1] += seconds
+            for sink in tuple(_sinks):
+                sink(name, seconds)
+
+    return wrapper
+
+
+def _install():
+    for owner, attribute in HOT_PATHS:
+        name = '{}.{}'.format(owner.__name__, attribute)
+
+        # the raw class attribute keeps classmethod and staticmethod wrappers
+        original = owner.__dict__[attribute]
+        _originals[name] = (owner, attribute, original)
+
+        if isinstance(original, classmethod):
+            replacement = classmethod(_timed(name, original.__func__))
+        elif isinstance(original, staticmethod):
+            replacement = staticmethod(_timed(name, original.__func__))
+        else:
+            replacement = _timed(name, original)
+
+        setattr(owner, attribute, replacement)
+
+
+def _uninstall():
+    for owner, attribute, original in _originals.values():
+        setattr(owner, attribute, original)
+    _originals.clear()
+
+
+def is_enabled():
+    return _depth > 0
+
+
+def enable(sink=None):
+    """
+    starts profiling, calls to enable and disable can be nested
+    :param sink: optional callable sink(name, seconds) called after every timed call
+    """
+
+    global _depth
+
+    with _lock:
+        if sink is not None:
+            _sinks.append(sink)
+        if _depth == 0:
+            _install()
+        _depth += 1
+
+
+def disable(sink=None):
+    """
+    stops profiling started by the matching enable call, counters are kept until reset
+    :param sink: the sink passed to the matching enable call
+    """
+
+    global _depth
+
+    with _lock:
+        if sink is not None and sink in _sinks:
+            _sinks.remove(sink)
+        if _depth == 0:
+            return
+        _depth -= 1
+        if _depth == 0:
+            _uninstall()
+
+
+def snapshot():
+    """
+    :return: dict of function name to {'calls': number of calls, 'seconds': cumulative time}
+    """
+
+    with _lock:
+        return {name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in _counters.items()}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+
+
+@contextmanager
+def profile(sink=None):
+    """
+    profiles the calls made inside the with block
+    :param sink: optional callable sink(name, seconds) called after every timed call
+    :return: function returning the snapshot of the calls made since the block started, after the
+        block it returns the calls made inside the block
+    """
+
+    before = snapshot()
+    final = []
+    enable(sink)
+
+    def stats():
+        if final:
+            return final[0]
+
+        result = {}
+        for name, counter in snapshot().items():
+            earlier = before.get(name, {'calls': 0, 'seconds': 0.0})
+            if counter['calls'] > earlier['calls']:
+                result[name] = {'calls': counter['calls'] - earlier['calls'],
+                                'seconds': counter['seconds'] - earlier['seconds']}
+        return result
+
+    try:
+        yield stats
+    finally:
+        disable(sink)
+        final.append(stats())
+
+
+def enable_from_environment():
+    """
+    enables profiling if the environment variable BOUNDBOX_PROFILE is set to anything but '' or '0'
+    """
+
+    if os.environ.get(ENVIRONMENT_VARIABLE, '') not in ('', '0') and not is_enabled():
+        enable()
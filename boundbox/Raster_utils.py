@@ -0,0 +1,291 @@
+"""
+rasterization of box collections into masks and density maps, e.g. for training segmentation models
+or text density heatmaps
+
+    labels = label_mask(page, image.shape)                  # index of the box at every pixel, -1 elsewhere
+    mask = binary_mask(page, image.shape, scale=0.25)       # 0 / 255 mask at a quarter of the resolution
+    density = density_map(page, image.shape, scale=1 / 32)  # text coverage of every 32 x 32 cell
+
+coverage_count, binary_mask and density_map draw all the boxes together instead of one cv2.fillPoly
+call per box. every box adds its value at the corners of a difference image, rotated boxes at the ends
+of one span per row they cross, and a single cv2.integral call fills them all. the output is allocated
+at the target resolution only, so a downsampled mask never needs the full size one. a pixel belongs to
+a box if its center is inside the box, the same pixels as BoundBox.crop_image for axis aligned boxes.
+boxes are filled as convex quads
+
+label_mask has to keep the later box where boxes overlap, which a sum can not do cheaply, and opencv
+fills a single value per call, so it draws the boxes one after the other. it is no faster than a loop
+of cv2.fillPoly calls, it adds the scale and the pixels of axis aligned boxes, which are filled as
+rectangles with the same pixels as above. rotated boxes are filled with cv2.fillPoly, whose pixels
+along the edges of the box can differ
+"""
+
+import cv2
+import numpy as np
+
+from .BoxArray_class import BoxArray
+
+# fractional bits of the corners passed to opencv
+_SHIFT = 4
+
+
+def _quads(boxes, scale):
+    """
+    :return: ((N, 4, 2) float array of corners at the target resolution, (N, ) axis aligned flags)
+    """
+
+    if not isinstance(boxes, BoxArray):
+        boxes = BoxArray.from_boxes(boxes)
+
+    return boxes.np_array.astype("float64") * scale, boxes.is_axis_aligned
+
+
+def _target_shape(shape, scale):
+    """
+    :param shape: shape of the full size image, (height, width) or (height, width, channels)
+    :return: (height, width) at the target resolution
+    """
+
+    return max(int(round(shape[0] * scale)), 1), max(int(round(shape[1] * scale)), 1)
+
+
+def _row_spans(quads, height, sample='center'):
+    """
+    cuts every quad into horizontal spans, one for each row of pixels it crosses
+
+    :param quads: (N, 4, 2) float array of corners at the target resolution
+    :param height: number of rows of the output
+    :param sample: 'center' for the rows whose center is inside the quad, 'cover' for every row the quad
+        touches, the span of a row is then taken at the center of the row clipped to the quad
+    :return: (box index, row, left x, right x, fraction of the row covered by the quad) arrays
+    """
+
+    ymin = quads[:, :, 1].min(axis=1)
+    ymax = quads[:, :, 1].max(axis=1)
+
+    if sample == 'center':
+        first = np.ceil(ymin - 0.5)
+        last = np.floor(ymax - 0.5)
+    else:
+        first = np.floor(ymin)
+        last = np.ceil(ymax) - 1
+
+    first = np.clip(first, 0, height).astype("int64")
+    last = np.clip(last, -1, height - 1).astype("int64")
+    lengths = np.maximum(last - first + 1, 0)
+
+    box = np.repeat(np.arange(len(quads)), lengths)
+    row = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths) + np.repeat(first, lengths)
+
+    y = np.clip(row + 0.5, ymin[box], ymax[box])
+
+    # crossings of the scanline with the four edges, edges which do not reach the line are ignored
+    start = quads[box]
+    end = np.roll(quads, -1, axis=1)[box]
+    dy = end[:, :, 1] - start[:, :, 1]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (y[:, None] - start[:, :, 1]) / dy
+    crosses = (dy != 0) & (t >= 0) & (t <= 1)
+    x = start[:, :, 0] + np.where(crosses, t, 0) * (end[:, :, 0] - start[:, :, 0])
+
+    # a line through a horizontal edge or a single corner still has the corners on it
+    on_line = start[:, :, 1] == y[:, None]
+    left = np.minimum(np.where(crosses, x, np.inf).min(axis=1),
+                      np.where(on_line, start[:, :, 0], np.inf).min(axis=1))
+    right = np.maximum(np.where(crosses, x, -np.inf).max(axis=1),
+                       np.where(on_line, start[:, :, 0], -np.inf).max(axis=1))
+
+    covered = np.minimum(ymax[box], row + 1) - np.maximum(ymin[box], row)
+
+    valid = left <= right
+    return box[valid], row[valid], left[valid], right[valid], covered[valid]
+
+
+def _pixel_spans(quads, height, width):
+    """
+    :return: (box index, row, first column, last column) of the spans with at least one pixel
+    """
+
+    box, row, left, right, _ = _row_spans(quads, height)
+
+    # centers on an edge are inside, the tolerance covers the rounding of the edge crossings
+    first = np.clip(np.ceil(left - 0.5 - 1e-9), 0, width).astype("int64")
+    last = np.clip(np.floor(right - 0.5 + 1e-9), -1, width - 1).astype("int64")
+
+    valid = first <= last
+    return box[valid], row[valid], first[valid], last[valid]
+
+
+def _aligned_rectangles(quads, height, width):
+    """
+    pixels of axis aligned quads
+    :return: (first row, first column, end row, end column) arrays, ends are exclusive
+    """
+
+    first_row = np.clip(np.ceil(quads[:, 0, 1] - 0.5), 0, height).astype("int64")
+    end_row = np.clip(np.floor(quads[:, 2, 1] - 0.5) + 1, 0, height).astype("int64")
+    first_column = np.clip(np.ceil(quads[:, 0, 0] - 0.5), 0, width).astype("int64")
+    end_column = np.clip(np.floor(quads[:, 2, 0] - 0.5) + 1, 0, width).astype("int64")
+
+    return first_row, first_column, end_row, end_column
+
+
+def _pixel_rectangles(quads, aligned, height, width):
+    """
+    every axis aligned box as one rectangle of pixels and every other box as one rectangle for each
+    row it crosses
+    :return: (box index, first row, first column, end row, end column) arrays, ends are exclusive
+    """
+
+    first_row, first_column, end_row, end_column = _aligned_rectangles(quads[aligned], height, width)
+
+    rotated = np.flatnonzero(~aligned)
+    box, row, first, last = _pixel_spans(quads[rotated], height, width)
+
+    rectangles = (np.concatenate((np.flatnonzero(aligned), rotated[box])),
+                  np.concatenate((first_row, row)), np.concatenate((first_column, first)),
+                  np.concatenate((end_row, row + 1)), np.concatenate((end_column, last + 1)))
+
+    valid = (rectangles[1] < rectangles[3]) & (rectangles[2] < rectangles[4])
+    return tuple(values[valid] for values in rectangles)
+
+
+def _draw(rectangles, values, height, width, dtype="float32"):
+    """
+    sum of the values of the boxes covering every pixel. a rectangle adds its value at its top left and
+    bottom right corners and subtracts it at the other two, the integral image of these corners is the
+    sum. float32 is exact while the sums stay below 2 ** 24
+    :param rectangles: result of _pixel_rectangles
+    :param values: value of every box or a single value for all of them
+    :return: (height, width) array of dtype
+    """
+
+    box, first_row, first_column, end_row, end_column = rectangles
+
+    values = np.asarray(values, dtype=dtype)
+    values = values[box] if values.ndim else np.full(len(box), values, dtype=dtype)
+
+    rows = np.concatenate((first_row, first_row, end_row, end_row))
+    columns = np.concatenate((first_column, end_column, first_column, end_column))
+    values = np.concatenate((values, -values, -values, values))
+
+    # corners on the far edges are outside the image and change nothing inside it
+    inside = (rows < height) & (columns < width)
+
+    corners = np.zeros((height, width), dtype=dtype)
+    np.add.at(corners.reshape(-1), rows[inside] * width + columns[inside], values[inside])
+
+    depth = cv2.CV_32F if corners.dtype == np.float32 else cv2.CV_64F
+
+    return cv2.integral(corners, sdepth=depth)[1:, 1:]
+
+
+def coverage_count(boxes, shape, scale=1.0):
+    """
+    :param boxes: BoxArray or list of BoundBox objects
+    :param shape: shape of the full size image, (height, width) or (height, width, channels)
+    :param scale: ratio of the output resolution to the image resolution
+    :return: (height, width) int32 array of the number of boxes covering every pixel
+    """
+
+    height, width = _target_shape(shape, scale)
+    quads, aligned = _quads(boxes, scale)
+
+    return _draw(_pixel_rectangles(quads, aligned, height, width), 1, height, width).astype("int32")
+
+
+def binary_mask(boxes, shape, scale=1.0, value=255):
+    """
+    :param boxes: BoxArray or list of BoundBox objects
+    :param shape: shape of the full size image, (height, width) or (height, width, channels)
+    :param scale: ratio of the output resolution to the image resolution
+    :param value: value of the pixels inside any box
+    :return: (height, width) uint8 mask, value inside the boxes and 0 elsewhere
+    """
+
+    height, width = _target_shape(shape, scale)
+    quads, aligned = _quads(boxes, scale)
+
+    mask = (_draw(_pixel_rectangles(quads, aligned, height, width), 1, height, width) > 0).view("uint8")
+    if value != 1:
+        mask *= np.uint8(value)
+
+    return mask
+
+
+def label_mask(boxes, shape, scale=1.0, background=-1):
+    """
+    :param boxes: BoxArray or list of BoundBox objects
+    :param shape: shape of the full size image, (height, width) or (height, width, channels)
+    :param scale: ratio of the output resolution to the image resolution
+    :param background: value of the pixels outside all the boxes
+    :return: (height, width) int32 array of the index of the box at every pixel, where boxes overlap
+        the later box is kept, same as drawing them in order
+    """
+
+    height, width = _target_shape(shape, scale)
+    quads, aligned = _quads(boxes, scale)
+
+    mask = np.full((height, width), background, dtype="int32")
+
+    rectangles = [None] * len(quads)
+    for i, rectangle in zip(np.flatnonzero(aligned).tolist(),
+                            np.stack(_aligned_rectangles(quads[aligned], height, width), axis=1).tolist()):
+        rectangles[i] = rectangle
+
+    # opencv takes fixed point corners with _SHIFT fractional bits and puts pixel centers on integers
+    polygons = np.around((quads - 0.5) * 2 ** _SHIFT).astype("int32")
+
+    for i, (polygon, rectangle) in enumerate(zip(polygons, rectangles)):
+        if rectangle is None:
+            cv2.fillPoly(mask, [polygon], i, cv2.LINE_8, _SHIFT)
+        else:
+            mask[rectangle[0]:rectangle[2], rectangle[1]:rectangle[3]] = i
+
+    return mask
+
+
+def density_map(boxes, shape, scale=1.0, integral=False):
+    """
+    fraction of every pixel of the output covered by the boxes, boxes smaller than a pixel still add
+    their area. exact for axis aligned boxes, rotated boxes are sampled at the center of every row
+    :param boxes: BoxArray or list of BoundBox objects
+    :param shape: shape of the full size image, (height, width) or (height, width, channels)
+    :param scale: ratio of the output resolution to the image resolution, e.g. 1 / 32 for the text
+        coverage of 32 x 32 cells
+    :param integral: return the integral image instead, integral[y, x] is the sum of density[:y, :x]
+    :return: (height, width) float32 array, overlapping boxes add up, or (height + 1, width + 1) float64
+        integral image
+    """
+
+    height, width = _target_shape(shape, scale)
+    quads, _ = _quads(boxes, scale)
+    _, row, left, right, covered = _row_spans(quads, height, sample='cover')
+
+    left = np.clip(left, 0, width)
+    right = np.clip(right, 0, width)
+
+    # coverage of the span in cell j is min(right, j + 1) - max(left, j). as steps: the partial cells at
+    # both ends get their fraction and the running sum adds 1 for every cell from ceil(left) to
+    # floor(right), which also gives right - left when both ends are in the same cell
+    full_start = np.ceil(left).astype("int64")
+    full_end = np.floor(right).astype("int64")
+    size = height * (width + 2)
+    offset = row * (width + 2)
+
+    steps = np.bincount(offset + full_start, covered, minlength=size) - \
+        np.bincount(offset + full_end, covered, minlength=size)
+    steps = np.cumsum(steps.reshape(height, width + 2), axis=1)
+
+    partial = np.bincount(offset + np.floor(left).astype("int64"), (full_start - left) * covered, minlength=size) + \
+        np.bincount(offset + full_end, (right - full_end) * covered, minlength=size)
+
+    density = (steps + partial.reshape(height, width + 2))[:, :width]
+
+    if integral:
+        result = np.zeros((height + 1, width + 1), dtype="float64")
+        result[1:, 1:] = density.cumsum(axis=0).cumsum(axis=1)
+        return result
+
+    return density.astype("float32")
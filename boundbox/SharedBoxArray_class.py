@@ -0,0 +1,207 @@
+import sys
+import atexit
+from multiprocessing import shared_memory, resource_tracker
+
+import numpy as np
+
+from .BoxArray_class import BoxArray, EncodedTexts
+
+# segments created by this process which are not unlinked yet, removed at exit
+_owned_segments = {}
+
+
+def _align(offset):
+    return (offset + 7) // 8 * 8
+
+
+def _layout(handle):
+    """
+    byte offsets of the columns inside the shared memory segment
+
+        coordinates | text offsets | extra columns | text
+    """
+
+    count = handle['count']
+
+    offsets = {}
+    position = 0
+    for name, dtype, length in [('coordinates', "int32", count * 8), ('text_offsets', "int64", count + 1)] + \
+            [('column_' + name, dtype, count) for name, dtype in handle['columns']] + \
+            [('text', "uint8", handle['text_bytes'])]:
+        offsets[name] = (position, np.dtype(dtype), length)
+        position = _align(position + np.dtype(dtype).itemsize * length)
+
+    return offsets, max(position, 1)
+
+
+def _attach_segment(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # before python 3.13 attaching registers the segment with the resource tracker of the attaching
+    # process, which unlinks it when that process exits while the owner is still using it
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+@atexit.register
+def _unlink_owned_segments():
+    for segment in list(_owned_segments.values()):
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+    _owned_segments.clear()
+
+
+class SharedBoxArray:
+    """
+    box array placed in a shared memory segment. the process that creates it owns the segment,
+    other processes attach to it with the handle and read the coordinates and texts without copying
+
+        with SharedBoxArray.create(box_array) as shared:
+            pool.map(work, [(shared.handle, page) for page in pages])
+
+        def work(args):
+            handle, page = args
+            with SharedBoxArray.attach(handle) as shared:
+                boxes = shared.boxes
+
+    a SharedBoxArray can also be pickled directly, only the handle is pickled and the receiving
+    process attaches to the segment. the owner unlinks the segment when it is closed and any segment
+    that is still alive is unlinked when the owner process exits
+    """
+
+    def __init__(self, segment, handle, owner):
+        self._segment = segment
+        self._handle = handle
+        self._owner = owner
+        self._boxes = None
+
+    @classmethod
+    def create(cls, box_array):
+        """
+        copies the box array into a new shared memory segment
+        :param box_array: BoxArray object
+        :return: SharedBoxArray object owning the segment
+        """
+
+        texts = box_array.texts
+        if not isinstance(texts, EncodedTexts):
+            texts = EncodedTexts.encode(texts)
+
+        text = texts.buffer[texts.offsets[0]:texts.offsets[-1]]
+
+        handle = {
+            'name': None,
+            'count': len(box_array),
+            'text_bytes': len(text),
+            'columns': [(name, values.dtype.str) for name, values in box_array.columns.items()],
+        }
+
+        offsets, size = _layout(handle)
+
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        handle['name'] = segment.name
+        _owned_segments[segment.name] = segment
+
+        shared = cls(segment, handle, owner=True)
+
+        values = {'coordinates': box_array.np_array.reshape(-1), 'text': text,
+                  'text_offsets': texts.offsets - texts.offsets[0]}
+        values.update({'column_' + name: column for name, column in box_array.columns.items()})
+
+        for name, array in shared._arrays(offsets).items():
+            array[:] = values[name]
+
+        return shared
+
+    @classmethod
+    def attach(cls, handle):
+        """
+        attaches to a segment created by another process
+        :param handle: handle of the SharedBoxArray
+        :return: SharedBoxArray object
+        """
+
+        return cls(_attach_segment(handle['name']), handle, owner=False)
+
+    def _arrays(self, offsets=None):
+        if offsets is None:
+            offsets, _ = _layout(self._handle)
+
+        return {name: np.ndarray((length, ), dtype=dtype, buffer=self._segment.buf, offset=position)
+                for name, (position, dtype, length) in offsets.items()}
+
+    @property
+    def handle(self):
+        return self._handle
+
+    @property
+    def name(self):
+        return self._handle['name']
+
+    @property
+    def boxes(self):
+        """
+        box array whose coordinates, texts and columns are views of the shared memory
+        :return: BoxArray object
+        """
+
+        if self._segment is None:
+            raise ValueError('shared box array is closed')
+
+        if self._boxes is None:
+            arrays = self._arrays()
+            texts = EncodedTexts(arrays['text'], arrays['text_offsets'])
+            columns = {name: arrays['column_' + name] for name, _ in self._handle['columns']}
+
+            self._boxes = BoxArray(arrays['coordinates'].reshape(-1, 4, 2), texts, columns, sort=False)
+
+        return self._boxes
+
+    def close(self):
+        """
+        closes the mapping of this process. every array taken from boxes has to be released before
+        closing, the segment itself is only removed by unlink
+        """
+
+        self._boxes = None
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def unlink(self):
+        """
+        removes the segment, only allowed for the owner
+        """
+
+        if not self._owner:
+            raise PermissionError('only the process that created the shared box array can unlink it')
+
+        segment = _owned_segments.pop(self.name, None)
+        if segment is not None:
+            segment.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self.close()
+        finally:
+            if self._owner:
+                self.unlink()
+
+    def __len__(self):
+        return self._handle['count']
+
+    def __reduce__(self):
+        return self.attach, (self._handle, )
+
+    def __repr__(self):
+        return "SharedBoxArray({}, {} boxes)".format(self.name, len(self))
@@ -0,0 +1,90 @@
+"""
+recovery of the row and column structure of a table from the word boxes inside it
+
+    rows, columns, cells = table_grid(box_array, region=table_box)
+
+rows and columns are found with 1-D gap analysis, so the whole grid costs a few sorts of the words
+"""
+
+import numpy as np
+
+from .BoxArray_class import BoxArray
+
+
+def _gap_clusters(values, gap):
+    """
+    clusters sorted 1-D values wherever two consecutive values are more than gap apart
+    :return: cluster index of every value, clusters are numbered in increasing order of values
+    """
+
+    order = np.argsort(values, kind='stable')
+    clusters = np.zeros(len(values), dtype="int64")
+    clusters[order] = np.concatenate(([0], np.cumsum(np.diff(values[order]) > gap)))
+
+    return clusters
+
+
+def _interval_clusters(start, end, gap):
+    """
+    clusters intervals [start, end] which overlap or are less than gap apart
+    :return: cluster index of every interval, clusters are numbered in increasing order of position
+    """
+
+    order = np.argsort(start, kind='stable')
+    running_end = np.maximum.accumulate(end[order])
+
+    clusters = np.zeros(len(start), dtype="int64")
+    clusters[order] = np.concatenate(([0], np.cumsum(start[order][1:] - running_end[:-1] > gap)))
+
+    return clusters
+
+
+def table_grid(box_array, region=None, row_gap=0.5, column_gap=1.0):
+    """
+    assigns every word box inside the region to a table row and column. rows are clusters of the y of
+    the word centroids, split where consecutive centroids are more than row_gap times the median word
+    height apart. columns are clusters of the horizontal extents of the words, split where there is an
+    empty gap wider than column_gap times the median word height. a word spanning two columns joins
+    them, so region should exclude headers spanning several columns
+
+    :param box_array: BoxArray of words
+    :param region: BoundBox of the table or None to use all the boxes. boxes whose centroid lies
+        outside the axis aligned bounds of the region are left out
+    :param row_gap: ratio of the gap between row centroids to the word height
+    :param column_gap: ratio of the gap between columns to the word height
+    :return: (row of every box, column of every box, BoxArray of cells). boxes outside the region
+        get -1 as row and column. cells are the extents of the words in every occupied cell, with the
+        cell position in the columns 'row' and 'col'
+    """
+
+    count = len(box_array)
+    rows = np.full(count, -1, dtype="int64")
+    columns = np.full(count, -1, dtype="int64")
+
+    centroids = box_array.centroids
+    bounds = box_array.bounds
+
+    inside = np.ones(count, dtype=bool)
+    if region is not None:
+        xmin, ymin = region.np_array.min(axis=0)
+        xmax, ymax = region.np_array.max(axis=0)
+        inside = (centroids[:, 0] >= xmin) & (centroids[:, 0] <= xmax) & \
+                 (centroids[:, 1] >= ymin) & (centroids[:, 1] <= ymax)
+
+    index = np.flatnonzero(inside)
+    if not len(index):
+        return rows, columns, BoxArray(np.zeros((0, 4, 2)), columns={'row': [], 'col': []}, sort=False)
+
+    height = np.median(bounds[index, 3] - bounds[index, 1])
+
+    rows[index] = _gap_clusters(centroids[index, 1], row_gap * height)
+    columns[index] = _interval_clusters(bounds[index, 0], bounds[index, 2], column_gap * height)
+
+    column_count = columns.max() + 1
+    cells = box_array[index].reduce_by_label(rows[index] * column_count + columns[index])
+
+    labels = cells.columns['label']
+    cells = BoxArray(cells.np_array, cells.texts, {'row': labels // column_count, 'col': labels % column_count},
+                     sort=False)
+
+    return rows, columns, cells
@@ -0,0 +1,185 @@
+"""
+ocr of very large images in overlapping tiles
+
+    windows = tile_windows(width, height, tile_size=4096, overlap=256)
+    results = [BoundBox.pytesseract_boxes(image_to_data(tile, output_type=Output.DICT))
+               for tile in crop_tiles(image, windows)]
+    page = stitch_tiles(results, windows)
+
+words lying in the overlap of two tiles are read by both of them, and words crossing a tile edge are
+read cut in one tile and whole in the next. stitch_tiles keeps one box for every such word, only the
+boxes inside the seam bands (the overlaps of the windows) are compared
+"""
+
+import numpy as np
+
+from .BoxArray_class import BoxArray
+from .GridIndex_class import GridIndex
+from .BoundBox_utils import connected_components
+
+
+def _starts(length, tile_size, step):
+    last = max(length - tile_size, 0)
+    return np.unique(np.minimum(np.arange(0, last + step, step), last))
+
+
+def tile_windows(width, height, tile_size=2048, overlap=128):
+    """
+    overlapping tile windows covering an image, the last row and column are moved back so that no
+    tile crosses the border of the image
+    :param width: width of the image
+    :param height: height of the image
+    :param tile_size: width and height of a tile
+    :param overlap: minimum overlap of neighbouring tiles, should be larger than the widest word
+    :return: (T, 4) int array of x0, y0, x1, y1 of every tile, row by row
+    """
+
+    if overlap >= tile_size:
+        raise ValueError('overlap ({}) should be smaller than tile_size ({})'.format(overlap, tile_size))
+
+    step = tile_size - overlap
+    x0 = _starts(width, tile_size, step)
+    y0 = _starts(height, tile_size, step)
+
+    x0, y0 = np.meshgrid(x0, y0)
+    x0, y0 = x0.ravel(), y0.ravel()
+
+    return np.stack((x0, y0, np.minimum(x0 + tile_size, width), np.minimum(y0 + tile_size, height)), axis=1)
+
+
+def crop_tiles(image, windows):
+    """
+    :param image: image as numpy array
+    :param windows: result of tile_windows
+    :return: generator of the tiles, views of the image
+    """
+
+    for x0, y0, x1, y1 in windows:
+        yield image[y0:y1, x0:x1]
+
+
+def offset_boxes(tile_results, windows):
+    """
+    moves the boxes of every tile to page coordinates with one vectorized offset
+    :param tile_results: list of BoxArray objects or lists of BoundBox objects, one for every window
+    :param windows: result of tile_windows
+    :return: BoxArray of all the boxes in page coordinates, the window of every box is kept in the
+        column 'tile'
+    """
+
+    windows = np.asarray(windows)
+    if len(tile_results) != len(windows):
+        raise ValueError('number of tile results ({}) does not match number of windows '
+                         '({})'.format(len(tile_results), len(windows)))
+
+    tiles = [boxes if isinstance(boxes, BoxArray) else BoxArray.from_boxes(boxes) for boxes in tile_results]
+    tile = np.repeat(np.arange(len(tiles)), [len(boxes) for boxes in tiles])
+
+    if not len(tile):
+        return BoxArray(np.zeros((0, 4, 2)), columns={'tile': tile}, sort=False)
+
+    coordinates = np.concatenate([boxes.np_array for boxes in tiles]) + windows[tile, None, :2]
+    texts = [text for boxes in tiles for text in boxes.texts]
+
+    return BoxArray(coordinates, texts, {'tile': tile}, sort=False)
+
+
+def seam_bands(windows):
+    """
+    :param windows: result of tile_windows
+    :return: (S, 4) array of x0, y0, x1, y1 of the overlap of every pair of overlapping windows
+    """
+
+    windows = np.asarray(windows, dtype="float64")
+    first, second = GridIndex(windows).query_many(windows)
+    pair = first < second
+    first, second = first[pair], second[pair]
+
+    bands = np.concatenate((np.maximum(windows[first, :2], windows[second, :2]),
+                            np.minimum(windows[first, 2:], windows[second, 2:])), axis=1)
+
+    return bands[(bands[:, 2] > bands[:, 0]) & (bands[:, 3] > bands[:, 1])]
+
+
+def stitch_tiles(tile_results, windows, min_overlap=0.5, edge_margin=2, mode='merge'):
+    """
+    boxes of all the tiles in page coordinates with one box for every word read by several tiles.
+    two boxes of different tiles inside a seam band are the same word if their intersection is at
+    least min_overlap of the smaller box. of every group of such boxes the box which is not cut by an
+    inner tile edge and has the largest area is kept
+
+    :param tile_results: list of BoxArray objects or lists of BoundBox objects, one for every window
+    :param windows: result of tile_windows
+    :param min_overlap: minimum intersection of duplicates as a ratio of the area of the smaller box
+    :param edge_margin: boxes closer than this to an edge of their tile which is not an image border
+        are taken as cut by the edge
+    :param mode: 'suppress' to keep the chosen box as it is or 'merge' to grow it to the extent of
+        its whole group, which joins the parts of a word split at a seam
+    :return: BoxArray in page coordinates with the column 'tile'
+    """
+
+    if mode not in ('merge', 'suppress'):
+        raise ValueError("mode should be either 'merge' or 'suppress' not {}".format(mode))
+
+    windows = np.asarray(windows)
+    boxes = offset_boxes(tile_results, windows)
+    bands = seam_bands(windows)
+
+    if not len(boxes) or not len(bands):
+        return boxes
+
+    bounds = boxes.bounds.astype("float64")
+    tile = boxes.columns['tile']
+
+    # only the boxes touching a seam band can have a duplicate
+    box_ids, _ = GridIndex(bands).query_many(bounds)
+    seam = np.unique(box_ids)
+    if not len(seam):
+        return boxes
+    seam_bounds = bounds[seam]
+
+    first, second = GridIndex(seam_bounds).query_many(seam_bounds)
+    pair = (first < second) & (tile[seam[first]] != tile[seam[second]])
+    first, second = first[pair], second[pair]
+
+    intersection = np.prod(np.maximum(np.minimum(seam_bounds[first, 2:], seam_bounds[second, 2:]) -
+                                      np.maximum(seam_bounds[first, :2], seam_bounds[second, :2]), 0), axis=1)
+    area = np.prod(np.maximum(seam_bounds[:, 2:] - seam_bounds[:, :2], 1), axis=1)
+    duplicate = intersection >= min_overlap * np.minimum(area[first], area[second])
+
+    groups = connected_components(len(seam), first[duplicate], second[duplicate])
+
+    # a box is cut if it reaches an edge of its tile that lies inside the image
+    page = np.concatenate((windows[:, :2].min(axis=0), windows[:, 2:].max(axis=0)))
+    window = windows[tile[seam]]
+    inner = (window[:, :2] > page[:2], window[:, 2:] < page[2:])
+    cut = ((seam_bounds[:, :2] - window[:, :2] <= edge_margin) & inner[0]).any(axis=1) | \
+          ((window[:, 2:] - seam_bounds[:, 2:] <= edge_margin) & inner[1]).any(axis=1)
+
+    order = np.lexsort((-area, cut, groups))
+    best = order[np.concatenate(([True], np.diff(groups[order]) != 0))]
+
+    keep = np.ones(len(boxes), dtype=bool)
+    keep[seam] = False
+    keep[seam[best]] = True
+
+    coordinates = boxes.np_array.copy()
+    if mode == 'merge':
+        group_count = len(best)
+        minimum = np.full((group_count, 2), np.inf)
+        maximum = np.full((group_count, 2), -np.inf)
+        np.minimum.at(minimum, groups, seam_bounds[:, :2])
+        np.maximum.at(maximum, groups, seam_bounds[:, 2:])
+
+        grown = groups[best]
+        x0, y0 = minimum[grown, 0], minimum[grown, 1]
+        x1, y1 = maximum[grown, 0], maximum[grown, 1]
+        merged = np.stack((np.stack((x0, y0), axis=1), np.stack((x1, y0), axis=1),
+                           np.stack((x1, y1), axis=1), np.stack((x0, y1), axis=1)), axis=1)
+
+        single = np.bincount(groups, minlength=group_count)[grown] == 1
+        coordinates[seam[best[~single]]] = merged[~single]
+
+    index = np.flatnonzero(keep)
+
+    return BoxArray(coordinates[index], [boxes.texts[i] for i in index], {'tile': tile[index]}, sort=False)
@@ -1,3 +1,18 @@
 from .BoundBox_class import BoundBox
 from .Point_class import Point
 from .Line_class import Line
+from .BoxArray_class import BoxArray
+from .BoxStore_class import BoxStore
+from .ParseCache_class import ParseCache
+from .SharedBoxArray_class import SharedBoxArray
+from .LineMerger_class import StreamingLineMerger
+from .GridIndex_class import GridIndex
+from .PageIndex_class import PageIndex
+from .PointArray_class import PointArray
+from .LineArray_class import LineArray
+from .AsyncParser_class import AsyncParser
+from .CropCache_class import CropCache
+from .BoxTracker_class import BoxTracker
+
+from . import Profiling_utils as _profiling
+_profiling.enable_from_environment()
@@ -0,0 +1,277 @@
+"""
+batch conversion of ocr results and labelImg annotations
+
+    python -m boundbox 'responses/*.json' --format google --steps merge,sort --output lines.jsonl
+    python -m boundbox 'labels/**/*.xml' --format labelimg --output store --output-format store --resume
+
+files are converted on a process pool and written by the main process as soon as they are done. the
+files which are completely written are recorded in <output>.progress, with --resume these files are
+skipped and anything written after the last of them is cut from the output
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from multiprocessing import Pool
+
+from .BoundBox_class import BoundBox
+from .BoxArray_class import BoxArray
+from .BoxStore_class import BoxStore
+from .BoundBox_utils import tesseract_tsv_to_dict
+from .Document_utils import STEPS, split_pages, parse_page, process_page
+from .Json_utils import page_to_json
+
+FORMATS = ('google', 'azure', 'tesseract-tsv', 'labelimg')
+
+
+def read_pages(path, source_format):
+    """
+    :param path: path of the input file
+    :param source_format: one of FORMATS
+    :return: list of pages, each a list of BoundBox objects
+    """
+
+    if source_format == 'labelimg':
+        return [BoundBox.labelimg_xml_boxes(path)]
+
+    if source_format == 'tesseract-tsv':
+        with open(path, 'r', encoding='utf-8') as f:
+            return [BoundBox.pytesseract_boxes(tesseract_tsv_to_dict(f.read()))]
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    return [parse_page(page, source_format) for page in split_pages(data, source_format)]
+
+
+def convert_file(arguments):
+    """
+    reads and post processes all the pages of a file, run on the worker processes
+    :param arguments: (path, source format, steps, dx)
+    :return: (path, list of BoxArray objects or None, error message or None)
+    """
+
+    path, source_format, steps, dx = arguments
+
+    try:
+        pages = [BoxArray.from_boxes(process_page(boxes, steps, dx=dx))
+                 for boxes in read_pages(path, source_format)]
+    except Exception as err:
+        return path, None, '{}: {}'.format(type(err).__name__, err)
+
+    return path, pages, None
+
+
+class JsonLinesWriter:
+    """
+    writes every page as a json line with the name of its file, see Json_utils.page_to_json
+    """
+
+    def __init__(self, path, position=None):
+        self._file = open(path, 'r+b' if position is not None else 'wb')
+        if position is not None:
+            self._file.truncate(position)
+            self._file.seek(position)
+
+    def write(self, source, pages):
+        for page_number, page in enumerate(pages):
+            self._file.write(page_to_json(page, page_number, source).encode('utf-8'))
+            self._file.write(b'\n')
+        self._file.flush()
+
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+class StoreWriter:
+    """
+    appends every page to a BoxStore
+    """
+
+    def __init__(self, path, position=None):
+        self._store = BoxStore(path)
+        if position is not None:
+            self._store.truncate(position)
+
+    def write(self, source, pages):
+        for page in pages:
+            self._store.append(page)
+
+        return self._store.page_count
+
+    def close(self):
+        pass
+
+
+def read_progress(path):
+    """
+    :param path: path of the progress file
+    :return: (set of finished files, output position after the last finished file or None, size of the
+        file up to the end of the last complete record)
+    """
+
+    finished = set()
+    position = None
+    end = 0
+
+    if not os.path.exists(path):
+        return finished, position, end
+
+    with open(path, 'rb') as f:
+        for line in f:
+            # the last line of an interrupted run can be cut anywhere, even right before its newline
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line.decode('utf-8'))
+            except ValueError:
+                break
+            finished.add(record['file'])
+            position = record['position']
+            end += len(line)
+
+    return finished, position, end
+
+
+def expand_inputs(patterns):
+    """
+    :param patterns: list of glob patterns, ** matches any number of directories
+    :return: sorted list of unique file paths
+    """
+
+    paths = set()
+    for pattern in patterns:
+        paths.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+
+    return sorted(paths)
+
+
+class Progress:
+    """
+    progress and throughput report on a stream, written at most every interval seconds. nothing is
+    written if the stream is None
+    """
+
+    def __init__(self, total, stream=sys.stderr, interval=0.5):
+        self.total = total
+        self.files = 0
+        self.failed = 0
+        self.pages = 0
+        self.boxes = 0
+
+        self._stream = stream
+        self._interval = interval
+        self._start = time.perf_counter()
+        self._last = 0.0
+
+    def update(self, pages):
+        self.files += 1
+        if pages is None:
+            self.failed += 1
+        else:
+            self.pages += len(pages)
+            self.boxes += sum(len(page) for page in pages)
+
+        now = time.perf_counter()
+        if now - self._last >= self._interval or self.files == self.total:
+            self._last = now
+            self.report(end='\r')
+
+    def report(self, end='\n'):
+        if self._stream is None:
+            return
+
+        elapsed = max(time.perf_counter() - self._start, 1e-9)
+        self._stream.write('{}/{} files  {} pages  {} boxes  {} failed  {:.1f} files/s  {:.0f} boxes/s{}'.format(
+            self.files, self.total, self.pages, self.boxes, self.failed, self.files / elapsed,
+            self.boxes / elapsed, end))
+        self._stream.flush()
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m boundbox', description='batch conversion of ocr results')
+    parser.add_argument('inputs', nargs='+', help='input files or glob patterns')
+    parser.add_argument('--format', required=True, choices=FORMATS, help='format of the input files')
+    parser.add_argument('--steps', default='',
+                        help='comma separated processing steps, any of {}'.format(', '.join(STEPS)))
+    parser.add_argument('--dx', type=float, default=1, help='dx of merge_box')
+    parser.add_argument('--output', required=True, help='output json lines file or store directory')
+    parser.add_argument('--output-format', default='jsonl', choices=('jsonl', 'store'))
+    parser.add_argument('--workers', type=int, default=None, help='worker processes, 1 to run inline')
+    parser.add_argument('--chunksize', type=int, default=4, help='files sent to a worker at once')
+    parser.add_argument('--resume', action='store_true', help='continue an interrupted conversion')
+    parser.add_argument('--quiet', action='store_true', help='do not report progress')
+
+    arguments = parser.parse_args(argv)
+
+    arguments.steps = tuple(step for step in arguments.steps.split(',') if step)
+    for step in arguments.steps:
+        if step not in STEPS:
+            parser.error('unknown step {}, steps should be any of {}'.format(step, ', '.join(STEPS)))
+
+    if os.path.exists(arguments.output) and not arguments.resume:
+        parser.error('output {} exists, use --resume to continue or remove it'.format(arguments.output))
+
+    return arguments
+
+
+def main(argv=None):
+    """
+    :param argv: command line arguments, sys.argv[1:] if None
+    :return: exit code, 1 if any file failed
+    """
+
+    arguments = parse_arguments(argv)
+    progress_path = arguments.output + '.progress'
+
+    # without an existing output there is nothing to resume
+    finished, position = set(), None
+    if arguments.resume and os.path.exists(arguments.output):
+        finished, position, end = read_progress(progress_path)
+        position = position or 0
+
+        # new records are appended after the last complete one, not glued to a cut line
+        if os.path.exists(progress_path):
+            os.truncate(progress_path, end)
+
+    paths = [path for path in expand_inputs(arguments.inputs) if path not in finished]
+
+    writer_class = JsonLinesWriter if arguments.output_format == 'jsonl' else StoreWriter
+    writer = writer_class(arguments.output, position)
+
+    progress = Progress(len(paths), stream=None if arguments.quiet else sys.stderr)
+    tasks = ((path, arguments.format, arguments.steps, arguments.dx) for path in paths)
+
+    pool = Pool(arguments.workers) if arguments.workers != 1 and len(paths) > 1 else None
+    results = pool.imap_unordered(convert_file, tasks, arguments.chunksize) if pool else map(convert_file, tasks)
+
+    try:
+        with open(progress_path, 'w' if position is None else 'a', encoding='utf-8') as progress_file:
+            for path, pages, error in results:
+                if error is not None:
+                    if not arguments.quiet:
+                        sys.stderr.write('\nfailed {}: {}\n'.format(path, error))
+                else:
+                    # the file is recorded only after all its pages are written
+                    position = writer.write(path, pages)
+                    progress_file.write(json.dumps({'file': path, 'position': position}) + '\n')
+                    progress_file.flush()
+
+                progress.update(pages)
+    finally:
+        writer.close()
+        if pool is not None:
+            pool.terminate()
+
+    progress.report()
+
+    return 1 if progress.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
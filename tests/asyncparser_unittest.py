@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import asyncio
+import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.AsyncParser_class import AsyncParser
+
+samples = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_samples')
+
+
+class SlowJob:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.most_running = 0
+
+    def __call__(self):
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.google_path = os.path.join(samples, 'google_ocr', 'good_text.json')
+        with open(self.google_path, 'rb') as f:
+            self.raw = f.read()
+
+    def test_parse(self):
+        async def run():
+            async with AsyncParser('process', max_workers=2) as parser:
+                pages = await parser.parse(self.raw, 'google', steps=('merge', ))
+                from_file = await parser.parse_file(self.google_path, 'google', steps=('merge', ))
+                return pages, from_file
+
+        pages, from_file = asyncio.run(run())
+
+        expected = BoundBox.merge_box(BoundBox.google_ocr_boxes(json.loads(self.raw))[0])
+        self.assertEqual(list(pages[0].texts), [box.text_value for box in expected])
+        self.assertEqual(list(from_file[0].texts), list(pages[0].texts))
+
+    def test_parse_files(self):
+        paths = [self.google_path] * 10 + ['missing.json']
+
+        async def run():
+            parser = AsyncParser(ThreadPoolExecutor(2), max_pending=3)
+            results = []
+            async for path, pages in parser.parse_files(iter(paths), 'google'):
+                # never more jobs in flight than the limit
+                self.assertLessEqual(parser.pending, 3)
+                results.append((path, pages))
+            return results
+
+        results = asyncio.run(run())
+        self.assertEqual(len(results), 11)
+        errors = [pages for path, pages in results if path == 'missing.json']
+        self.assertIsInstance(errors[0], FileNotFoundError)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(AsyncParser('thread').parse(self.raw, 'unknown'))
+
+    def test_cancel(self):
+        async def run():
+            parser = AsyncParser('thread', max_workers=1, max_pending=1)
+            first = asyncio.ensure_future(parser.parse(self.raw, 'google'))
+            # waits for the slot held by the first job and is cancelled there
+            second = asyncio.ensure_future(parser.parse(self.raw, 'google'))
+            await asyncio.sleep(0)
+            second.cancel()
+
+            pages = await first
+            with self.assertRaises(asyncio.CancelledError):
+                await second
+
+            parser.close()
+            return pages, parser.pending
+
+        pages, pending = asyncio.run(run())
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pending, 0)
+
+    def test_cancel_running_jobs(self):
+        job = SlowJob()
+
+        async def run():
+            parser = AsyncParser(ThreadPoolExecutor(8), max_pending=2)
+            for _ in range(5):
+                tasks = [asyncio.ensure_future(parser._run(job)) for _ in range(4)]
+                await asyncio.sleep(0.01)
+                # the jobs already running keep their slots until they finish
+                for task in tasks:
+                    task.cancel()
+                self.assertLessEqual(parser.pending, 2)
+
+            await parser._run(job)
+            return parser.pending
+
+        self.assertEqual(asyncio.run(run()), 0)
+        self.assertLessEqual(job.most_running, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+import pickle
+import unittest
+from multiprocessing.reduction import ForkingPickler
+
+import numpy as np
+import cv2
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray, EncodedTexts
+from boundbox.Point_class import Point
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_sort_corners(self):
+        arrays = [[[4, 2], [2, 4], [8, 6], [6, 8]],
+                  [[4, 2], [2, 4], [8, 6], [6, 9]],
+                  [[429, 48], [113, 96], [129, 415], [430, 423]],
+                  [[2, 2], [2, 4], [6, 2], [6, 4]]]
+
+        box_array = BoxArray(arrays)
+
+        for array, sorted_array in zip(arrays, box_array.np_array):
+            box = BoundBox.box_from_array(array)
+            self.assertListEqual(box.np_array.tolist(), sorted_array.tolist())
+
+    def test_from_boxes(self):
+        box_list = [BoundBox.box_from_array([[0, 0], [2, 0], [2, 2], [0, 2]]),
+                    BoundBox.box_from_array([[2, 0], [6, 0], [6, 3], [2, 3]])]
+        box_list[0].text_value = 'hello'
+        box_list[1].text_value = 'world'
+
+        box_array = BoxArray.from_boxes(box_list)
+
+        self.assertEqual(len(box_array), 2)
+        self.assertListEqual(box_array.texts, ['hello', 'world'])
+        self.assertListEqual(box_array[1].np_array.tolist(), [[2, 0], [6, 0], [6, 3], [2, 3]])
+        self.assertEqual(box_array[1].text_value, 'world')
+        self.assertListEqual(box_array.area.tolist(), [4, 12])
+        self.assertListEqual(box_array.bounds.tolist(), [[0, 0, 2, 2], [2, 0, 6, 3]])
+
+        sub_array = box_array[np.array([False, True])]
+        self.assertEqual(len(sub_array), 1)
+        self.assertListEqual(sub_array.texts, ['world'])
+
+    def test_centroids(self):
+        arrays = [[[100, 100], [500, 100], [500, 500], [100, 500]],
+                  [[107, 95], [352, 117], [420, 615], [80, 590]],
+                  [[4, 2], [2, 4], [8, 6], [6, 9]]]
+
+        centroids = BoxArray(arrays).centroids
+
+        for array, centroid in zip(arrays, centroids):
+            box = BoundBox.box_from_array(array)
+            self.assertEqual(round(centroid[0]), box.centroid.x)
+            self.assertEqual(round(centroid[1]), box.centroid.y)
+
+    def test_from_bounds(self):
+        box_array = BoxArray.from_bounds([[0, 0, 10, 5], [20, 30, 25, 40]], ['a', 'b'], {'score': [1, 2]})
+
+        self.assertListEqual(box_array.np_array[1].tolist(), [[20, 30], [25, 30], [25, 40], [20, 40]])
+        self.assertListEqual(box_array.bounds.tolist(), [[0, 0, 10, 5], [20, 30, 25, 40]])
+        self.assertListEqual(box_array.texts, ['a', 'b'])
+        self.assertEqual(len(BoxArray.from_bounds([])), 0)
+
+    def test_from_contours(self):
+        img = np.zeros((300, 300), dtype="uint8")
+        cv2.rectangle(img, (10, 10), (110, 50), 255, -1)
+        cv2.circle(img, (200, 200), 40, 255, -1)
+        cv2.rectangle(img, (10, 200), (14, 290), 255, -1)
+        cv2.rectangle(img, (250, 20), (252, 22), 255, -1)
+
+        contours, _ = cv2.findContours(img, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+
+        box_array, rejected = BoxArray.from_contours(contours, min_area=100, max_aspect_ratio=10)
+
+        # tiny square is rejected by area and the thin bar by aspect ratio
+        self.assertEqual(len(rejected), 4)
+        self.assertEqual(rejected.sum(), 2)
+        self.assertEqual(len(box_array), 2)
+
+        bounds = sorted(box_array.bounds.tolist())
+        self.assertListEqual(bounds[0], [10, 10, 110, 50])
+
+        # circle is fitted with the minimum area rectangle
+        xmin, ymin, xmax, ymax = bounds[1]
+        self.assertAlmostEqual((xmin + xmax) / 2, 200, delta=2)
+        self.assertAlmostEqual((ymin + ymax) / 2, 200, delta=2)
+
+        # a single pixel and a straight line have no area and are rejected without any limit
+        degenerate = [np.array([[[5, 5]]]), np.array([[[0, 0]], [[10, 0]], [[20, 0]], [[10, 0]]]), contours[0]]
+        box_array, rejected = BoxArray.from_contours(degenerate)
+        self.assertListEqual(rejected.tolist(), [True, True, False])
+        self.assertTrue((box_array.area > 0).all())
+
+    def test_reduce_by_label(self):
+        box_array = BoxArray([[[60, 0], [100, 0], [100, 20], [60, 20]],
+                              [[0, 2], [50, 2], [50, 22], [0, 22]],
+                              [[0, 50], [30, 50], [30, 70], [0, 70]]],
+                             ['world', 'hello', 'again'])
+
+        lines = box_array.reduce_by_label([4, 4, 7])
+
+        self.assertListEqual(lines.texts, ['hello world', 'again'])
+        self.assertListEqual(lines.columns['label'].tolist(), [4, 7])
+        self.assertListEqual(lines.np_array[0].tolist(), [[0, 0], [100, 0], [100, 22], [0, 22]])
+
+        # texts are joined in the given order
+        lines = box_array.reduce_by_label([4, 4, 7], order=[1, 0, 0])
+        self.assertEqual(lines.texts[0], 'hello world')
+        lines = box_array.reduce_by_label([4, 4, 7], order=[0, 1, 0])
+        self.assertEqual(lines.texts[0], 'world hello')
+
+        # rotated rectangle of a sloped line
+        sloped = BoxArray([[[0, 0], [40, 10], [35, 30], [-5, 20]], [[50, 12], [90, 22], [85, 42], [45, 32]]])
+        rotated = sloped.reduce_by_label([0, 0], mode='rotated')
+        self.assertAlmostEqual(rotated[0].angle, np.arctan2(10, 40), places=1)
+        self.assertLess(rotated.area[0], sloped.reduce_by_label([0, 0]).area[0])
+
+    def test_assign_points(self):
+        # a rotated box, an axis aligned box and a small box inside it
+        box_array = BoxArray([[[50, 0], [100, 50], [50, 100], [0, 50]],
+                              [[200, 0], [300, 0], [300, 100], [200, 100]],
+                              [[210, 10], [230, 10], [230, 30], [210, 30]]])
+
+        points = [[50, 50], [5, 5], [250, 50], [220, 20], [310, 50], [400, 400], [100, 50]]
+
+        self.assertListEqual(box_array.assign_points(points).tolist(), [0, -1, 1, 2, -1, -1, 0])
+        self.assertListEqual(box_array.assign_points(points, max_distance=30).tolist(), [0, 0, 1, 2, 1, -1, 0])
+
+        self.assertListEqual(box_array.distance([[310, 50], [5, 5]], [1, 0]).round(2).tolist(), [10, 28.28])
+
+        box = box_array[0]
+        self.assertTrue(box.contains_point(Point(50, 50)))
+        self.assertFalse(box.contains_point(Point(5, 5)))
+
+        # same result as the brute force test of every point against every box
+        rng = np.random.default_rng(0)
+        points = rng.uniform(-10, 310, (500, 2))
+        expected = [[box_array.contains([point], [i])[0] for i in range(3)] for point in points]
+        result = box_array.assign_points(points)
+        for inside, box_id in zip(expected, result):
+            self.assertEqual(box_id >= 0, any(inside))
+
+    def test_assign_points_overlapping(self):
+        # nested squares around (100, 100) in shuffled order, every point inside goes to the smallest
+        sizes = np.random.default_rng(1).permutation(np.arange(5, 100, 5))
+        box_array = BoxArray([[[100 - s, 100 - s], [100 + s, 100 - s], [100 + s, 100 + s], [100 - s, 100 + s]]
+                              for s in sizes])
+
+        points = [[100 + d, 100] for d in range(0, 96, 3)]
+        expected = [int(np.argmin(np.where(sizes >= d, sizes, 1000))) for d in range(0, 96, 3)]
+        self.assertListEqual(box_array.assign_points(points).tolist(), expected)
+
+        # outside every square the nearest one is chosen, equal distances go to the lower index
+        outside = BoxArray([[[0, 0], [10, 0], [10, 10], [0, 10]], [[30, 0], [40, 0], [40, 10], [30, 10]],
+                            [[12, 0], [28, 0], [28, 10], [12, 10]]] * 2)
+        self.assertListEqual(outside.assign_points([[20, 20], [20, -5], [11, 5]], max_distance=20).tolist(),
+                             [2, 2, 0])
+
+
+    def test_pickle_slice(self):
+        # a page sharing the text buffer of 50 pages, like BoxStore.page
+        texts = EncodedTexts.encode(['word {}'.format(i) for i in range(5000)])
+        coordinates = np.tile([[[0, 0], [2, 0], [2, 2], [0, 2]]], (100, 1, 1))
+        page = BoxArray(coordinates, EncodedTexts(texts.buffer, texts.offsets[300:401]), sort=False)
+        alone = BoxArray(coordinates, EncodedTexts.encode(list(page.texts)), sort=False)
+
+        # only the text of the page is pickled, whatever the protocol
+        for data in [pickle.dumps(page, protocol=4), bytes(ForkingPickler.dumps(page))]:
+            self.assertEqual(len(data), len(pickle.dumps(alone, protocol=4)))
+            self.assertListEqual(list(pickle.loads(data).texts), ['word {}'.format(i) for i in range(300, 400)])
+
+        # texts given as a list stay a list
+        self.assertListEqual(pickle.loads(pickle.dumps(BoxArray(coordinates[:1], ['a']), protocol=2)).texts, ['a'])
+
+    def test_trusted_boxes(self):
+        coordinates = [[[4, 2], [8, 6], [6, 8], [2, 4]], [[0, 0], [5, 0], [5, 3], [0, 3]]]
+        box_array = BoxArray(coordinates, ['a', 'b'])
+
+        # boxes of a box array are already sorted, the trusted path gives the same boxes
+        for box, sorted_box in zip(box_array.to_boxes(), BoundBox.boxes_from_array(coordinates, ['a', 'b'])):
+            self.assertListEqual(box.np_array.tolist(), sorted_box.np_array.tolist())
+            self.assertEqual(box.text_value, sorted_box.text_value)
+
+        box = BoundBox.trusted_box(Point(0, 0), Point(5, 0), Point(5, 3), Point(0, 3), 'c')
+        self.assertListEqual(box.np_array.tolist(), [[0, 0], [5, 0], [5, 3], [0, 3]])
+        self.assertEqual(box.text_value, 'c')
+
+    def test_validate_quads(self):
+        coordinates = [[[0, 0], [10, 0], [10, 10], [0, 10]],      # valid
+                       [[0, 0], [20, 0], [0, 10], [10, 14]],      # bow tie
+                       [[0, 0], [10, 0], [3, 3], [0, 10]],        # dart
+                       [[0, 0], [10, 0], [20, 0], [30, 0]],       # flat
+                       [[-5, 0], [10, 0], [10, 10], [0, 10]],     # outside
+                       [[0, 0], [5, 0], [10, 0], [10, 10]]]       # straight corner, still convex
+
+        flags = BoxArray.validate_quads(coordinates, width=100, height=100)
+
+        self.assertListEqual(flags['self_intersecting'].tolist(), [False, True, False, False, False, False])
+        self.assertListEqual(flags['non_convex'].tolist(), [False, False, True, False, False, False])
+        self.assertListEqual(flags['zero_area'].tolist(), [False, False, False, True, False, False])
+        self.assertListEqual(flags['out_of_bounds'].tolist(), [False, False, False, False, True, False])
+        self.assertListEqual(flags['invalid'].tolist(), [False, True, True, True, True, False])
+
+        self.assertFalse(BoxArray.validate_quads(coordinates)['out_of_bounds'].any())
+        self.assertEqual(len(BoxArray.validate_quads(np.zeros((0, 8)))['invalid']), 0)
+
+if __name__ == '__main__':
+    unittest.main()
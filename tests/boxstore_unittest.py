@@ -0,0 +1,85 @@
+import unittest
+import os
+import pickle
+import shutil
+import tempfile
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoxArray_class import BoxArray
+from boundbox.BoxStore_class import BoxStore
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.test_files = tempfile.mkdtemp()
+        self.store_path = os.path.join(self.test_files, 'store')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_files)
+
+    def test_append_and_load(self):
+        page_1 = BoxArray([[[0, 0], [2, 0], [2, 2], [0, 2]], [[2, 0], [6, 0], [6, 3], [2, 3]]],
+                          ['hello', 'wörld'], {'confidence': [0.5, 0.9]})
+        page_2 = BoxArray([[[10, 10], [20, 10], [20, 20], [10, 20]]], ['again'], {'confidence': [0.7]})
+
+        store = BoxStore(self.store_path, columns={'confidence': 'float32'})
+        self.assertEqual(store.append(page_1), 0)
+        self.assertEqual(store.append(page_2), 1)
+
+        # reopen the store from disk
+        store = BoxStore(self.store_path)
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.page_count, 2)
+
+        boxes = store.boxes
+        # coordinates are a view of the memory mapped file, not a copy
+        self.assertFalse(boxes.np_array.flags.owndata)
+        self.assertListEqual(list(boxes.texts), ['hello', 'wörld', 'again'])
+        self.assertListEqual(boxes.np_array[2].tolist(), [[10, 10], [20, 10], [20, 20], [10, 20]])
+
+        page = store.page(1)
+        self.assertEqual(len(page), 1)
+        self.assertEqual(page[0].text_value, 'again')
+        self.assertAlmostEqual(float(page.columns['confidence'][0]), 0.7, places=5)
+
+        # appending a page read from the store itself
+        store.append(store.page(0))
+        self.assertListEqual(list(store.page(2).texts), ['hello', 'wörld'])
+
+    def test_pickle_page(self):
+        store = BoxStore(self.store_path, columns={'confidence': 'float32'})
+        for i in range(5):
+            store.append(BoxArray(np.tile([[[0, 0], [2, 0], [2, 2], [0, 2]]], (10, 1, 1)),
+                                  ['page{}-{}'.format(i, j) for j in range(10)], {'confidence': np.ones(10)}))
+
+        buffers = []
+        data = pickle.dumps(store.page(3), protocol=5, buffer_callback=buffers.append)
+
+        # only the coordinates, text and columns of the page are sent, not the whole store
+        text_bytes = len(''.join('page3-{}'.format(j) for j in range(10)))
+        sizes = [buffer.raw().nbytes for buffer in buffers]
+        self.assertListEqual(sizes, [10 * 4 * 2 * 4, text_bytes, 11 * 8, 10 * 4])
+
+        page = pickle.loads(data, buffers=buffers)
+        self.assertEqual(page[0].text_value, 'page3-0')
+        self.assertListEqual(list(page.texts), ['page3-{}'.format(j) for j in range(10)])
+
+    def test_column_mismatch(self):
+        store = BoxStore(self.store_path, columns={'confidence': 'float32'})
+        with self.assertRaises(ValueError):
+            store.append(BoxArray([[[0, 0], [2, 0], [2, 2], [0, 2]]], ['hello']))
+
+    def test_empty_store(self):
+        store = BoxStore(self.store_path)
+        self.assertEqual(len(store.boxes), 0)
+        store.append(BoxArray(np.zeros((0, 4, 2))))
+        self.assertEqual(len(store.page(0)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray
+from boundbox.BoxTracker_class import BoxTracker
+
+
+def _frame(rectangles, texts=None):
+    # rectangles as x, y, width, height
+    return BoxArray.from_bounds([(x, y, x + w, y + h) for x, y, w, h in rectangles], texts)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_stable_tracks(self):
+        tracker = BoxTracker()
+
+        frame = tracker.update(_frame([(10, 10, 100, 20), (10, 50, 80, 20)]))
+        self.assertListEqual(frame.columns['track'].tolist(), [0, 1])
+        self.assertTrue(frame.columns['new'].all())
+
+        tracker.set_texts(frame.columns['track'], ['hello', 'world'])
+
+        # small movement keeps the ids and texts, a new box starts a new track
+        frame = tracker.update(_frame([(12, 51, 80, 20), (11, 10, 100, 20), (300, 300, 50, 20)]))
+        self.assertListEqual(frame.columns['track'].tolist(), [1, 0, 2])
+        self.assertListEqual(frame.texts, ['world', 'hello', ''])
+        self.assertListEqual(frame.columns['new'].tolist(), [False, False, True])
+        self.assertListEqual(frame.columns['changed'].tolist(), [False, False, False])
+
+        # the box grows, it keeps its track but has to be recognized again
+        frame = tracker.update([BoundBox.box_from_array([[11, 10], [160, 10], [160, 30], [11, 30]]),
+                                BoundBox.box_from_array([[12, 51], [92, 51], [92, 71], [12, 71]])])
+        self.assertListEqual(frame.columns['track'].tolist(), [0, 1])
+        self.assertListEqual(frame.columns['changed'].tolist(), [True, False])
+
+        # the grown box is the new reference
+        frame = tracker.update(_frame([(11, 10, 150, 20), (12, 51, 80, 20)]))
+        self.assertFalse(frame.columns['changed'].any())
+
+    def test_fast_motion_and_age(self):
+        tracker = BoxTracker(max_distance=1.5, max_age=1)
+
+        tracker.update(_frame([(0, 0, 20, 20), (100, 0, 20, 20)], ['a', 'b']))
+
+        # the first box moves by more than its size without any overlap, it is still close enough
+        frame = tracker.update(_frame([(25, 0, 20, 20)]))
+        self.assertListEqual(frame.columns['track'].tolist(), [0])
+        self.assertListEqual(frame.texts, ['a'])
+        self.assertEqual(len(tracker), 2)
+
+        # unseen for more than max_age frames
+        tracker.update(_frame([(25, 0, 20, 20)]))
+        self.assertListEqual(tracker.tracks.columns['track'].tolist(), [0])
+        self.assertListEqual(tracker.tracks.columns['hits'].tolist(), [3])
+
+        frame = tracker.update(_frame([(100, 0, 20, 20)]))
+        self.assertListEqual(frame.columns['track'].tolist(), [2])
+        self.assertTrue(frame.columns['new'][0])
+
+        frame = tracker.update(_frame([]))
+        self.assertEqual(len(frame), 0)
+
+    def test_random_walk(self):
+        rng = np.random.default_rng(0)
+        rectangles = np.column_stack((rng.integers(0, 20, 50) * 60, rng.integers(0, 50, 50) * 40,
+                                      np.full(50, 50), np.full(50, 20)))
+        rectangles = np.unique(rectangles, axis=0)
+
+        tracker = BoxTracker()
+        first = tracker.update(_frame(rectangles))
+
+        for _ in range(10):
+            rectangles[:, :2] += rng.integers(-3, 4, (len(rectangles), 2))
+            order = rng.permutation(len(rectangles))
+            frame = tracker.update(_frame(rectangles[order]))
+
+            self.assertListEqual(frame.columns['track'].tolist(), first.columns['track'][order].tolist())
+            self.assertFalse(frame.columns['new'].any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoxStore_class import BoxStore
+from boundbox.Json_utils import read_document
+from boundbox.__main__ import main, read_progress
+
+samples = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_samples')
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.test_files = tempfile.mkdtemp()
+        self.inputs = os.path.join(self.test_files, 'inputs')
+        os.makedirs(self.inputs)
+
+        for i in range(3):
+            shutil.copy(os.path.join(samples, 'google_ocr', 'good_text.json'),
+                        os.path.join(self.inputs, 'page_{}.json'.format(i)))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_files)
+
+    def test_jsonl(self):
+        output = os.path.join(self.test_files, 'out.jsonl')
+        pattern = os.path.join(self.inputs, '*.json')
+
+        code = main([pattern, '--format', 'google', '--steps', 'merge,sort', '--output', output, '--workers', '2',
+                     '--quiet'])
+        self.assertEqual(code, 0)
+
+        with open(output, 'r', encoding='utf-8') as f:
+            sources = [json.loads(line)['source'] for line in f]
+        self.assertEqual(sorted(os.path.basename(source) for source in sources),
+                         ['page_0.json', 'page_1.json', 'page_2.json'])
+
+        with open(output, 'r', encoding='utf-8') as f:
+            pages = list(read_document(f))
+        self.assertTrue(all(list(page.texts) == list(pages[0].texts) for page in pages))
+
+        # existing output is not overwritten without --resume
+        with self.assertRaises(SystemExit):
+            main([pattern, '--format', 'google', '--output', output, '--quiet'])
+
+    def test_resume(self):
+        output = os.path.join(self.test_files, 'out.jsonl')
+        pattern = os.path.join(self.inputs, '*.json')
+
+        main([os.path.join(self.inputs, 'page_0.json'), '--format', 'google', '--output', output, '--quiet'])
+
+        # an interrupted run leaves a partial line behind
+        with open(output, 'ab') as f:
+            f.write(b'{"source": "broken')
+
+        main([pattern, '--format', 'google', '--output', output, '--resume', '--quiet'])
+
+        with open(output, 'r', encoding='utf-8') as f:
+            sources = sorted(os.path.basename(json.loads(line)['source']) for line in f)
+        self.assertEqual(sources, ['page_0.json', 'page_1.json', 'page_2.json'])
+
+    def test_resume_cut_progress(self):
+        output = os.path.join(self.test_files, 'out.jsonl')
+        progress = output + '.progress'
+
+        main([os.path.join(self.inputs, 'page_0.json'), '--format', 'google', '--output', output, '--quiet'])
+        with open(progress, 'ab') as f:
+            f.write(b'{"file": "cut')
+
+        main([os.path.join(self.inputs, 'page_[01].json'), '--format', 'google', '--output', output, '--resume',
+              '--quiet'])
+
+        # the record written after the cut line is readable, so a second resume keeps both files
+        finished, position, end = read_progress(progress)
+        self.assertEqual(sorted(os.path.basename(path) for path in finished), ['page_0.json', 'page_1.json'])
+        self.assertEqual(end, os.path.getsize(progress))
+
+        main([os.path.join(self.inputs, '*.json'), '--format', 'google', '--output', output, '--resume', '--quiet'])
+        with open(output, 'r', encoding='utf-8') as f:
+            sources = [os.path.basename(json.loads(line)['source']) for line in f]
+        self.assertEqual(sorted(sources), ['page_0.json', 'page_1.json', 'page_2.json'])
+
+    def test_store(self):
+        output = os.path.join(self.test_files, 'store')
+        shutil.copy(os.path.join(samples, 'labelImg', 'labelImg_xml.xml'), os.path.join(self.inputs, 'a.xml'))
+        with open(os.path.join(self.inputs, 'b.xml'), 'w') as f:
+            f.write('<annotation><object>')
+
+        code = main([os.path.join(self.inputs, '*.xml'), '--format', 'labelimg', '--output', output,
+                     '--output-format', 'store', '--workers', '1', '--quiet'])
+        self.assertEqual(code, 1)
+        self.assertEqual(BoxStore(output).page_count, 1)
+
+        # the failed file is tried again on resume, the finished one is skipped
+        code = main([os.path.join(self.inputs, '*.xml'), '--format', 'labelimg', '--output', output,
+                     '--output-format', 'store', '--resume', '--quiet'])
+        self.assertEqual(code, 1)
+        self.assertEqual(BoxStore(output).page_count, 1)
+
+        store = BoxStore(output)
+        store.append(store.page(0))
+        store.truncate(1)
+        self.assertEqual(BoxStore(output).page_count, 1)
+        self.assertEqual(len(BoxStore(output).boxes), len(store.page(0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import gc
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray
+from boundbox.CropCache_class import CropCache
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.image = np.arange(100 * 120 * 3, dtype="uint8").reshape(100, 120, 3)
+        self.boxes = BoxArray([[[10, 10], [50, 10], [50, 30], [10, 30]],
+                               [[60, 20], [110, 25], [108, 60], [58, 55]]])
+
+    def test_hit_and_miss(self):
+        cache = CropCache()
+
+        for box in self.boxes:
+            crop = box.crop_image(self.image, cache=cache)
+            warp = box.perspective_wrap(self.image, cache=cache)
+
+            self.assertTrue(np.array_equal(crop, box.crop_image(self.image)))
+            self.assertTrue(np.array_equal(warp, box.perspective_wrap(self.image)))
+            self.assertFalse(crop.flags.writeable)
+
+        crops = cache.crop_boxes(self.boxes, self.image)
+        cache.warp_boxes(self.boxes.to_boxes(), self.image)
+
+        self.assertIs(crops[0], self.boxes[0].crop_image(self.image, cache=cache))
+        self.assertEqual(cache.misses, 4)
+        self.assertEqual(cache.hits, 5)
+        self.assertEqual(cache.stats['hit_rate'], 5 / 9)
+        self.assertEqual(len(cache), 4)
+
+        # a different image with the same pixels is a different entry
+        cache.crop(self.boxes[0], self.image.copy())
+        self.assertEqual(cache.misses, 5)
+
+    def test_eviction(self):
+        box = BoundBox.box_from_array([[0, 0], [10, 0], [10, 10], [0, 10]])
+        cache = CropCache(max_bytes=2 * 10 * 10 * 3)
+
+        images = [self.image, self.image[::-1], self.image[:, ::-1]]
+        for image in images:
+            cache.crop(box, image)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 600)
+        self.assertEqual(cache.evictions, 1)
+
+        # the first image was the least recently used
+        cache.crop(box, images[0])
+        self.assertEqual(cache.misses, 4)
+
+        # regions larger than the cache are returned without being kept
+        cache.crop(BoundBox.box_from_array([[0, 0], [100, 0], [100, 90], [0, 90]]), self.image)
+        self.assertEqual(len(cache), 2)
+
+    def test_image_lifetime(self):
+        cache = CropCache()
+
+        image = self.image.copy()
+        cache.crop_boxes(self.boxes, image)
+        self.assertEqual(len(cache), 2)
+
+        del image
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+        # in place changes are only seen after invalidate
+        cache.crop(self.boxes[0], self.image)
+        self.image[:] = 0
+        self.assertTrue(cache.crop(self.boxes[0], self.image).any())
+        cache.invalidate(self.image)
+        self.assertFalse(cache.crop(self.boxes[0], self.image).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import copy
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray
+from boundbox.Document_utils import process_document, process_page, remove_duplicates, split_pages
+
+samples = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_samples')
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with open(os.path.join(samples, 'google_ocr', 'good_text.json')) as f:
+            self.google = json.load(f)
+
+        # three good pages with a malformed page in the middle
+        page = self.google['responses'][0]
+        broken = {'textAnnotations': [{'description': 'x', 'boundingPoly': {}}, {'description': 'y'}]}
+        self.document = {'responses': [copy.deepcopy(page), broken, copy.deepcopy(page), copy.deepcopy(page)]}
+
+    def test_process_document(self):
+        expected = BoundBox.merge_box(BoundBox.google_ocr_boxes(copy.deepcopy(self.google))[0])
+
+        for executor in ('inline', 'thread', 'process', ThreadPoolExecutor(2)):
+            results = process_document(copy.deepcopy(self.document), 'google', executor=executor, workers=2)
+
+            self.assertEqual([result.page for result in results], [0, 1, 2, 3])
+            self.assertIsNone(results[1].boxes)
+            self.assertIn('KeyError', results[1].error)
+
+            for result in (results[0], results[2], results[3]):
+                self.assertIsNone(result.error)
+                self.assertEqual([box.text_value for box in result.boxes], [box.text_value for box in expected])
+
+        with self.assertRaises(ValueError):
+            process_document(self.document, 'google', steps=('merge', 'shuffle'))
+        with self.assertRaises(ValueError):
+            process_document(self.document, 'google', executor='gpu')
+
+    def test_steps(self):
+        self.assertEqual(len(split_pages(json.dumps(self.document), 'google')), 4)
+
+        boxes = [BoundBox.create_box(100, 0, 140, 0, 140, 20, 100, 20, 'world'),
+                 BoundBox.create_box(0, 0, 80, 0, 80, 20, 0, 20, 'hello'),
+                 BoundBox.create_box(0, 0, 80, 0, 80, 21, 0, 21, 'hello'),
+                 BoundBox.create_box(0, 100, 80, 100, 80, 120, 0, 120, 'next')]
+
+        sorted_boxes = process_page(boxes, steps=('dedupe', 'sort'))
+        self.assertEqual([box.text_value for box in sorted_boxes], ['hello', 'world', 'next'])
+
+        box_array = BoxArray.from_boxes(boxes)
+        self.assertEqual(len(remove_duplicates(box_array)), 3)
+        self.assertEqual(len(remove_duplicates(box_array, min_iou=0.99)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
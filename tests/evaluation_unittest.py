@@ -0,0 +1,101 @@
+import os
+import unittest
+import itertools
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray
+from boundbox.Evaluation_utils import match_boxes, evaluate_image, evaluate_dataset, summarize, \
+    load_boxes, edit_distance, _hungarian
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_iou(self):
+        first = BoxArray.from_bounds([[0, 0, 10, 10], [100, 100, 110, 110], [500, 500, 510, 510]])
+        second = BoxArray.from_bounds([[5, 0, 15, 10], [100, 100, 110, 110]])
+
+        a, b, iou = first.iou(second)
+        self.assertEqual(a.tolist(), [0, 1])
+        self.assertEqual(b.tolist(), [0, 1])
+        self.assertAlmostEqual(iou[0], 1 / 3)
+        self.assertAlmostEqual(iou[1], 1.0)
+
+        # rotated boxes are compared as polygons
+        diamond = BoxArray([[[10, 0], [20, 10], [10, 20], [0, 10]]])
+        self.assertFalse(diamond.is_axis_aligned[0])
+        _, _, iou = diamond.iou(BoxArray.from_bounds([[0, 0, 20, 20]]))
+        self.assertAlmostEqual(iou[0], 0.5, places=2)
+
+    def test_match_boxes(self):
+        ground_truth = BoxArray.from_bounds([[0, 0, 100, 10], [100, 0, 200, 10]])
+        predictions = BoxArray.from_bounds([[0, 0, 150, 10], [0, 0, 60, 10]])
+
+        # greedy takes the best pair first and leaves the second prediction without a match
+        prediction_ids, truth_ids, iou = match_boxes(predictions, ground_truth, 0.2, 'greedy')
+        self.assertEqual(list(zip(prediction_ids, truth_ids)), [(0, 0)])
+        self.assertAlmostEqual(iou[0], 2 / 3)
+
+        prediction_ids, truth_ids, iou = match_boxes(predictions, ground_truth, 0.2, 'optimal')
+        self.assertEqual(sorted(zip(prediction_ids.tolist(), truth_ids.tolist())), [(0, 1), (1, 0)])
+        self.assertAlmostEqual(iou.sum(), 0.85)
+
+        with self.assertRaises(ValueError):
+            match_boxes(predictions, ground_truth, method='best')
+
+    def test_hungarian(self):
+        random = np.random.RandomState(3)
+        for rows, columns in ((3, 3), (3, 5), (4, 6)):
+            cost = -random.rand(rows, columns)
+            row_index, column_index = _hungarian(cost)
+
+            best = min(cost[range(rows), list(p)].sum() for p in itertools.permutations(range(columns), rows))
+            self.assertEqual(row_index.tolist(), list(range(rows)))
+            self.assertAlmostEqual(cost[row_index, column_index].sum(), best)
+
+    def test_evaluate_image(self):
+        ground_truth = BoxArray.from_bounds([[0, 0, 50, 20], [60, 0, 120, 20], [0, 40, 50, 60]],
+                                            ['Total', 'Tax', 'Amount'])
+        predictions = BoxArray.from_bounds([[1, 1, 50, 20], [60, 0, 118, 21], [300, 300, 320, 320]],
+                                           ['total', 'Tax', 'x'])
+
+        result = evaluate_image(predictions, ground_truth)
+        self.assertEqual(result['true_positives'], 2)
+        self.assertEqual(result['false_positives'], 1)
+        self.assertEqual(result['false_negatives'], 1)
+        self.assertAlmostEqual(result['f1'], 2 / 3)
+        self.assertEqual(result['text_exact'], 1)
+        self.assertEqual(result['character_errors'], 1)
+
+        result = evaluate_image(predictions, ground_truth, case_sensitive=False)
+        self.assertEqual(result['text_accuracy'], 1.0)
+
+        self.assertEqual(edit_distance('kitten', 'sitting'), 3)
+
+    def test_evaluate_dataset(self):
+        xml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'test_samples', 'labelImg', 'labelImg_xml.xml')
+        truth = load_boxes(xml_path)
+        boxes = BoundBox.labelimg_xml_boxes(xml_path)
+
+        items = [('same', boxes, xml_path), ('missing', 'no_such_file.xml', xml_path),
+                 ('empty', [], truth)]
+        results = list(evaluate_dataset(items, processes=2, chunksize=1))
+
+        self.assertEqual([result['name'] for result in results], ['same', 'missing', 'empty'])
+        self.assertEqual(results[0]['f1'], 1.0)
+        self.assertIn('error', results[1])
+        self.assertEqual(results[2]['false_negatives'], len(truth))
+
+        totals = summarize(results)
+        self.assertEqual(totals['images'], 3)
+        self.assertEqual(totals['errors'], 1)
+        self.assertEqual(totals['recall'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoxArray_class import BoxArray
+from boundbox.Fusion_utils import fuse, fuse_pages
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_fuse(self):
+        google = BoxArray.from_bounds([[10, 10, 60, 30], [100, 10, 160, 30]], ['Total', '12.50'])
+        azure = BoxArray.from_bounds([[12, 10, 62, 30], [100, 12, 160, 32]], ['Total', '12.5O'])
+        tesseract = BoxArray.from_bounds([[10, 12, 58, 30], [100, 10, 162, 30], [400, 400, 410, 410]],
+                               ['Tota1', '12.50', '~'])
+
+        fused = fuse([google, azure, tesseract])
+        self.assertEqual(len(fused), 3)
+
+        order = np.argsort(fused.bounds[:, 0])
+        self.assertEqual([fused.texts[i] for i in order], ['Total', '12.50', '~'])
+        self.assertEqual(fused.columns['engines'][order].tolist(), [3, 3, 1])
+        self.assertAlmostEqual(fused.columns['agreement'][order[0]], 2 / 3)
+        self.assertEqual(fused.bounds[order[0]].tolist(), [11, 11, 60, 30])
+
+        # noise found by a single engine is dropped
+        fused = fuse([google, azure, tesseract], min_engines=2)
+        self.assertEqual(len(fused), 2)
+
+        # a heavier engine moves the box towards its own
+        fused = fuse([google, azure], weights=[3, 1])
+        order = np.argsort(fused.bounds[:, 0])
+        self.assertEqual(fused.bounds[order[0]].tolist(), [10, 10, 60, 30])
+
+    def test_fuse_confidence(self):
+        first = BoxArray.from_bounds([[0, 0, 100, 20]], ['hello'], {'confidence': [0.4]})
+        second = BoxArray.from_bounds([[0, 0, 100, 20]], ['he1lo'], {'confidence': [0.9]})
+
+        self.assertEqual(fuse([first, second], text_mode='confidence').texts, ['he1lo'])
+        self.assertEqual(fuse([first, second], weights=[3, 1], text_mode='confidence').texts, ['hello'])
+
+    def test_fuse_split_words(self):
+        # one engine reads two words where the other reads a single box
+        words = BoxArray.from_bounds([[0, 0, 40, 20], [50, 0, 100, 20]], ['New', 'York'])
+        line = BoxArray.from_bounds([[0, 0, 100, 20]], ['New York'])
+
+        fused = fuse([words, line])
+        self.assertEqual(len(fused), 1)
+        self.assertEqual(fused.texts[0], 'New York')
+        self.assertEqual(fused.bounds[0].tolist(), [0, 0, 100, 20])
+
+    def test_fuse_rotated(self):
+        line = BoxArray([[[100, 100], [300, 140], [292, 180], [92, 140]]], ['rotated text'])
+
+        fused = fuse([line])
+        self.assertListEqual(fused.np_array.tolist(), line.np_array.tolist())
+        self.assertIs(type(fused.texts[0]), str)
+
+        # the two words of one engine are merged into a rotated box, not into their extent
+        words = BoxArray([[[100, 100], [190, 118], [182, 158], [92, 140]],
+                          [[210, 122], [300, 140], [292, 180], [202, 162]]], ['rotated', 'text'])
+        fused = fuse([words, line])
+        self.assertEqual(fused.texts, ['rotated text'])
+        self.assertLess(np.abs(fused.np_array - line.np_array).max(), 3)
+
+    def test_fuse_pages(self):
+        page = BoxArray.from_bounds([[0, 0, 10, 10]], ['a'])
+        pages = fuse_pages([[page, page], [page, BoxArray(np.zeros((0, 4, 2)))]])
+
+        self.assertEqual([len(fused) for fused in pages], [1, 1])
+        self.assertEqual(len(fuse([[], []])), 0)
+
+        with self.assertRaises(ValueError):
+            fuse([page], text_mode='longest')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import io
+import os
+import json
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray
+from boundbox.Json_utils import box_to_json, box_from_json, page_to_json, page_from_json, \
+    write_document, read_document
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_box(self):
+        box = BoundBox.box_from_array([[113, 96], [429, 48], [430, 423], [129, 415]])
+        box.text_value = 'héllo "world"'
+
+        value = box_to_json(box)
+        self.assertDictEqual(json.loads(value), {'box': [113, 96, 429, 48, 430, 423, 129, 415],
+                                                 'text': 'héllo "world"'})
+
+        decoded = box_from_json(value)
+        self.assertListEqual(decoded.np_array.tolist(), box.np_array.tolist())
+        self.assertEqual(decoded.text_value, box.text_value)
+
+    def test_page(self):
+        box_array = BoxArray([[[0, 0], [2, 0], [2, 2], [0, 2]], [[2, 0], [6, 0], [6, 3], [2, 3]]],
+                             ['hello', 'world'], {'confidence': [0.5, 0.9]})
+
+        value = page_to_json(box_array, page_number=3)
+        self.assertEqual(json.loads(value)['page'], 3)
+
+        # list of boxes and box array give the same boxes
+        self.assertEqual(json.loads(page_to_json(box_array.to_boxes()))['boxes'],
+                         json.loads(value)['boxes'])
+
+        decoded = page_from_json(value)
+        self.assertListEqual(decoded.np_array.tolist(), box_array.np_array.tolist())
+        self.assertListEqual(decoded.texts, ['hello', 'world'])
+        self.assertListEqual(decoded.columns['confidence'].tolist(), [0.5, 0.9])
+
+    def test_document(self):
+        google_ocr_good_file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            'test_samples', 'google_ocr', 'good_text.json')
+
+        with open(google_ocr_good_file, 'rb') as sample_reponse:
+            pages = BoundBox.google_ocr_boxes(json.load(sample_reponse))
+
+        f = io.StringIO()
+        self.assertEqual(write_document(pages, f), len(pages))
+
+        f.seek(0)
+        decoded = list(read_document(f))
+
+        self.assertEqual(len(decoded), len(pages))
+        self.assertListEqual(decoded[0].texts, [box.text_value for box in pages[0]])
+        self.assertListEqual(decoded[0].np_array.tolist(), [box.np_array.tolist() for box in pages[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
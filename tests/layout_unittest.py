@@ -0,0 +1,90 @@
+import unittest
+from math import radians
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoxArray_class import BoxArray
+from boundbox.BoundBox_utils import connected_components
+from boundbox.Layout_utils import layout, dominant_angle, reading_order, deskew
+
+
+def two_column_page(angle=0.0):
+    """
+    two columns with two paragraphs of three lines each, every line has three words
+    """
+
+    boxes = []
+    texts = []
+    for column in range(2):
+        for line in range(6):
+            x = 50 + column * 400
+            y = 50 + line * 30 + (line // 3) * 60
+            for word in range(3):
+                boxes.append([[x, y], [x + 60, y], [x + 60, y + 20], [x, y + 20]])
+                texts.append('c{}l{}w{}'.format(column, line, word))
+                x += 70
+
+    coordinates = np.array(boxes, dtype="float64")
+    center = coordinates.reshape(-1, 2).mean(axis=0)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    coordinates = (coordinates - center).dot(rotation.T) + center
+
+    return BoxArray(np.around(coordinates), texts)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def check_layout(self, box_array):
+        line_ids, block_ids = layout(box_array)
+
+        self.assertEqual(line_ids.max() + 1, 12)
+        self.assertEqual(block_ids.max() + 1, 4)
+
+        texts = np.array(box_array.texts)
+        for line in range(12):
+            # all words of a line come from the same line of the same column
+            self.assertEqual(len(set(text[:4] for text in texts[line_ids == line])), 1)
+            self.assertEqual(len(texts[line_ids == line]), 3)
+
+        # lines of a block come from the same paragraph
+        line_of_block = {}
+        for text, line in zip(texts, line_ids):
+            paragraph = (text[1], int(text[3]) // 3)
+            line_of_block.setdefault(block_ids[line], set()).add(paragraph)
+        self.assertTrue(all(len(paragraphs) == 1 for paragraphs in line_of_block.values()))
+
+    def test_layout(self):
+        self.check_layout(two_column_page())
+
+    def test_rotated_layout(self):
+        box_array = two_column_page(radians(12))
+        self.assertAlmostEqual(dominant_angle(box_array), radians(12), places=2)
+        self.check_layout(box_array)
+
+    def test_deskew(self):
+        box_array = two_column_page(radians(12))
+        straight = deskew(box_array)
+
+        self.assertAlmostEqual(dominant_angle(straight), 0, places=2)
+        self.assertEqual(list(straight.texts), list(box_array.texts))
+
+    def test_reading_order(self):
+        box_array = two_column_page()
+        shuffled = box_array[np.random.default_rng(0).permutation(len(box_array))]
+
+        order = reading_order(shuffled)
+
+        # the first column is read completely before the second
+        self.assertListEqual([shuffled.texts[i] for i in order], box_array.texts)
+        self.assertListEqual(sorted(order.tolist()), list(range(len(box_array))))
+
+    def test_connected_components(self):
+        labels = connected_components(6, [4, 1, 2], [5, 2, 0])
+        self.assertListEqual(labels.tolist(), [0, 0, 0, 1, 2, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import os
+import json
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.LineMerger_class import StreamingLineMerger
+
+
+def receipt(lines=50, words=4):
+    boxes = []
+    for line in range(lines):
+        x = 10
+        y = 10 + line * 30
+        for word in range(words):
+            boxes.append(BoundBox.create_box(x, y, x + 40, y, x + 40, y + 20, x, y + 20,
+                                             'l{}w{}'.format(line, word)))
+            x += 50
+    return boxes
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_bounded_window(self):
+        merger = StreamingLineMerger()
+        lines = []
+        max_open = 0
+
+        for box in receipt():
+            lines += merger.push(box)
+            max_open = max(max_open, len(merger))
+
+        lines += merger.flush()
+
+        self.assertEqual(max_open, 2)
+        self.assertEqual(len(lines), 50)
+        self.assertEqual(lines[3].text_value, 'l3w0 l3w1 l3w2 l3w3')
+        self.assertListEqual(lines[3].np_array.tolist(), [[10, 100], [200, 100], [200, 120], [10, 120]])
+
+    def test_same_as_merge_box(self):
+        google_ocr_good_file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            'test_samples', 'google_ocr', 'good_text.json')
+
+        with open(google_ocr_good_file, 'rb') as sample_reponse:
+            box_list = BoundBox.google_ocr_boxes(json.load(sample_reponse))[0]
+
+        expected = [box.text_value for box in BoundBox.merge_box(list(box_list))]
+        streamed = [box.text_value for box in StreamingLineMerger().merge(box_list)]
+
+        self.assertListEqual(streamed, expected)
+
+    def test_late_box_on_the_left(self):
+        boxes = receipt(lines=1, words=3)
+        boxes = [boxes[1], boxes[2], boxes[0]]
+
+        lines = list(StreamingLineMerger().merge(boxes))
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0].text_value, 'l0w0 l0w1 l0w2')
+
+
+if __name__ == '__main__':
+    unittest.main()
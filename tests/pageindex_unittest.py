@@ -0,0 +1,88 @@
+import unittest
+import time
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoxArray_class import BoxArray
+from boundbox.GridIndex_class import GridIndex
+from boundbox.PageIndex_class import PageIndex, NUMBER_PATTERN, normalize_tokens
+
+
+def invoice():
+    words = [((10, 10), 'INVOICE'), ((10, 60), 'Date:'), ((80, 60), '12/03/2021'),
+             ((10, 100), 'Subtotal'), ((300, 100), '1,200.00'),
+             ((10, 140), 'Tax'), ((120, 140), 'rate'), ((300, 140), '$96.50'),
+             ((10, 180), 'Total:'), ((300, 180), '1,296.50'), ((10, 220), 'Totally'),
+             ((10, 260), 'Amount'), ((10, 290), '77')]
+
+    boxes = [[[x, y], [x + 80, y], [x + 80, y + 20], [x, y + 20]] for (x, y), _ in words]
+    return BoxArray(boxes, [text for _, text in words])
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_normalize(self):
+        self.assertListEqual(normalize_tokens('Total: -$12.50,'), ['total', '-$12.50'])
+
+    def test_text_queries(self):
+        index = PageIndex(invoice())
+
+        self.assertListEqual(index.find('TOTAL').tolist(), [8])
+        self.assertListEqual(index.find_prefix('tot').tolist(), [8, 10])
+        self.assertListEqual(index.find_regex(NUMBER_PATTERN).tolist(), [4, 7, 9, 12])
+        self.assertEqual(len(index.find('missing')), 0)
+
+    def test_key_value(self):
+        box_array = invoice()
+        index = PageIndex(box_array)
+
+        values = index.find_values('total', pattern=NUMBER_PATTERN)
+        self.assertListEqual(values, [(8, 9)])
+
+        # nearest box on the right is 'rate' but the nearest number is the amount
+        tax = int(index.find('tax')[0])
+        self.assertEqual(index.nearest(tax), 5 + 1)
+        self.assertEqual(index.nearest(tax, candidates=index.find_regex(NUMBER_PATTERN)), 7)
+
+        self.assertListEqual(index.find_values('amount', direction='below', pattern=NUMBER_PATTERN), [(11, 12)])
+        self.assertListEqual(index.find_values('total', pattern=NUMBER_PATTERN, max_distance=50), [])
+        self.assertListEqual(index.within(0, 50, 100, 90).tolist(), [1, 2])
+
+    def test_grid_index(self):
+        rng = np.random.default_rng(1)
+        corner = rng.uniform(0, 2000, (3000, 2))
+        bounds = np.concatenate((corner, corner + rng.uniform(5, 60, (3000, 2))), axis=1)
+        queries = np.concatenate((corner[:200] - 10, corner[:200] + 80), axis=1)
+
+        query, box = GridIndex(bounds).query_many(queries)
+
+        overlap = (bounds[None, :, 0] <= queries[:, None, 2]) & (bounds[None, :, 2] >= queries[:, None, 0]) & \
+                  (bounds[None, :, 1] <= queries[:, None, 3]) & (bounds[None, :, 3] >= queries[:, None, 1])
+        expected_query, expected_box = np.nonzero(overlap)
+
+        self.assertListEqual(query.tolist(), expected_query.tolist())
+        self.assertListEqual(box.tolist(), expected_box.tolist())
+
+    def test_query_speed(self):
+        # 10k word page, 100 words on each of 100 lines
+        x, y = np.meshgrid(np.arange(100) * 60, np.arange(100) * 30)
+        x, y = x.ravel(), y.ravel()
+        boxes = np.stack((x, y, x + 50, y, x + 50, y + 20, x, y + 20), axis=1)
+        texts = ['{}'.format(i) if i % 10 else 'key{}'.format(i) for i in range(len(x))]
+
+        index = PageIndex(BoxArray(boxes, texts))
+
+        start = time.perf_counter()
+        for i in range(100):
+            result = index.find_values('key{}'.format(i * 10), pattern=NUMBER_PATTERN)
+        elapsed = (time.perf_counter() - start) / 100
+
+        self.assertListEqual(result, [(990, 991)])
+        self.assertLess(elapsed, 0.005)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.ParseCache_class import ParseCache
+from boundbox.BoundBox_utils import tesseract_tsv_to_dict
+
+samples = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_samples')
+
+tesseract_tsv = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext\n" \
+                "1\t1\t0\t0\t0\t0\t0\t0\t600\t400\t-1\t\n" \
+                "5\t1\t1\t1\t1\t1\t77\t30\t343\t64\t91.5\tNoisyimage\n"
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.test_files = tempfile.mkdtemp()
+
+        with open(os.path.join(samples, 'google_ocr', 'good_text.json'), 'rb') as f:
+            self.google_response = f.read()
+
+        with open(os.path.join(samples, 'azure_ocr', 'good_text.json'), 'rb') as f:
+            self.azure_response = f.read()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_files)
+
+    def test_hit_and_miss(self):
+        cache = ParseCache(self.test_files)
+
+        pages = cache.parse(self.google_response, 'google')
+        cached_pages = cache.parse(self.google_response, 'google')
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(' '.join(cached_pages[0].texts), 'WAITING? PLEASE TURN OFF YOUR ENGINE')
+        self.assertListEqual(cached_pages[0].np_array.tolist(), pages[0].np_array.tolist())
+
+        # parser options are part of the key
+        words = cache.parse(self.azure_response, 'azure')
+        lines = cache.parse(self.azure_response, 'azure', merge_line=True)
+        self.assertEqual(cache.misses, 3)
+        self.assertGreater(len(words[0]), len(lines[0]))
+
+        # entries of an earlier run are used by a new cache object
+        cache = ParseCache(self.test_files)
+        cache.parse(self.azure_response, 'azure', merge_line=True)
+        self.assertEqual(cache.stats['hits'], 1)
+        self.assertEqual(cache.stats['entries'], 3)
+
+    def test_eviction(self):
+        cache = ParseCache(self.test_files)
+        cache.parse(self.google_response, 'google')
+        entry_size = cache.size
+
+        cache = ParseCache(self.test_files, max_bytes=entry_size * 2)
+        cache.parse(self.azure_response, 'azure')
+
+        # using the google entry makes the azure entry the least recently used
+        cache.parse(self.google_response, 'google')
+        cache.parse(self.azure_response, 'azure', merge_line=True)
+
+        self.assertEqual(cache.evictions, 1)
+        self.assertIn(cache.key(self.google_response, 'google'), cache)
+        self.assertNotIn(cache.key(self.azure_response, 'azure'), cache)
+        self.assertLessEqual(cache.size, entry_size * 2)
+
+    def test_tesseract_tsv(self):
+        data = tesseract_tsv_to_dict(tesseract_tsv)
+        self.assertListEqual(data['text'], ['', 'Noisyimage'])
+        self.assertListEqual(data['left'], [0, 77])
+
+        cache = ParseCache(self.test_files)
+        pages = cache.parse(tesseract_tsv, 'tesseract-tsv')
+        self.assertListEqual(pages[0][1].np_array.tolist(), [[77, 30], [420, 30], [420, 94], [77, 94]])
+
+
+if __name__ == '__main__':
+    unittest.main()
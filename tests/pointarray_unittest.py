@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.Point_class import Point
+from boundbox.Line_class import Line
+from boundbox.PointArray_class import PointArray
+from boundbox.LineArray_class import LineArray
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_distance(self):
+        points_1 = PointArray([[3, 5], [0, 0]])
+        points_2 = PointArray.from_points([Point(7, 8), Point(6, 8)])
+
+        self.assertListEqual((points_1 - points_2).tolist(), [5, 10])
+        self.assertListEqual((points_1 - Point(3, 5)).tolist(), [0, np.hypot(3, 5)])
+        self.assertListEqual(points_1.pairwise_distance(points_2).tolist(), [[5, np.hypot(3, 3)], [np.hypot(7, 8), 10]])
+
+        self.assertEqual(points_1[0].x, 3)
+        self.assertEqual(len(points_1[1:]), 1)
+
+    def test_intersection(self):
+        lines = [Line(Point(0, 0), Point(10, 10)), Line(Point(0, 5), Point(10, 5)), Line(Point(2, 7), Point(12, 3))]
+        others = [Line(Point(0, 10), Point(10, 0)), Line(Point(0, 7), Point(10, 7)), Line(Point(1, 0), Point(4, 9))]
+
+        intersections, parallel = LineArray.from_lines(lines) * LineArray.from_lines(others)
+
+        self.assertListEqual(parallel.tolist(), [False, True, False])
+        self.assertTrue(np.isnan(intersections.np_array[1]).all())
+
+        for i in (0, 2):
+            expected = lines[i] * others[i]
+            self.assertEqual(round(intersections.x[i]), expected.x)
+            self.assertEqual(round(intersections.y[i]), expected.y)
+
+    def test_length_angle(self):
+        lines = LineArray([[0, 0], [1, 1]], [[3, 4], [1, 5]])
+
+        self.assertListEqual(lines.length.tolist(), [5, 4])
+        self.assertAlmostEqual(lines.angle[1], np.pi / 2)
+        self.assertEqual(lines[0].np_array.tolist(), [[0, 0], [3, 4]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import unittest
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray
+from boundbox import Profiling_utils
+from boundbox.Profiling_utils import profile, snapshot, reset, is_enabled
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.boxes = [BoundBox.create_box(x, 0, x + 40, 0, x + 40, 20, x, 20, 'w{}'.format(x))
+                      for x in range(0, 300, 50)]
+
+    def test_profile(self):
+        original_merge = BoundBox.__dict__['merge_box']
+        original_init = BoxArray.__init__
+
+        calls = []
+        with profile(sink=lambda name, seconds: calls.append(name)) as stats:
+            self.assertTrue(is_enabled())
+            lines = BoundBox.merge_box(list(self.boxes))
+            BoxArray.from_boxes(lines)
+
+        self.assertEqual(len(lines), 1)
+        result = stats()
+        self.assertEqual(result['BoundBox.merge_box']['calls'], 1)
+        self.assertEqual(result['BoundBox.compare_box_horizontally']['calls'], 5)
+        self.assertEqual(result['BoundBox.horizontal_merge']['calls'], 5)
+        self.assertEqual(result['BoxArray.from_boxes']['calls'], 1)
+        self.assertGreater(result['BoundBox.merge_box']['seconds'], 0)
+        self.assertEqual(calls.count('BoundBox.horizontal_merge'), 5)
+
+        # the original functions are back and nothing is counted any more
+        self.assertFalse(is_enabled())
+        self.assertIs(BoundBox.__dict__['merge_box'], original_merge)
+        self.assertIs(BoxArray.__init__, original_init)
+
+        before = snapshot()
+        BoundBox.merge_box(list(self.boxes))
+        self.assertEqual(snapshot(), before)
+        self.assertEqual(stats(), result)
+
+        reset()
+        self.assertEqual(snapshot(), {})
+
+    def test_nested(self):
+        with profile() as outer:
+            BoundBox.merge_box(list(self.boxes))
+            with profile() as inner:
+                BoundBox.merge_box(list(self.boxes))
+            self.assertTrue(is_enabled())
+
+        self.assertEqual(inner()['BoundBox.merge_box']['calls'], 1)
+        self.assertEqual(outer()['BoundBox.merge_box']['calls'], 2)
+
+    def test_environment(self):
+        code = 'import boundbox; from boundbox.Profiling_utils import is_enabled; print(is_enabled())'
+        root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+        environment = dict(os.environ, **{Profiling_utils.ENVIRONMENT_VARIABLE: '1'})
+
+        output = subprocess.run([sys.executable, '-c', code], cwd=root, env=environment, capture_output=True,
+                                text=True).stdout
+        self.assertEqual(output.strip(), 'True')
+
+
+if __name__ == '__main__':
+    unittest.main()
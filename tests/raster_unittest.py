@@ -0,0 +1,92 @@
+import unittest
+
+import cv2
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray
+from boundbox.Raster_utils import coverage_count, binary_mask, label_mask, density_map
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # two overlapping axis aligned boxes and a rotated box
+        self.boxes = BoxArray([[[10, 10], [50, 10], [50, 30], [10, 30]],
+                               [[40, 20], [70, 20], [70, 40], [40, 40]],
+                               [[80, 10], [110, 25], [100, 45], [70, 30]]])
+        self.shape = (60, 120, 3)
+
+    def test_axis_aligned_pixels(self):
+        box = self.boxes[0]
+        mask = binary_mask([box], self.shape)
+
+        # the same pixels as crop_image
+        self.assertEqual(int((mask == 255).sum()), 40 * 20)
+        self.assertTrue((box.crop_image(mask) == 255).all())
+
+    def test_masks(self):
+        count = coverage_count(self.boxes, self.shape)
+        labels = label_mask(self.boxes, self.shape)
+        mask = binary_mask(self.boxes, self.shape, value=1)
+
+        # pixel centers inside each quad, labels of rotated boxes are drawn by opencv and the later box
+        # is kept where they overlap
+        expected_labels = np.full(self.shape[:2], -1, dtype="int32")
+        expected_count = np.zeros(self.shape[:2], dtype="int64")
+        for i, corners in enumerate(self.boxes.np_array):
+            inside = np.array([[cv2.pointPolygonTest(corners.astype("float32"), (x + 0.5, y + 0.5), False) >= 0
+                                for x in range(self.shape[1])] for y in range(self.shape[0])])
+            if self.boxes.is_axis_aligned[i]:
+                expected_labels[inside] = i
+            else:
+                cv2.fillPoly(expected_labels, [np.around((corners - 0.5) * 16).astype("int32")], i, cv2.LINE_8, 4)
+                self.assertTrue((expected_labels[inside] == i).all())
+            expected_count += inside
+
+        self.assertTrue(np.array_equal(labels, expected_labels))
+        self.assertTrue(np.array_equal(count, expected_count))
+        self.assertTrue(np.array_equal(mask, (expected_count > 0).astype("uint8")))
+        self.assertEqual(labels[25, 45], 1)
+        self.assertEqual(label_mask(self.boxes, self.shape, background=9)[0, 0], 9)
+
+        # list of boxes and an empty page
+        self.assertTrue(np.array_equal(label_mask(self.boxes.to_boxes(), self.shape), labels))
+        self.assertFalse(binary_mask([], self.shape).any())
+
+    def test_scale(self):
+        labels = label_mask(self.boxes, self.shape, scale=0.5)
+        self.assertEqual(labels.shape, (30, 60))
+
+        # a single box drawn at twice the resolution
+        self.assertEqual(int((label_mask([self.boxes[0]], self.shape, scale=2) == 0).sum()), 80 * 40)
+        self.assertEqual(label_mask(self.boxes, self.shape, scale=2).shape, (120, 240))
+        aligned = self.boxes[:2]
+        self.assertTrue(np.array_equal(label_mask(aligned, self.shape, scale=0.5) > -1,
+                                       binary_mask(aligned, self.shape, scale=0.5) > 0))
+
+    def test_density_map(self):
+        density = density_map(self.boxes, self.shape, scale=0.1)
+
+        self.assertEqual(density.shape, (6, 12))
+        self.assertAlmostEqual(float(density.sum()) * 100, float(self.boxes.area.sum()), delta=1)
+
+        # axis aligned box 10..50 x 10..30 covers cells 1 to 4 of rows 1 and 2 completely
+        single = density_map([self.boxes[0]], self.shape, scale=0.1)
+        self.assertTrue(np.allclose(single[1:3, 1:5], 1))
+        self.assertAlmostEqual(float(single.sum()), 8)
+
+        # a box smaller than a cell still adds its area
+        small = density_map([BoundBox.box_from_array([[12, 12], [15, 12], [15, 14], [12, 14]])], self.shape, 0.1)
+        self.assertAlmostEqual(float(small[1, 1]), 0.06)
+
+        integral = density_map(self.boxes, self.shape, scale=0.1, integral=True)
+        self.assertEqual(integral.shape, (7, 13))
+        self.assertAlmostEqual(integral[3, 5], float(density[:3, :5].sum()), places=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
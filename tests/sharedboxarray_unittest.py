@@ -0,0 +1,71 @@
+import unittest
+import pickle
+import multiprocessing
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoxArray_class import BoxArray
+from boundbox.SharedBoxArray_class import SharedBoxArray
+
+
+def joined_text(shared):
+    with shared:
+        return ' '.join(shared.boxes.texts), int(shared.boxes.np_array.sum())
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.box_array = BoxArray([[[0, 0], [2, 0], [2, 2], [0, 2]], [[2, 0], [6, 0], [6, 3], [2, 3]]],
+                                  ['hello', 'wörld'], {'confidence': np.array([0.5, 0.9], dtype="float32")})
+
+    def test_pickle_out_of_band(self):
+        buffers = []
+        data = pickle.dumps(self.box_array, protocol=5, buffer_callback=buffers.append)
+
+        # coordinates, text, text offsets and the confidence column are out of band
+        self.assertEqual(len(buffers), 4)
+        self.assertLess(len(data), 200)
+
+        loaded = pickle.loads(data, buffers=buffers)
+        self.assertListEqual(loaded.np_array.tolist(), self.box_array.np_array.tolist())
+        # texts given as a list come back as a list
+        self.assertListEqual(loaded.texts, ['hello', 'wörld'])
+        self.assertListEqual(loaded.columns['confidence'].tolist(), [0.5, 0.8999999761581421])
+
+        # older protocols still work
+        loaded = pickle.loads(pickle.dumps(self.box_array, protocol=4))
+        self.assertListEqual(loaded.texts, ['hello', 'wörld'])
+
+    def test_shared_memory(self):
+        with SharedBoxArray.create(self.box_array) as shared:
+            attached = SharedBoxArray.attach(shared.handle)
+            boxes = attached.boxes
+            self.assertEqual(boxes[1].text_value, 'wörld')
+            self.assertListEqual(boxes.np_array.tolist(), self.box_array.np_array.tolist())
+            self.assertAlmostEqual(float(boxes.columns['confidence'][0]), 0.5)
+
+            with self.assertRaises(PermissionError):
+                attached.unlink()
+
+            del boxes
+            attached.close()
+
+            with multiprocessing.Pool(2) as pool:
+                results = pool.map(joined_text, [shared] * 4)
+
+            self.assertListEqual(results, [('hello wörld', 30)] * 4)
+
+        with self.assertRaises(FileNotFoundError):
+            SharedBoxArray.attach(shared.handle)
+
+    def test_empty(self):
+        with SharedBoxArray.create(BoxArray(np.zeros((0, 4, 2)))) as shared:
+            self.assertEqual(len(shared.boxes), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
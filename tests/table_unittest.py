@@ -0,0 +1,44 @@
+import unittest
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoundBox_class import BoundBox
+from boundbox.BoxArray_class import BoxArray
+from boundbox.Table_utils import table_grid
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_table_grid(self):
+        # 3 rows and 3 columns, the middle column has two words in every cell
+        boxes = []
+        texts = []
+        for row in range(3):
+            y = 100 + row * 40
+            for x, width, text in ((10, 80, 'item{}'), (150, 40, 'qty{}'), (195, 40, 'unit{}'),
+                                   (300, 60, 'price{}')):
+                boxes.append([[x, y], [x + width, y], [x + width, y + 20], [x, y + 20]])
+                texts.append(text.format(row))
+
+        # word outside the table
+        boxes.append([[10, 10], [200, 10], [200, 30], [10, 30]])
+        texts.append('INVOICE')
+
+        box_array = BoxArray(boxes, texts)
+        region = BoundBox.create_box(0, 90, 400, 90, 400, 200, 0, 200)
+
+        rows, columns, cells = table_grid(box_array, region)
+
+        self.assertListEqual(rows.tolist(), [0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, -1])
+        self.assertListEqual(columns.tolist(), [0, 1, 1, 2] * 3 + [-1])
+
+        self.assertEqual(len(cells), 9)
+        self.assertListEqual(cells.texts[:3], ['item0', 'qty0 unit0', 'price0'])
+        self.assertListEqual(cells.columns['row'].tolist(), [0, 0, 0, 1, 1, 1, 2, 2, 2])
+        self.assertListEqual(cells.columns['col'].tolist(), [0, 1, 2] * 3)
+        self.assertListEqual(cells.np_array[1].tolist(), [[150, 100], [235, 100], [235, 120], [150, 120]])
+
+
+if __name__ == '__main__':
+    unittest.main()
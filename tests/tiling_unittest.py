@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from boundbox.BoxArray_class import BoxArray
+from boundbox.Tiling_utils import tile_windows, crop_tiles, offset_boxes, seam_bands, stitch_tiles
+
+
+def read_tiles(words, windows):
+    """
+    simulated ocr of every tile, words crossing a tile edge are cut at the edge
+    """
+
+    results = []
+    for x0, y0, x1, y1 in windows:
+        bounds, texts = [], []
+        for (a, b, c, d), text in words:
+            left, right = max(a, x0), min(c, x1)
+            if right - left > 0 and b >= y0 and d <= y1:
+                bounds.append([left - x0, b - y0, right - x0, d - y0])
+                texts.append(text if (left, right) == (a, c) else text[:max((right - left) // 10, 1)])
+        results.append(BoxArray.from_bounds(bounds, texts))
+
+    return results
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_tile_windows(self):
+        windows = tile_windows(1000, 500, tile_size=400, overlap=100)
+
+        self.assertEqual(windows[:, 0].tolist(), [0, 300, 600] * 2)
+        self.assertEqual(windows[:, 1].tolist(), [0, 0, 0, 100, 100, 100])
+        self.assertEqual(windows[:, 2].max(), 1000)
+        self.assertEqual(windows[:, 3].max(), 500)
+
+        image = np.zeros((500, 1000), dtype="uint8")
+        self.assertEqual([tile.shape for tile in crop_tiles(image, windows)], [(400, 400)] * 6)
+
+        self.assertEqual(len(seam_bands(tile_windows(1000, 300, 400, 100))), 2)
+
+        with self.assertRaises(ValueError):
+            tile_windows(1000, 1000, tile_size=100, overlap=100)
+
+    def test_offset_boxes(self):
+        windows = tile_windows(700, 400, tile_size=400, overlap=100)
+        boxes = offset_boxes([BoxArray.from_bounds([[0, 0, 10, 10]]), BoxArray.from_bounds([[5, 5, 20, 20]])],
+                             windows)
+
+        self.assertEqual(boxes.bounds.tolist(), [[0, 0, 10, 10], [305, 5, 320, 20]])
+        self.assertEqual(boxes.columns['tile'].tolist(), [0, 1])
+
+    def test_stitch_tiles(self):
+        windows = tile_windows(700, 400, tile_size=400, overlap=100)
+        words = [([20, 10, 100, 30], 'alpha'),          # first tile only
+                 ([310, 50, 380, 70], 'inside'),        # inside the overlap, read by both tiles
+                 ([280, 100, 360, 120], 'crossing'),    # cut by the left edge of the second tile
+                 ([360, 150, 450, 170], 'split'),       # cut by the right edge of the first tile
+                 ([500, 10, 600, 30], 'omega')]         # second tile only
+
+        results = read_tiles(words, windows)
+
+        stitched = stitch_tiles(results, windows, mode='suppress')
+        self.assertEqual(sorted(stitched.texts), sorted(text for _, text in words))
+
+        stitched = stitch_tiles(results, windows)
+        found = {text: bounds.tolist() for text, bounds in zip(stitched.texts, stitched.bounds)}
+        self.assertEqual(found, {text: bounds for bounds, text in words})
+
+        # nothing to stitch for a single tile
+        windows = tile_windows(300, 300, tile_size=400)
+        self.assertEqual(len(stitch_tiles(read_tiles(words[:1], windows), windows)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()